@@ -10,11 +10,25 @@
 # information, or other pecuniary loss) arising out of the use of or the inability to use the sample 
 # scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
 # The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
+import argparse
 import json
 import csv
 import sys
+from itertools import chain
+from multiprocessing import Pool
+from operator import itemgetter
 from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 """
 Zerto VPG Settings JSON to CSV Converter
@@ -43,11 +57,13 @@ Key Features:
    - Easy to read and edit format
 
 Required Arguments:
-    --json_file: Path to the JSON file containing VPG settings
+    json_file: Path to the JSON file containing VPG settings
+
+Optional Arguments:
+    --processes: Number of worker processes used to extract rows from large exports
 
 Example Usage:
-    python convert_export_settings_to_csv.py \
-        --json_file "ExportedSettings_2024-05-12.json"
+    python convert_export_settings_to_csv.py "ExportedSettings_2024-05-12.json" --processes 4
 
 Output:
     - Generates a CSV file with the same base name as the input JSON
@@ -60,87 +76,74 @@ to work seamlessly with both the export and import scripts, providing a convenie
 view and edit VPG settings in spreadsheet applications.
 """
 
-def extract_nic_settings(json_data):
-    """Extract NIC settings from VPG JSON data."""
-    nic_settings = []
-    
-    for vpg in json_data:
-        vpg_name = vpg['Basic']['Name']
-        
-        for vm in vpg['Vms']:
-            vm_id = vm['VmIdentifier']
-            
-            for nic in vm['Nics']:
-                nic_id = nic['NicIdentifier']
-                
-                # Extract failover settings
-                failover = nic['Failover']['Hypervisor'] if nic['Failover'] and nic['Failover']['Hypervisor'] else {}
-                failover_network = failover.get('NetworkIdentifier', '')
-                failover_ip_config = failover.get('IpConfig', {}) or {}
-                
-                # Extract failover test settings
-                failover_test = nic['FailoverTest']['Hypervisor'] if nic['FailoverTest'] and nic['FailoverTest']['Hypervisor'] else {}
-                failover_test_network = failover_test.get('NetworkIdentifier', '')
-                failover_test_ip_config = failover_test.get('IpConfig', {}) or {}
-                
-                # Create a row for each NIC
-                row = {
-                    'VPG Name': vpg_name,
-                    'VM Identifier': vm_id,
-                    'NIC Identifier': nic_id,
-                    'Failover Network': failover_network,
-                    'Failover IP': failover_ip_config.get('StaticIp', ''),
-                    'Failover Subnet': failover_ip_config.get('SubnetMask', ''),
-                    'Failover Gateway': failover_ip_config.get('Gateway', ''),
-                    'Failover DNS1': failover_ip_config.get('PrimaryDns', ''),
-                    'Failover DNS2': failover_ip_config.get('SecondaryDns', ''),
-                    'Failover DHCP': 'Yes' if failover_ip_config.get('IsDhcp', False) else 'No',
-                    'Failover IsDhcp': failover_ip_config.get('IsDhcp', False),
-                    'Failover Test Network': failover_test_network,
-                    'Failover Test IP': failover_test_ip_config.get('StaticIp', ''),
-                    'Failover Test Subnet': failover_test_ip_config.get('SubnetMask', ''),
-                    'Failover Test Gateway': failover_test_ip_config.get('Gateway', ''),
-                    'Failover Test DNS1': failover_test_ip_config.get('PrimaryDns', ''),
-                    'Failover Test DNS2': failover_test_ip_config.get('SecondaryDns', ''),
-                    'Failover Test DHCP': 'Yes' if failover_test_ip_config.get('IsDhcp', False) else 'No',
-                    'Failover Test IsDhcp': failover_test_ip_config.get('IsDhcp', False)
-                }
-                nic_settings.append(row)
-    
-    return nic_settings
+FIELDNAMES = [
+    'VPG Name', 'VM Identifier', 'NIC Identifier',
+    'Failover Network', 'Failover IP', 'Failover Subnet', 'Failover Gateway',
+    'Failover DNS1', 'Failover DNS2', 'Failover IsDhcp',
+    'Failover Test Network', 'Failover Test IP', 'Failover Test Subnet',
+    'Failover Test Gateway', 'Failover Test DNS1', 'Failover Test DNS2',
+    'Failover Test IsDhcp'
+]
+
+_IP_FIELDS = itemgetter('StaticIp', 'SubnetMask', 'Gateway', 'PrimaryDns', 'SecondaryDns', 'IsDhcp')
+_IP_DEFAULTS = {'StaticIp': '', 'SubnetMask': '', 'Gateway': '', 'PrimaryDns': '', 'SecondaryDns': '', 'IsDhcp': False}
+
+def _side(nic_side: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Return the Failover or FailoverTest columns of a NIC as a tuple (network, IP fields, IsDhcp)."""
+    hypervisor = (nic_side or {}).get('Hypervisor') or {}
+    ip_config = {**_IP_DEFAULTS, **(hypervisor.get('IpConfig') or {})}
+    return (hypervisor.get('NetworkIdentifier', ''),) + _IP_FIELDS(ip_config)
+
+def iter_vpgs(json_file):
+    """Yield VPG settings from the JSON file one at a time when ijson is available."""
+    if ijson is not None:
+        with open(json_file, 'rb') as f:
+            yield from ijson.items(f, 'item', use_float=True)
+    elif orjson is not None:
+        with open(json_file, 'rb') as f:
+            yield from orjson.loads(f.read())
+    else:
+        with open(json_file, 'r') as f:
+            yield from json.load(f)
+
+def _rows_for_vpg(vpg: Dict[str, Any]) -> List[Tuple[Any, ...]]:
+    """Return the NIC rows of a single VPG. Module level so it can be sent to worker processes."""
+    vpg_name = vpg['Basic']['Name']
+    return [
+        (vpg_name, vm['VmIdentifier'], nic['NicIdentifier']) + _side(nic['Failover']) + _side(nic['FailoverTest'])
+        for vm in vpg['Vms']
+        for nic in vm['Nics']
+    ]
+
+def extract_nic_settings(json_data: Iterable[Dict[str, Any]]) -> Iterator[Tuple[Any, ...]]:
+    """Extract NIC settings from VPG JSON data as a lazy iterator of tuple rows, one per NIC."""
+    return chain.from_iterable(map(_rows_for_vpg, json_data))
 
 def main():
-    if len(sys.argv) != 2:
-        print("Usage: python vpg_nic_settings_to_csv.py <json_file>")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(description="Convert exported VPG settings JSON to CSV")
+    parser.add_argument("json_file", help="Path to the JSON file containing VPG settings")
+    parser.add_argument("--processes", type=int, default=1,
+                        help="Number of worker processes used to extract VPG rows (default: 1, no pool)")
+    args = parser.parse_args()
     
-    json_file = Path(sys.argv[1])
+    json_file = Path(args.json_file)
     if not json_file.exists():
         print(f"Error: File {json_file} does not exist")
         sys.exit(1)
     
-    # Read JSON file
-    with open(json_file, 'r') as f:
-        json_data = json.load(f)
-    
-    # Extract NIC settings
-    nic_settings = extract_nic_settings(json_data)
-    
-    # Create CSV file
+    # Create CSV file, buffered in 1 MiB chunks to keep write() calls few on large exports
     csv_file = json_file.with_suffix('.csv')
-    fieldnames = [
-        'VPG Name', 'VM Identifier', 'NIC Identifier',
-        'Failover Network', 'Failover IP', 'Failover Subnet', 'Failover Gateway',
-        'Failover DNS1', 'Failover DNS2', 'Failover DHCP', 'Failover IsDhcp',
-        'Failover Test Network', 'Failover Test IP', 'Failover Test Subnet',
-        'Failover Test Gateway', 'Failover Test DNS1', 'Failover Test DNS2',
-        'Failover Test DHCP', 'Failover Test IsDhcp'
-    ]
-    
-    with open(csv_file, 'w', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(nic_settings)
+    with open(csv_file, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(FIELDNAMES)
+        # Rows are produced lazily, so only one VPG is held in memory at a time
+        if args.processes > 1:
+            # imap keeps the input VPG order so the CSV is identical to a single-process run
+            with Pool(processes=args.processes) as pool:
+                for rows in pool.imap(_rows_for_vpg, iter_vpgs(json_file), chunksize=8):
+                    writer.writerows(rows)
+        else:
+            writer.writerows(extract_nic_settings(iter_vpgs(json_file)))
     
     print(f"CSV file created: {csv_file}")
 
@@ -33,6 +33,8 @@ Required Arguments:
     --client_secret: API client secret
     --csv_file: Path to CSV file with VPG settings
     --ignore_ssl: Ignore SSL certificate validation (optional)
+    --cache_ttl: Seconds to reuse the VM lists cached by a previous run, 0 disables the cache (optional, default: 0)
+    --no_cache: Always fetch the VM lists from the ZVM (optional)
 
 Example Usage:
     python create_vpgs_from_csv.py \
@@ -54,8 +56,11 @@ import sys
 import os
 import urllib3
 import json
-from typing import Dict, List
-from collections import defaultdict
+import time
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from functools import lru_cache
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 
 # Add parent directory to Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -72,6 +77,16 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# CSV columns kept for every VM row
+VM_COLUMNS = ('VPG Name', 'VM ID', 'VM Name')
+# CSV columns read by create_vpg_payload, kept for the first row of each VPG only
+VPG_COLUMNS = (
+    'VPG Type', 'RPO (seconds)', 'Test Interval (minutes)', 'Journal History (hours)', 'Priority',
+    'Use WAN Compression', 'Protected Site ID', 'Recovery Site ID', 'Journal Datastore ID',
+    'Journal Hard Limit (MB)', 'Journal Warning Threshold (MB)', 'Recovery Host Cluster ID',
+    'Recovery Datastore ID', 'Recovery Folder ID', 'Failover Network ID', 'Failover Test Network ID'
+)
+
 def setup_argparse() -> argparse.ArgumentParser:
     """Set up command line argument parsing."""
     parser = argparse.ArgumentParser(description='Create VPGs from CSV settings')
@@ -80,62 +95,92 @@ def setup_argparse() -> argparse.ArgumentParser:
     parser.add_argument('--client_secret', required=True, help='API client secret')
     parser.add_argument('--csv_file', required=True, help='Path to CSV file with VPG settings')
     parser.add_argument('--ignore_ssl', action='store_true', help='Ignore SSL certificate validation')
+    parser.add_argument('--cache_ttl', type=int, default=0,
+                        help='Seconds to reuse the VM lists cached by a previous run, 0 disables the cache (default: 0)')
+    parser.add_argument('--no_cache', action='store_true', help='Always fetch the VM lists from the ZVM')
 
     return parser
 
 def read_vpg_settings(csv_file: str) -> Dict[str, List[Dict]]:
-    """Read VPG settings from CSV file and group by VPG name."""
-    vpg_settings = defaultdict(list)
+    """
+    Read VPG settings from CSV file and group by VPG name.
+    Only the columns used later are kept: the first row of each VPG carries the VPG settings
+    read by create_vpg_payload, the following rows only the VM columns.
+    """
+    vpg_settings = {}
     
-    with open(csv_file, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            vpg_name = row['VPG Name']
-            vpg_settings[vpg_name].append(row)
+    with open(csv_file, 'r', newline='', encoding='utf-8', buffering=1 << 20) as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if not header:
+            return vpg_settings
+        width = len(header)
+        column = {name: i for i, name in enumerate(header)}
+        vpg_name_col = column['VPG Name']
+        vm_columns = [(name, column[name]) for name in VM_COLUMNS if name in column]
+        vpg_columns = vm_columns + [(name, column[name]) for name in VPG_COLUMNS if name in column]
+        for values in reader:
+            # Skip blank lines and pad short rows like csv.DictReader does
+            if not values:
+                continue
+            if len(values) < width:
+                values += [None] * (width - len(values))
+            vpg_rows = vpg_settings.setdefault(values[vpg_name_col], [])
+            columns = vm_columns if vpg_rows else vpg_columns
+            vpg_rows.append({name: values[i] for name, i in columns})
     
     return vpg_settings
 
-def create_vpg_payload(vpg_row: Dict) -> Dict:
-    """Create VPG payload from CSV row."""
+@lru_cache(maxsize=None)
+def create_vpg_settings_payload(settings: Tuple[str, ...]) -> Dict:
+    """
+    Create the VPG payload sections shared by all VPGs with the same settings.
+    settings holds the VPG_COLUMNS values of a CSV row, the returned payload must not be modified.
+    """
+    # Unpack in VPG_COLUMNS order
+    (vpg_type, rpo, test_interval, journal_history, priority, use_wan_compression,
+     protected_site_id, recovery_site_id, journal_datastore_id, journal_hard_limit, journal_warning_threshold,
+     recovery_host_cluster_id, recovery_datastore_id, recovery_folder_id,
+     failover_network_id, failover_test_network_id) = settings
+
     # Basic settings
     basic = {
-        "Name": vpg_row['VPG Name'],
-        "VpgType": vpg_row['VPG Type'],
-        "RpoInSeconds": int(vpg_row['RPO (seconds)']),
-        "TestIntervalInMinutes": int(vpg_row['Test Interval (minutes)']),
-        "JournalHistoryInHours": int(vpg_row['Journal History (hours)']),
-        "Priority": vpg_row['Priority'],
-        "UseWanCompression": vpg_row['Use WAN Compression'].lower() == 'true',
-        "ProtectedSiteIdentifier": vpg_row['Protected Site ID'],
-        "RecoverySiteIdentifier": vpg_row['Recovery Site ID']
+        "VpgType": vpg_type,
+        "RpoInSeconds": int(rpo),
+        "TestIntervalInMinutes": int(test_interval),
+        "JournalHistoryInHours": int(journal_history),
+        "Priority": priority,
+        "UseWanCompression": use_wan_compression.lower() == 'true',
+        "ProtectedSiteIdentifier": protected_site_id,
+        "RecoverySiteIdentifier": recovery_site_id
     }
 
     # Journal settings
     journal = {
-        "DatastoreIdentifier": vpg_row['Journal Datastore ID'],
+        "DatastoreIdentifier": journal_datastore_id,
         "Limitation": {
-            "HardLimitInMB": int(vpg_row['Journal Hard Limit (MB)']),
-            "WarningThresholdInMB": int(vpg_row['Journal Warning Threshold (MB)'])
+            "HardLimitInMB": int(journal_hard_limit),
+            "WarningThresholdInMB": int(journal_warning_threshold)
         }
     }
 
     # Recovery settings
     recovery = {
-        "DefaultHostClusterIdentifier": vpg_row['Recovery Host Cluster ID'],
-        "DefaultDatastoreIdentifier": vpg_row['Recovery Datastore ID'],
-        "DefaultFolderIdentifier": vpg_row['Recovery Folder ID']
+        "DefaultHostClusterIdentifier": recovery_host_cluster_id,
+        "DefaultDatastoreIdentifier": recovery_datastore_id,
+        "DefaultFolderIdentifier": recovery_folder_id
     }
 
     # Network settings
     networks = {
         "Failover": {
             "Hypervisor": {
-                "DefaultNetworkIdentifier": vpg_row['Failover Network ID']
+                "DefaultNetworkIdentifier": failover_network_id
             }
         },
         "FailoverTest": {
             "Hypervisor": {
-                "DefaultNetworkIdentifier": vpg_row['Failover Test Network ID']
+                "DefaultNetworkIdentifier": failover_test_network_id
             }
         }
     }
@@ -147,67 +192,140 @@ def create_vpg_payload(vpg_row: Dict) -> Dict:
         "networks": networks
     }
 
-def validate_vpg_and_vms(client: ZVMLClient, vpg_settings: Dict[str, List[Dict]]) -> Dict[str, List[Dict]]:
+def create_vpg_payload(vpg_row: Dict) -> Dict:
+    """Create VPG payload from CSV row."""
+    payload = create_vpg_settings_payload(tuple(vpg_row[column] for column in VPG_COLUMNS))
+    return {
+        **payload,
+        "basic": {"Name": vpg_row['VPG Name'], **payload['basic']}
+    }
+
+def vm_cache_path(zvm_address: str) -> str:
+    """Return the path of the local cache file of the VM lists of a ZVM."""
+    return os.path.join(os.path.expanduser('~'), '.cache', 'zvml', f"vms-{zvm_address.replace(':', '_')}.json")
+
+def load_vm_cache(zvm_address: str, cache_ttl: int) -> Optional[Tuple[Dict[str, Tuple[str, str]], Set[str]]]:
+    """Return the cached (existing_vms, eligible_vms) of a ZVM, or None if there is no cache younger than cache_ttl seconds."""
+    cache_file = vm_cache_path(zvm_address)
+    try:
+        if time.time() - os.path.getmtime(cache_file) > cache_ttl:
+            return None
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        logger.info(f"Using cached VM lists from {cache_file}")
+        existing_vms = {vm_id: tuple(vm) for vm_id, vm in cache['existing_vms'].items()}
+        return existing_vms, set(cache['eligible_vms'])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+def save_vm_cache(zvm_address: str, existing_vms: Dict[str, Tuple[str, str]], eligible_vms: Set[str]):
+    """Write the VM lists of a ZVM to the local cache, failures only log a warning."""
+    cache_file = vm_cache_path(zvm_address)
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        # Written aside and renamed, so a concurrent run never reads a partial file
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({'existing_vms': existing_vms, 'eligible_vms': sorted(eligible_vms)}, f)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        logger.warning(f"Failed to write VM cache {cache_file}: {e}")
+
+def invalidate_vm_cache(zvm_address: str):
+    """Delete the cached VM lists of a ZVM, failures only log a warning."""
+    cache_file = vm_cache_path(zvm_address)
+    try:
+        os.remove(cache_file)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning(f"Failed to delete VM cache {cache_file}: {e}")
+
+def fetch_site_inventory(client: ZVMLClient, cache_ttl: int = 0) -> Tuple[Set[str], Dict[str, Tuple[str, str]], Set[str]]:
+    """
+    Get existing VPGs and VMs, the independent calls run concurrently.
+    The VM lists are taken from the local cache when it is younger than cache_ttl seconds, the VPG
+    list is always fetched.
+    Returns the existing VPG names, the existing VMs as (VPG name, recovery site name) by VM identifier
+    and the identifiers of the VMs eligible for protection on the local site.
+    """
+    cached_vms = load_vm_cache(client.zvm_address, cache_ttl) if cache_ttl > 0 else None
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        vpgs_future = executor.submit(client.vpgs.list_vpgs)
+        if cached_vms is not None:
+            existing_vms, eligible_vms = cached_vms
+        else:
+            vms_future = executor.submit(client.vms.list_vms)
+            local_site_future = executor.submit(client.localsite.get_local_site)
+            local_site_id = local_site_future.result()['Link']['identifier']
+            # Only membership is tested on eligible VMs and existing VPGs, and only the VPG and
+            # recovery site names are read from existing VMs
+            eligible_vms = {vm['VmIdentifier'] for vm in client.virtualization_sites.get_virtualization_site_vms(local_site_id)}
+            existing_vms = {
+                vm['VmIdentifier']: (vm['VpgName'], vm.get('RecoverySiteName', 'N/A'))
+                for vm in vms_future.result()
+            }
+            if cache_ttl > 0:
+                save_vm_cache(client.zvm_address, existing_vms, eligible_vms)
+        existing_vpgs = {vpg['VpgName'] for vpg in vpgs_future.result()}
+    return existing_vpgs, existing_vms, eligible_vms
+
+def validate_vpg_and_vms(client: ZVMLClient, vpg_settings: Dict[str, List[Dict]], site_inventory: Future = None) -> Dict[str, List[Dict]]:
     """
     Validate VPGs and VMs before creation.
+    site_inventory optionally holds a fetch_site_inventory call already running in the background.
     Returns a dictionary of valid VPGs and VMs to create.
     """
     try:
-        # Get existing VPGs and VMs
-        existing_vpgs = {vpg['VpgName']: vpg for vpg in client.vpgs.list_vpgs()}
-        existing_vms = {vm['VmIdentifier']: vm for vm in client.vms.list_vms()}
-        local_site_id = client.localsite.get_local_site()['Link']['identifier']
-        eligible_vms = {vm['VmIdentifier']: vm for vm in client.virtualization_sites.get_virtualization_site_vms(local_site_id)}
-        logger.debug(f"validate_vpg_and_vms: existing_vms: {json.dumps(existing_vms, indent=4)}")
-        logger.debug(f"validate_vpg_and_vms: eligible_vms: {json.dumps(eligible_vms, indent=4)}")
-
-        # Track VMs that appear in multiple VPGs
-        vm_id_occurrences = defaultdict(list)
-        vm_name_occurrences = defaultdict(list)
-        valid_vpg_settings = defaultdict(list)
-        vm_warnings = []  # Track warnings for VMs that are already protected
-
-        # First pass: collect all VM occurrences
-        for vpg_name, vpg_rows in vpg_settings.items():
-            for row in vpg_rows:
-                vm_id = row['VM ID']
-                vm_name = row.get('VM Name', '')
-                vm_id_occurrences[vm_id].append(vpg_name)
-                if vm_name:
-                    vm_name_occurrences[vm_name].append(vpg_name)
+        if site_inventory is not None:
+            existing_vpgs, existing_vms, eligible_vms = site_inventory.result()
+        else:
+            existing_vpgs, existing_vms, eligible_vms = fetch_site_inventory(client)
+        # Only serialize the VM lists when debug logging is enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"validate_vpg_and_vms: existing_vms: {json.dumps(existing_vms, indent=4)}")
+            logger.debug(f"validate_vpg_and_vms: eligible_vms: {json.dumps(sorted(eligible_vms), indent=4)}")
 
-        # Check for duplicates
-        for vm_id, vpgs in vm_id_occurrences.items():
-            if len(vpgs) > 1:
-                logger.error(f"ERROR: VM ID '{vm_id}' found in multiple VPGs: {', '.join(vpgs)}. Exiting...")
-                sys.exit(1)
+        # VMs that can be added to a new VPG, either unprotected eligible VMs or already protected VMs
+        known_vm_ids = eligible_vms.union(existing_vms)
 
-        for vm_name, vpgs in vm_name_occurrences.items():
-            if len(vpgs) > 1:
-                logger.error(f"ERROR: VM Name '{vm_name}' found in multiple VPGs: {', '.join(vpgs)}. Exiting...")
-                sys.exit(1)
+        # First VPG each VM ID and VM name was seen in, to detect VMs that appear in multiple VPGs
+        seen_vm_ids = {}
+        seen_vm_names = {}
+        valid_vpg_settings = {}
+        vm_warnings = []  # Track warnings for VMs that are already protected
+        errors = []  # Collect all validation errors so the CSV can be fixed in one go
 
-        # Second pass: validate VPGs and VMs
+        # Validate VPGs and VMs in a single pass
         for vpg_name, vpg_rows in vpg_settings.items():
             if vpg_name in existing_vpgs:
-                logger.error(f"ERROR: VPG '{vpg_name}' already exists. Skipping VPG creation...")
-                sys.exit(1)
+                errors.append(f"ERROR: VPG '{vpg_name}' already exists.")
 
             valid_vms = []
             for row in vpg_rows:
                 vm_id = row['VM ID']
                 vm_name = row.get('VM Name', '')
                 
+                # Check for duplicates
+                if vm_id in seen_vm_ids:
+                    errors.append(f"ERROR: VM ID '{vm_id}' found in multiple VPGs: {seen_vm_ids[vm_id]}, {vpg_name}.")
+                else:
+                    seen_vm_ids[vm_id] = vpg_name
+                if vm_name:
+                    if vm_name in seen_vm_names:
+                        errors.append(f"ERROR: VM Name '{vm_name}' found in multiple VPGs: {seen_vm_names[vm_name]}, {vpg_name}.")
+                    else:
+                        seen_vm_names[vm_name] = vpg_name
+                
                 # Check if VM exists in eligible and existing VMs list
-                if vm_id not in eligible_vms and vm_id not in existing_vms:
-                    logger.error(f"ERROR: VM '{vm_name}' with ID '{vm_id}' is not found in the eligible and existing VMs list. Exiting")
-                    sys.exit(1)
+                if vm_id not in known_vm_ids:
+                    errors.append(f"ERROR: VM '{vm_name}' with ID '{vm_id}' is not found in the eligible and existing VMs list.")
                 
                 # Check if VM is already in a VPG
                 if vm_id in existing_vms:
-                    existing_vm = existing_vms[vm_id]
-                    warning_msg = f"WARNING: VM '{vm_name}' with ID '{vm_id}' already exists in VPG '{existing_vm['VpgName']}' on site '{existing_vm.get('RecoverySiteName', 'N/A')}'.\n\
-                        Creating a new VPG {vpg_name} will only succeed if the target site is different than {existing_vm.get('RecoverySiteName', 'N/A')}"
+                    existing_vpg_name, recovery_site_name = existing_vms[vm_id]
+                    warning_msg = f"WARNING: VM '{vm_name}' with ID '{vm_id}' already exists in VPG '{existing_vpg_name}' on site '{recovery_site_name}'.\n\
+                        Creating a new VPG {vpg_name} will only succeed if the target site is different than {recovery_site_name}"
                     vm_warnings.append(warning_msg)
                     logger.warning(warning_msg)
                 
@@ -218,6 +336,12 @@ def validate_vpg_and_vms(client: ZVMLClient, vpg_settings: Dict[str, List[Dict]]
             if valid_vms:
                 valid_vpg_settings[vpg_name] = valid_vms
 
+        if errors:
+            for error in errors:
+                logger.error(error)
+            logger.error(f"Validation failed with {len(errors)} errors. Exiting...")
+            sys.exit(1)
+
         # Print validation summary
         print("\nValidation Summary:")
         print("------------------")
@@ -259,6 +383,118 @@ def validate_vpg_and_vms(client: ZVMLClient, vpg_settings: Dict[str, List[Dict]]
         logger.exception("Error during validation:")
         sys.exit(1)
 
+def delete_created_vpg(client: ZVMLClient, vpg_name: str):
+    """Delete a VPG created by this script, logging instead of raising on failure."""
+    try:
+        logger.info(f"Cleaning up - deleting VPG {vpg_name}...")
+        client.vpgs.delete_vpg(vpg_name)
+        logger.info(f"Successfully deleted VPG {vpg_name}")
+    except Exception as e:
+        logger.error(f"Failed to delete VPG {vpg_name}: {str(e)}")
+
+def iter_vm_payloads(vpg_rows: List[Dict], recovery_block: Dict) -> Iterator[Dict]:
+    """
+    Yield the add-VM payload of each row, reusing a single dict.
+    Each payload must be sent before the next one is requested.
+    """
+    vm_payload = {"VmIdentifier": None, "Recovery": recovery_block}
+    for row in vpg_rows:
+        vm_payload["VmIdentifier"] = row['VM ID']
+        yield vm_payload
+
+def process_vpg(client: ZVMLClient, vpg_name: str, vpg_rows: List[Dict], cancelled: threading.Event) -> bool:
+    """
+    Create one VPG and add its VMs, deleting the VPG again if any VM could not be added.
+    Returns True if the VPG was created with all its VMs.
+    """
+    vpg_id = None
+    try:
+        logger.info(f"Processing VPG: {vpg_name}")
+        
+        # Use first row for VPG settings (they should be the same for all VMs in a VPG)
+        vpg_payload = create_vpg_payload(vpg_rows[0])
+        
+        # Create VPG
+        logger.info(f"Creating VPG {vpg_name}...")
+        vpg_id = client.vpgs.create_vpg(
+            basic=vpg_payload['basic'],
+            journal=vpg_payload['journal'],
+            recovery=vpg_payload['recovery'],
+            networks=vpg_payload['networks']
+        )
+        logger.info(f"VPG {vpg_name} created successfully with ID: {vpg_id}")
+        
+        # Recovery settings are the same for every VM of the VPG
+        recovery_block = {
+            "HostClusterIdentifier": vpg_payload['recovery']['DefaultHostClusterIdentifier'],
+            "DatastoreIdentifier": vpg_payload['recovery']['DefaultDatastoreIdentifier'],
+            "FolderIdentifier": vpg_payload['recovery']['DefaultFolderIdentifier']
+        }
+        
+        if cancelled.is_set():
+            logger.warning(f"Operation cancelled while processing VPG {vpg_name}")
+            delete_created_vpg(client, vpg_name)
+            return False
+        
+        # Add all VMs to the VPG with a single settings edit and commit
+        logger.info(f"Adding {len(vpg_rows)} VMs to VPG {vpg_name}...")
+        vm_errors = client.vpgs.add_vms_to_vpg(vpg_name, iter_vm_payloads(vpg_rows, recovery_block))
+        failed_vms = [
+            (row['VM ID'], row.get('VM Name', 'N/A'), vm_errors[row['VM ID']])
+            for row in vpg_rows if row['VM ID'] in vm_errors
+        ]
+        
+        # If any VM addition failed, delete the VPG
+        if failed_vms:
+            logger.error(f"Failed to add some VMs to VPG {vpg_name}. Deleting VPG...")
+            delete_created_vpg(client, vpg_name)
+            
+            # Print detailed error summary, as one block so parallel VPGs do not interleave
+            summary = ["", f"Failed VM Additions for VPG {vpg_name}:", "-------------------"]
+            for vm_id, vm_name, error in failed_vms:
+                summary.append(f"  - VM: {vm_name} (ID: {vm_id})")
+                summary.append(f"    Error: {error}")
+            summary.append(f"\nVPG {vpg_name} was deleted due to VM addition failures.")
+            print("\n".join(summary))
+            return False
+        
+        return True
+        
+    except Exception as e:
+        logger.error(f"Error processing VPG {vpg_name}: {str(e)}")
+        # Try to clean up the VPG if it was created
+        if vpg_id:
+            delete_created_vpg(client, vpg_name)
+        return False
+
+def create_vpgs(client: ZVMLClient, vpg_settings: Dict[str, List[Dict]], max_workers: int = 8) -> List[str]:
+    """
+    Create the VPGs in parallel, each VPG and its VMs are handled by one worker.
+    Returns the names of the VPGs that could not be created.
+    """
+    cancelled = threading.Event()
+    failed_vpgs = []
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    # Filled one by one, so an interrupt during submission still sees the VPGs already submitted
+    futures = {}
+    try:
+        for vpg_name, vpg_rows in vpg_settings.items():
+            futures[executor.submit(process_vpg, client, vpg_name, vpg_rows, cancelled)] = vpg_name
+        for future in as_completed(futures):
+            if not future.result():
+                failed_vpgs.append(futures[future])
+    except KeyboardInterrupt:
+        print("\nOperation cancelled by user (Ctrl+C), cleaning up VPGs in progress...")
+        # Workers delete the VPG they are processing, VPGs not started yet are skipped
+        cancelled.set()
+        for future in futures:
+            future.cancel()
+        sys.exit(0)
+    finally:
+        # Waits for the running workers, also when one of them raised or the run was cancelled
+        executor.shutdown(wait=True)
+    return failed_vpgs
+
 def main():
     """Main function to execute the script."""
     try:
@@ -273,105 +509,33 @@ def main():
             verify_certificate=not args.ignore_ssl
         )
         
-        # Read VPG settings from CSV
-        logger.info(f"Reading VPG settings from {args.csv_file}...")
-        vpg_settings = read_vpg_settings(args.csv_file)
-        
-        # Validate VPGs and VMs
-        logger.info("Validating VPGs and VMs...")
-        valid_vpg_settings = validate_vpg_and_vms(client, vpg_settings)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # Fetch the site inventory in the background while the CSV is being read
+            cache_ttl = 0 if args.no_cache else args.cache_ttl
+            site_inventory = executor.submit(fetch_site_inventory, client, cache_ttl)
+            
+            # Read VPG settings from CSV
+            logger.info(f"Reading VPG settings from {args.csv_file}...")
+            vpg_settings = read_vpg_settings(args.csv_file)
+            
+            # Validate VPGs and VMs
+            logger.info("Validating VPGs and VMs...")
+            valid_vpg_settings = validate_vpg_and_vms(client, vpg_settings, site_inventory)
         
         if not valid_vpg_settings:
             logger.error("No valid VPGs to create. Exiting...")
             sys.exit(1)
         
-        # Process each valid VPG
-        for vpg_name, vpg_rows in valid_vpg_settings.items():
-            vpg_id = None
-            try:
-                logger.info(f"Processing VPG: {vpg_name}")
-                
-                # Use first row for VPG settings (they should be the same for all VMs in a VPG)
-                vpg_payload = create_vpg_payload(vpg_rows[0])
-                
-                # Create VPG
-                logger.info(f"Creating VPG {vpg_name}...")
-                vpg_id = client.vpgs.create_vpg(
-                    basic=vpg_payload['basic'],
-                    journal=vpg_payload['journal'],
-                    recovery=vpg_payload['recovery'],
-                    networks=vpg_payload['networks']
-                )
-                logger.info(f"VPG {vpg_name} created successfully with ID: {vpg_id}")
-                
-                # Track if all VMs were added successfully
-                all_vms_added = True
-                failed_vms = []
-                
-                # Add VMs to VPG
-                for row in vpg_rows:
-                    vm_id = row['VM ID']
-                    vm_name = row.get('VM Name', 'N/A')
-                    try:
-                        logger.info(f"Adding VM {vm_id} ({vm_name}) to VPG {vpg_name}...")
-                        vm_payload = {
-                            "VmIdentifier": vm_id,
-                            "Recovery": {
-                                "HostClusterIdentifier": vpg_payload['recovery']['DefaultHostClusterIdentifier'],
-                                "DatastoreIdentifier": vpg_payload['recovery']['DefaultDatastoreIdentifier'],
-                                "FolderIdentifier": vpg_payload['recovery']['DefaultFolderIdentifier']
-                            }
-                        }
-                        task_id = client.vpgs.add_vm_to_vpg(vpg_name, vm_list_payload=vm_payload)
-                        logger.info(f"Task ID: {task_id} to add VM {vm_id} to VPG {vpg_name}")
-                    except Exception as e:
-                        logger.error(f"Failed to add VM {vm_id} ({vm_name}) to VPG {vpg_name}: {str(e)}")
-                        all_vms_added = False
-                        failed_vms.append((vm_id, vm_name, str(e)))
-                
-                # If any VM addition failed, delete the VPG
-                if not all_vms_added:
-                    logger.error(f"Failed to add some VMs to VPG {vpg_name}. Deleting VPG...")
-                    if vpg_id:
-                        try:
-                            client.vpgs.delete_vpg(vpg_name)
-                            logger.info(f"Successfully deleted VPG {vpg_name}")
-                        except Exception as e:
-                            logger.error(f"Failed to delete VPG {vpg_name}: {str(e)}")
-                    
-                    # Print detailed error summary
-                    print("\nFailed VM Additions:")
-                    print("-------------------")
-                    for vm_id, vm_name, error in failed_vms:
-                        print(f"  - VM: {vm_name} (ID: {vm_id})")
-                        print(f"    Error: {error}")
-                    print(f"\nVPG {vpg_name} was deleted due to VM addition failures.")
-                    continue
-                    
-            except KeyboardInterrupt:
-                print(f"\nOperation cancelled by user (Ctrl+C) while processing VPG {vpg_name}")
-                # Try to clean up the VPG if it was created
-                if vpg_id:
-                    try:
-                        logger.info(f"Cleaning up - deleting VPG {vpg_name}...")
-                        client.vpgs.delete_vpg(vpg_name)
-                        logger.info(f"Successfully deleted VPG {vpg_name}")
-                    except Exception as e:
-                        logger.error(f"Failed to delete VPG {vpg_name}: {str(e)}")
-                sys.exit(0)
-            except Exception as e:
-                logger.error(f"Error processing VPG {vpg_name}: {str(e)}")
-                # Try to clean up the VPG if it was created
-                if vpg_id:
-                    try:
-                        logger.info(f"Cleaning up - deleting VPG {vpg_name}...")
-                        client.vpgs.delete_vpg(vpg_name)
-                        logger.info(f"Successfully deleted VPG {vpg_name}")
-                    except Exception as e:
-                        logger.error(f"Failed to delete VPG {vpg_name}: {str(e)}")
-                continue
+        # The cached VM lists no longer match the ZVM once VMs are being protected
+        invalidate_vm_cache(client.zvm_address)
+
+        # Create the VPGs in parallel
+        failed_vpgs = create_vpgs(client, valid_vpg_settings)
         
-        logger.info("VPG creation completed successfully")
+        if failed_vpgs:
+            logger.error(f"Failed to create VPGs: {', '.join(failed_vpgs)}")
+        else:
+            logger.info("VPG creation completed successfully")
         
     except KeyboardInterrupt:
         print("\nOperation cancelled by user (Ctrl+C)")
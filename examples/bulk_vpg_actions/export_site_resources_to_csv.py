@@ -34,6 +34,10 @@ Required Arguments:
     --client_secret: API client secret
     --ignore_ssl: Ignore SSL certificate validation (optional)
     --output_dir: Directory to save CSV files (default: current directory)
+    --cache_ttl: Seconds to reuse the site lists cached by a previous run, 0 disables the cache (optional, default: 0)
+    --no_cache: Always fetch the site lists from the ZVM (optional)
+    --zip: Write all CSV files into a single zerto_site_resources_<timestamp>.zip
+           in the output directory instead of separate files (optional)
 
 Example Usage:
     python export_site_resources.py \
@@ -46,13 +50,26 @@ Example Usage:
 
 import argparse
 import csv
+import io
 from datetime import datetime
 import logging
 import os
 import sys
+import threading
+import time
 import urllib3
-from typing import Dict, List, Optional
+import zipfile
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+from itertools import chain
+from contextlib import nullcontext
 import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Add parent directory to Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -69,6 +86,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Serializes the export threads adding their CSV files to the --zip archive
+ARCHIVE_LOCK = threading.Lock()
+
 def setup_argparse() -> argparse.ArgumentParser:
     """Set up command line argument parsing."""
     parser = argparse.ArgumentParser(description='Export Zerto site resources to CSV files')
@@ -77,24 +97,84 @@ def setup_argparse() -> argparse.ArgumentParser:
     parser.add_argument('--client_secret', required=True, help='API client secret')
     parser.add_argument('--ignore_ssl', action='store_true', help='Ignore SSL certificate validation')
     parser.add_argument('--output_dir', default='.', help='Directory to save CSV files (default: current directory)')
+    parser.add_argument('--cache_ttl', type=int, default=0,
+                        help='Seconds to reuse the site lists cached by a previous run, 0 disables the cache (default: 0)')
+    parser.add_argument('--no_cache', action='store_true', help='Always fetch the site lists from the ZVM')
+    parser.add_argument('--zip', action='store_true', help='Write all CSV files into a single ZIP archive in the output directory')
     return parser
 
+def log_json_debug(message: str, obj) -> None:
+    """Log obj as indented JSON at DEBUG level, serializing it only when DEBUG is enabled."""
+    if logger.isEnabledFor(logging.DEBUG):
+        if orjson is not None:
+            pretty = orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+        else:
+            pretty = json.dumps(obj, indent=4)
+        logger.debug("%s %s", message, pretty)
+
 def ensure_output_dir(output_dir: str) -> None:
     """Ensure the output directory exists."""
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
-        logger.info(f"Created output directory: {output_dir}")
-
-def get_site_info(client: ZVMLClient) -> Dict[str, str]:
-    """Get local and peer site information."""
-    virtualization_sites = client.virtualization_sites.get_virtualization_sites()
-    logger.info(f"Virtualization sites: {json.dumps(virtualization_sites, indent=4)}")
+    os.makedirs(output_dir, exist_ok=True)
+
+def site_cache_path(zvm_address: str) -> str:
+    """Return the path of the local cache file of the site lists of a ZVM."""
+    return os.path.join(os.path.expanduser('~'), '.cache', 'zvml', f"sites-{zvm_address.replace(':', '_')}.json")
+
+def load_site_cache(zvm_address: str, cache_ttl: int) -> Optional[Dict]:
+    """Return the cached site lists of a ZVM, or None if there is no cache younger than cache_ttl seconds."""
+    cache_file = site_cache_path(zvm_address)
+    try:
+        if time.time() - os.path.getmtime(cache_file) > cache_ttl:
+            return None
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        logger.info(f"Using cached site lists from {cache_file}")
+        return {key: cache[key] for key in ('virtualization_sites', 'local_site', 'peer_sites')}
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+def save_site_cache(zvm_address: str, site_lists: Dict) -> None:
+    """Write the site lists of a ZVM to the local cache, failures only log a warning."""
+    cache_file = site_cache_path(zvm_address)
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        # Written aside and renamed, so a concurrent run never reads a partial file
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(site_lists, f)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        logger.warning(f"Failed to write site cache {cache_file}: {e}")
+
+def get_site_info(client: ZVMLClient, cache_ttl: int = 0) -> Dict[str, str]:
+    """
+    Get local and peer site information, including the peer site details used by export_sites.
+    The site lists are taken from the local cache when it is younger than cache_ttl seconds.
+    """
+    site_lists = load_site_cache(client.zvm_address, cache_ttl) if cache_ttl > 0 else None
+    if site_lists is None:
+        # The site lists and the local site are independent calls, run them concurrently
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            virtualization_sites_future = executor.submit(client.virtualization_sites.get_virtualization_sites)
+            local_site_future = executor.submit(client.localsite.get_local_site)
+            peer_sites_details_future = executor.submit(client.peersites.get_peer_sites)
+            site_lists = {
+                'virtualization_sites': virtualization_sites_future.result(),
+                'local_site': local_site_future.result(),
+                'peer_sites': peer_sites_details_future.result()
+            }
+        if cache_ttl > 0 and site_lists['virtualization_sites']:
+            save_site_cache(client.zvm_address, site_lists)
+    virtualization_sites = site_lists['virtualization_sites']
+    local_site = site_lists['local_site']
+    peer_sites_details = site_lists['peer_sites']
+    
+    log_json_debug("Virtualization sites:", virtualization_sites)
     if not virtualization_sites:
         raise ValueError("No sites found in ZVM")
     
     # Get local site id and name
-    local_site = client.localsite.get_local_site()
-    logger.info(f"Local site: {json.dumps(local_site, indent=4)}")
+    log_json_debug("Local site:", local_site)
     local_site_id = local_site.get('SiteIdentifier')
     
     # Find local site in virtualization sites to get VirtualizationSiteName
@@ -116,191 +196,167 @@ def get_site_info(client: ZVMLClient) -> Dict[str, str]:
     
     return {
         'local': local_site,
-        'peers': peer_sites
+        'peers': peer_sites,
+        'peer_details': peer_sites_details
+    }
+
+def write_csv(filename: Path, header: List[str], rows: Iterable, archive: Optional[zipfile.ZipFile] = None) -> None:
+    """Write a small CSV file, rendering it in memory first so the file gets a single write.
+
+    When archive is given the CSV is added to it as an entry named after the file instead.
+    """
+    buffer = io.StringIO(newline='')
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+    writer.writerows(rows)
+    if archive is not None:
+        # ZipFile refuses concurrent writes, the export threads take turns adding their entry
+        with ARCHIVE_LOCK:
+            archive.writestr(filename.name, buffer.getvalue())
+        return
+    with open(filename, 'w', newline='') as csvfile:
+        csvfile.write(buffer.getvalue())
+
+def fetch_all_site_resources(client: ZVMLClient, site_identifier: str) -> Dict[str, List[Dict]]:
+    """Fetch the datastores, networks, hosts and folders of a site with concurrent API calls."""
+    getters = {
+        'datastores': client.virtualization_sites.get_virtualization_site_datastores,
+        'networks': client.virtualization_sites.get_virtualization_site_networks,
+        'hosts': client.virtualization_sites.get_virtualization_site_hosts,
+        'folders': client.virtualization_sites.get_virtualization_site_folders
     }
+    with ThreadPoolExecutor(max_workers=len(getters)) as executor:
+        futures = {kind: executor.submit(getter, site_identifier=site_identifier) for kind, getter in getters.items()}
+        return {kind: future.result() for kind, future in futures.items()}
 
-def export_datastores(client: ZVMLClient, site_info: Dict, output_dir: str) -> None:
+def export_peer_resources(client: ZVMLClient, site_info: Dict, output_dir: Path, timestamp: str, archive: Optional[zipfile.ZipFile] = None) -> None:
+    """Export the datastores, networks, hosts and folders of a peer site to CSV files."""
+    resources = fetch_all_site_resources(client, site_info['SiteIdentifier'])
+    export_datastores(site_info, resources['datastores'], output_dir, timestamp, archive)
+    export_networks(site_info, resources['networks'], output_dir, timestamp, archive)
+    export_hosts(site_info, resources['hosts'], output_dir, timestamp, archive)
+    export_folders(site_info, resources['folders'], output_dir, timestamp, archive)
+
+def export_datastores(site_info: Dict, peer_datastores: List[Dict], output_dir: Path, timestamp: str, archive: Optional[zipfile.ZipFile] = None) -> None:
     """Export datastores information to CSV."""
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    
-    # Get peer site datastores
-    peer_datastores = client.virtualization_sites.get_virtualization_site_datastores(
-        site_identifier=site_info['SiteIdentifier']
-    )
-    
     # Create filename using VirtualizationSiteName
-    filename = os.path.join(output_dir, f"{site_info['VirtualizationSiteName']}_datastores_{timestamp}.csv")
+    filename = output_dir / f"{site_info['VirtualizationSiteName']}_datastores_{timestamp}.csv"
     
-    with open(filename, 'w', newline='') as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow(['Datastore Name', 'Datastore ID'])
-        
-        for ds in peer_datastores:
-            writer.writerow([
-                ds.get('DatastoreName'),
-                ds.get('DatastoreIdentifier')
-            ])
+    write_csv(filename, ['Datastore Name', 'Datastore ID'], ((ds.get('DatastoreName'), ds.get('DatastoreIdentifier')) for ds in peer_datastores), archive)
     
     logger.info(f"Exported {len(peer_datastores)} datastores to {filename}")
 
-def export_networks(client: ZVMLClient, site_info: Dict, output_dir: str) -> None:
+def export_networks(site_info: Dict, peer_networks: List[Dict], output_dir: Path, timestamp: str, archive: Optional[zipfile.ZipFile] = None) -> None:
     """Export networks information to CSV."""
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    
-    # Get peer site networks
-    peer_networks = client.virtualization_sites.get_virtualization_site_networks(
-        site_identifier=site_info['SiteIdentifier']
-    )
-    logger.info(f"export_networks: peer_networks: {json.dumps(peer_networks, indent=4)}")
+    log_json_debug("export_networks: peer_networks:", peer_networks)
     
     # Create filename using VirtualizationSiteName
-    filename = os.path.join(output_dir, f"{site_info['VirtualizationSiteName']}_networks_{timestamp}.csv")
+    filename = output_dir / f"{site_info['VirtualizationSiteName']}_networks_{timestamp}.csv"
     
-    with open(filename, 'w', newline='') as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow(['Network VirtualizationNetworkName', 'Network ID'])
-        
-        for net in peer_networks:
-            writer.writerow([
-                net.get('VirtualizationNetworkName'),
-                net.get('NetworkIdentifier')
-            ])
+    write_csv(filename, ['Network VirtualizationNetworkName', 'Network ID'], ((net.get('VirtualizationNetworkName'), net.get('NetworkIdentifier')) for net in peer_networks), archive)
     
     logger.info(f"Exported {len(peer_networks)} networks to {filename}")
 
-def export_vms(client: ZVMLClient, site_info: Dict, output_dir: str) -> None:
+def export_vms(client: ZVMLClient, site_info: Dict, output_dir: Path, timestamp: str, archive: Optional[zipfile.ZipFile] = None) -> None:
     """Export VMs information to CSV."""
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    
     # Get local site VMs
     local_vms = client.virtualization_sites.get_virtualization_site_vms(
         site_identifier=site_info['SiteIdentifier']
     )
     
     # Create filename using VirtualizationSiteName
-    filename = os.path.join(output_dir, f"{site_info['VirtualizationSiteName']}_vms_{timestamp}.csv")
+    filename = output_dir / f"{site_info['VirtualizationSiteName']}_vms_{timestamp}.csv"
     
-    with open(filename, 'w', newline='') as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow(['VM Name', 'VM ID'])
-        
-        for vm in local_vms:
-            writer.writerow([
-                vm.get('VmName'),
-                vm.get('VmIdentifier')
-            ])
+    vm_rows = ((vm.get('VmName'), vm.get('VmIdentifier')) for vm in local_vms)
+    if archive is not None:
+        write_csv(filename, ['VM Name', 'VM ID'], vm_rows, archive)
+    else:
+        with open(filename, 'w', newline='', buffering=1 << 20) as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(['VM Name', 'VM ID'])
+            writer.writerows(vm_rows)
     
     logger.info(f"Exported {len(local_vms)} VMs to {filename}")
 
-def export_hosts(client: ZVMLClient, site_info: Dict, output_dir: str) -> None:
+def export_hosts(site_info: Dict, peer_hosts: List[Dict], output_dir: Path, timestamp: str, archive: Optional[zipfile.ZipFile] = None) -> None:
     """Export hosts information to CSV."""
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    
-    # Get peer site hosts
-    peer_hosts = client.virtualization_sites.get_virtualization_site_hosts(
-        site_identifier=site_info['SiteIdentifier']
-    )
-    logger.info(f"export_hosts: peer_hosts: {json.dumps(peer_hosts, indent=4)}")
+    log_json_debug("export_hosts: peer_hosts:", peer_hosts)
     
     # Create filename using VirtualizationSiteName
-    filename = os.path.join(output_dir, f"{site_info['VirtualizationSiteName']}_hosts_{timestamp}.csv")
+    filename = output_dir / f"{site_info['VirtualizationSiteName']}_hosts_{timestamp}.csv"
     
-    with open(filename, 'w', newline='') as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow(['Host Name', 'Host ID'])
-        
-        for host in peer_hosts:
-            writer.writerow([
-                host.get('VirtualizationHostName'),
-                host.get('HostIdentifier')
-            ])
+    write_csv(filename, ['Host Name', 'Host ID'], ((host.get('VirtualizationHostName'), host.get('HostIdentifier')) for host in peer_hosts), archive)
     
     logger.info(f"Exported {len(peer_hosts)} hosts to {filename}")
 
-def export_folders(client: ZVMLClient, site_info: Dict, output_dir: str) -> None:
+def export_folders(site_info: Dict, peer_folders: List[Dict], output_dir: Path, timestamp: str, archive: Optional[zipfile.ZipFile] = None) -> None:
     """Export folders information to CSV."""
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    
-    # Get peer site folders
-    peer_folders = client.virtualization_sites.get_virtualization_site_folders(
-        site_identifier=site_info['SiteIdentifier']
-    )
-    logger.info(f"export_folders: peer_folders: {json.dumps(peer_folders, indent=4)}")
+    log_json_debug("export_folders: peer_folders:", peer_folders)
     
     # Create filename using VirtualizationSiteName
-    filename = os.path.join(output_dir, f"{site_info['VirtualizationSiteName']}_folders_{timestamp}.csv")
+    filename = output_dir / f"{site_info['VirtualizationSiteName']}_folders_{timestamp}.csv"
     
-    with open(filename, 'w', newline='') as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow(['Folder Name', 'Folder ID'])
-        
-        for folder in peer_folders:
-            writer.writerow([
-                folder.get('FolderName'),
-                folder.get('FolderIdentifier')
-            ])
+    write_csv(filename, ['Folder Name', 'Folder ID'], ((folder.get('FolderName'), folder.get('FolderIdentifier')) for folder in peer_folders), archive)
     
     logger.info(f"Exported {len(peer_folders)} folders to {filename}")
 
-def export_sites(client: ZVMLClient, site_info: Dict, output_dir: str) -> None:
+# Shared read-only fallback for peer sites missing from get_peer_sites
+NO_PEER_DETAILS: Dict = {}
+
+def peer_site_row(peer: Dict, peer_sites_dict: Dict[str, Dict]) -> List:
+    """Return the sites CSV row of a peer site, using the details from get_peer_sites."""
+    peer_id = peer.get('SiteIdentifier')
+    peer_details = peer_sites_dict.get(peer_id, NO_PEER_DETAILS)
+    return [
+        peer_details.get('PeerSiteName', ''),
+        peer_id,
+        peer_details.get('Location', ''),
+        peer_details.get('Version', ''),
+        peer_details.get('SiteType', ''),
+        peer_details.get('HostName', ''),  # Using HostName as IP Address
+        'No',
+        peer_details.get('HostName', ''),
+        peer_details.get('RegionName', '')
+    ]
+
+def export_sites(site_info: Dict, output_dir: Path, timestamp: str, archive: Optional[zipfile.ZipFile] = None) -> None:
     """Export sites information to CSV."""
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    
     # Create filename for sites
-    filename = os.path.join(output_dir, f"zerto_sites_{timestamp}.csv")
+    filename = output_dir / f"zerto_sites_{timestamp}.csv"
     
-    # Get detailed peer site information
-    peer_sites_details = client.peersites.get_peer_sites()
+    # Detailed peer site information, fetched by get_site_info
+    peer_sites_details = site_info['peer_details']
     # Convert to dict for easier lookup by site identifier
     peer_sites_dict = {site['SiteIdentifier']: site for site in peer_sites_details} if isinstance(peer_sites_details, list) else {}
     
-    with open(filename, 'w', newline='') as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow([
-            'Site Name',
-            'Site ID',
-            'Location',
-            'Version',
-            'Site Type',
-            'IP Address',
-            'Is Local Site',
-            'Host Name',
-            'Region Name'
-        ])
-        
-        # Write local site
-        local_site = site_info['local']
-        writer.writerow([
-            local_site.get('SiteName'),
-            local_site.get('SiteIdentifier'),
-            local_site.get('Location'),
-            local_site.get('Version'),
-            local_site.get('SiteType'),
-            local_site.get('IpAddress'),
-            'Yes',
-            'N/A',  # Local site doesn't have host name
-            local_site.get('RegionName', '')
-        ])
-        
-        # Write peer sites with detailed information
-        for peer in site_info['peers']:
-            peer_id = peer.get('SiteIdentifier')
-            peer_details = peer_sites_dict.get(peer_id, {})
-            
-            writer.writerow([
-                peer_details.get('PeerSiteName', ''),
-                peer_id,
-                peer_details.get('Location', ''),
-                peer_details.get('Version', ''),
-                peer_details.get('SiteType', ''),
-                peer_details.get('HostName', ''),  # Using HostName as IP Address
-                'No',
-                peer_details.get('HostName', ''),
-                peer_details.get('RegionName', '')
-            ])
+    # Local site first, then the peer sites with detailed information
+    local_site = site_info['local']
+    local_site_row = [
+        local_site.get('SiteName'),
+        local_site.get('SiteIdentifier'),
+        local_site.get('Location'),
+        local_site.get('Version'),
+        local_site.get('SiteType'),
+        local_site.get('IpAddress'),
+        'Yes',
+        'N/A',  # Local site doesn't have host name
+        local_site.get('RegionName', '')
+    ]
+    peer_site_rows = (peer_site_row(peer, peer_sites_dict) for peer in site_info['peers'])
+    write_csv(filename, [
+        'Site Name',
+        'Site ID',
+        'Location',
+        'Version',
+        'Site Type',
+        'IP Address',
+        'Is Local Site',
+        'Host Name',
+        'Region Name'
+    ], chain((local_site_row,), peer_site_rows), archive)
     
     logger.info(f"Exported {len(site_info['peers']) + 1} sites to {filename}")
-    logger.info(f"Peer sites details: {json.dumps(peer_sites_details, indent=4)}")
+    log_json_debug("Peer sites details:", peer_sites_details)
 
 def main():
     """Main function to execute the script."""
@@ -310,6 +366,7 @@ def main():
     try:
         # Ensure output directory exists
         ensure_output_dir(args.output_dir)
+        output_dir = Path(args.output_dir)
         
         # Initialize ZVM client
         client = ZVMLClient(
@@ -321,28 +378,45 @@ def main():
         
         # Get site information
         logger.info("Retrieving site information...")
-        site_info = get_site_info(client)
-        logger.info(f"Site info: {json.dumps(site_info, indent=4)}")
+        site_info = get_site_info(client, 0 if args.no_cache else args.cache_ttl)
+        log_json_debug("Site info:", site_info)
         
         # Log site information
         logger.info(f"Local site: {site_info['local'].get('VirtualizationSiteName')}")
         for peer in site_info['peers']:
             logger.info(f"Peer site: {peer.get('VirtualizationSiteName')}")
         
-        # Export sites to CSV
-        logger.info("\nExporting sites information...")
-        export_sites(client, site_info, args.output_dir)
+        # All files of a run share one timestamp
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         
-        # Export resources to CSV files
-        for peer in site_info['peers']:
-            logger.info(f"Exporting resources for peer site: {peer.get('VirtualizationSiteName')}")
-            export_datastores(client, peer, args.output_dir)
-            export_networks(client, peer, args.output_dir)
-            export_hosts(client, peer, args.output_dir)
-            export_folders(client, peer, args.output_dir)
+        # Run all exports in parallel, each one is an independent API call and CSV file
+        # With --zip every CSV becomes an entry of one archive instead of a separate file,
+        # the executor is listed last so all exports finish before the archive is closed
+        archive_name = output_dir / f"zerto_site_resources_{timestamp}.zip"
+        with (zipfile.ZipFile(archive_name, 'w', compression=zipfile.ZIP_DEFLATED) if args.zip else nullcontext()) as archive, \
+                ThreadPoolExecutor(max_workers=8) as executor:
+            # Export sites to CSV
+            logger.info("\nExporting sites information...")
+            futures = {executor.submit(export_sites, site_info, output_dir, timestamp, archive): "sites"}
+            
+            # Export resources to CSV files
+            for peer in site_info['peers']:
+                peer_name = peer.get('VirtualizationSiteName')
+                logger.info(f"Exporting resources for peer site: {peer_name}")
+                futures[executor.submit(export_peer_resources, client, peer, output_dir, timestamp, archive)] = f"export_peer_resources for {peer_name}"
+            
+            logger.info(f"Exporting VMs for local site: {site_info['local'].get('VirtualizationSiteName')}")
+            futures[executor.submit(export_vms, client, site_info['local'], output_dir, timestamp, archive)] = "export_vms"
+            
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception:
+                    logger.error(f"Failed to run {futures[future]}")
+                    raise
         
-        logger.info(f"Exporting VMs for local site: {site_info['local'].get('VirtualizationSiteName')}")
-        export_vms(client, site_info['local'], args.output_dir)
+        if args.zip:
+            logger.info(f"CSV files archived to: {archive_name}")
         
         logger.info(f"Export completed successfully. Files saved to: {args.output_dir}")
         
@@ -18,8 +18,12 @@ import sys
 import os
 from pathlib import Path
 import urllib3
-from typing import List, Dict
-import codecs
+from typing import List, Dict, Iterable, Iterator, TextIO, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Add parent directory to path to import zvml
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -95,54 +99,64 @@ def setup_client(args):
     )
     return client
 
-def extract_nic_settings(json_data):
-    """Extract NIC settings from VPG JSON data."""
-    nic_settings = []
-    
+# CSV columns, in the order of the rows yielded by extract_nic_settings
+FIELDNAMES = (
+    'VPG Name', 'VM Identifier', 'NIC Identifier',
+    'Failover Network', 'Failover ShouldReplaceIpConfiguration', 'Failover DHCP',
+    'Failover IP', 'Failover Subnet', 'Failover Gateway',
+    'Failover DNS1', 'Failover DNS2',
+    'Failover Test Network', 'Failover Test ShouldReplaceIpConfiguration', 'Failover Test DHCP',
+    'Failover Test IP', 'Failover Test Subnet',
+    'Failover Test Gateway', 'Failover Test DNS1', 'Failover Test DNS2'
+)
+
+def dumps_indented(obj) -> str:
+    """Serialize obj as JSON indented by two spaces, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+def extract_nic_side(nic_side: Dict) -> Tuple:
+    """Return the network and IP settings columns of a NIC Failover or FailoverTest section."""
+    hypervisor = (nic_side or {}).get('Hypervisor') or {}
+    ip_config = hypervisor.get('IpConfig') or {}
+    return (
+        hypervisor.get('NetworkIdentifier', ''),
+        'True' if hypervisor.get('ShouldReplaceIpConfiguration') else 'False',
+        'True' if ip_config.get('IsDhcp') else 'False',
+        ip_config.get('StaticIp', ''),
+        ip_config.get('SubnetMask', ''),
+        ip_config.get('Gateway', ''),
+        ip_config.get('PrimaryDns', ''),
+        ip_config.get('SecondaryDns', '')
+    )
+
+def extract_nic_settings(json_data: Iterable[Dict]) -> Iterator[Tuple]:
+    """Extract NIC settings from VPG JSON data, yielding one row per NIC in FIELDNAMES order."""
     for vpg in json_data:
         vpg_name = vpg['Basic']['Name']
-        
         for vm in vpg['Vms']:
             vm_id = vm['VmIdentifier']
-            
             for nic in vm['Nics']:
-                nic_id = nic['NicIdentifier']
-                
-                # Extract failover settings
-                failover = nic['Failover']['Hypervisor'] if nic['Failover'] and nic['Failover']['Hypervisor'] else {}
-                failover_network = failover.get('NetworkIdentifier', '')
-                failover_ip_config = failover.get('IpConfig', {}) or {}
-                
-                # Extract failover test settings
-                failover_test = nic['FailoverTest']['Hypervisor'] if nic['FailoverTest'] and nic['FailoverTest']['Hypervisor'] else {}
-                failover_test_network = failover_test.get('NetworkIdentifier', '')
-                failover_test_ip_config = failover_test.get('IpConfig', {}) or {}
-                
-                # Create a row for each NIC
-                row = {
-                    'VPG Name': vpg_name,
-                    'VM Identifier': vm_id,
-                    'NIC Identifier': nic_id,
-                    'Failover Network': failover_network,
-                    'Failover ShouldReplaceIpConfiguration': str(failover.get('ShouldReplaceIpConfiguration', False)),
-                    'Failover DHCP': str(failover_ip_config.get('IsDhcp', False)),
-                    'Failover IP': failover_ip_config.get('StaticIp', ''),
-                    'Failover Subnet': failover_ip_config.get('SubnetMask', ''),
-                    'Failover Gateway': failover_ip_config.get('Gateway', ''),
-                    'Failover DNS1': failover_ip_config.get('PrimaryDns', ''),
-                    'Failover DNS2': failover_ip_config.get('SecondaryDns', ''),
-                    'Failover Test Network': failover_test_network,
-                    'Failover Test ShouldReplaceIpConfiguration': str(failover_test.get('ShouldReplaceIpConfiguration', False)),
-                    'Failover Test DHCP': str(failover_test_ip_config.get('IsDhcp', False)),
-                    'Failover Test IP': failover_test_ip_config.get('StaticIp', ''),
-                    'Failover Test Subnet': failover_test_ip_config.get('SubnetMask', ''),
-                    'Failover Test Gateway': failover_test_ip_config.get('Gateway', ''),
-                    'Failover Test DNS1': failover_test_ip_config.get('PrimaryDns', ''),
-                    'Failover Test DNS2': failover_test_ip_config.get('SecondaryDns', '')
-                }
-                nic_settings.append(row)
-    
-    return nic_settings
+                # One tuple per row, no intermediate concatenations
+                yield (vpg_name, vm_id, nic['NicIdentifier'],
+                       *extract_nic_side(nic.get('Failover')), *extract_nic_side(nic.get('FailoverTest')))
+
+def dump_and_extract(vpgs: Iterable[Dict], json_file: TextIO, csv_writer) -> int:
+    """
+    Write the VPGs as a JSON array to json_file and their NIC rows to csv_writer in a single pass.
+    The JSON has the same layout as json.dump(..., indent=2) of the whole list.
+    Returns the number of VPGs written.
+    """
+    json_file.write('[')
+    vpg_count = 0
+    for vpg in vpgs:
+        json_file.write(',\n  ' if vpg_count else '\n  ')
+        vpg_count += 1
+        json_file.write(dumps_indented(vpg).replace('\n', '\n  '))
+        csv_writer.writerows(extract_nic_settings((vpg,)))
+    json_file.write('\n]' if vpg_count else ']')
+    return vpg_count
 
 def get_safe_filename(timestamp):
     """Convert timestamp to a URL-safe filename."""
@@ -162,9 +176,7 @@ def setup_argparse() -> argparse.ArgumentParser:
 
 def ensure_output_dir(output_dir: str) -> None:
     """Ensure the output directory exists."""
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
-        logging.info(f"Created output directory: {output_dir}")
+    os.makedirs(output_dir, exist_ok=True)
 
 def main():
     parser = setup_argparse()
@@ -197,48 +209,25 @@ def main():
         safe_timestamp = get_safe_filename(timestamp)
         print(f"Export completed successfully. Timestamp: {timestamp}")
 
-        # Get the exported settings
-        export_settings = client.vpgs.read_exported_vpg_settings(timestamp, vpg_names)
-        
-        # Save the JSON export
-        json_file_name = os.path.join(args.output_dir, f"ExportedSettings_{safe_timestamp}.json")
-        with open(json_file_name, 'w') as f:
-            json.dump(export_settings['ExportedVpgSettingsApi'], f, indent=2)
-        print(f"\nJSON export saved to: {json_file_name}")
-
-        # Convert to CSV
-        nic_settings = extract_nic_settings(export_settings['ExportedVpgSettingsApi'])
-        
         # Create CSV file with Windows line endings
-        csv_file_name = os.path.join(args.output_dir, f"ExportedSettings_{safe_timestamp}.csv")
-        fieldnames = [
-            'VPG Name', 'VM Identifier', 'NIC Identifier',
-            'Failover Network', 'Failover ShouldReplaceIpConfiguration', 'Failover DHCP',
-            'Failover IP', 'Failover Subnet', 'Failover Gateway',
-            'Failover DNS1', 'Failover DNS2',
-            'Failover Test Network', 'Failover Test ShouldReplaceIpConfiguration', 'Failover Test DHCP',
-            'Failover Test IP', 'Failover Test Subnet',
-            'Failover Test Gateway', 'Failover Test DNS1', 'Failover Test DNS2'
-        ]
+        output_dir = Path(args.output_dir)
+        json_file_name = output_dir / f"ExportedSettings_{safe_timestamp}.json"
+        csv_file_name = output_dir / f"ExportedSettings_{safe_timestamp}.csv"
         
-        # Write CSV content directly
-        with open(csv_file_name, 'w', newline='') as f:
-            writer = csv.DictWriter(
+        # Stream the exported settings once, writing the JSON export and the CSV rows of each VPG
+        # as it arrives so only one VPG is held in memory at a time
+        with open(json_file_name, 'w', encoding='utf-8', buffering=1 << 20) as json_file, \
+                open(csv_file_name, 'w', newline='', buffering=1 << 20) as f:
+            writer = csv.writer(
                 f,
-                fieldnames=fieldnames,
                 delimiter=',',
                 quoting=csv.QUOTE_ALL,
                 quotechar='"',
                 lineterminator='\r\n'
             )
-            writer.writeheader()
-            for row in nic_settings:
-                # Ensure all fields are present and properly formatted
-                for field in fieldnames:
-                    if field not in row:
-                        row[field] = ''
-                    # No need to convert boolean values since they're already strings
-                writer.writerow(row)
+            writer.writerow(FIELDNAMES)
+            dump_and_extract(client.vpgs.iter_exported_vpg_settings(timestamp, vpg_names), json_file, writer)
+        print(f"\nJSON export saved to: {json_file_name}")
         
         print(f"CSV file created: {csv_file_name}")
 
@@ -18,12 +18,20 @@ logging.basicConfig(
 )
 import json
 import csv
+import gzip
+import itertools
 import sys
 import os
 from pathlib import Path
 import urllib3
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Iterator
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Add parent directory to path to import zvml
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -87,6 +95,18 @@ to safely update VPG NIC settings in bulk, with validation and confirmation step
 prevent unintended changes.
 """
 
+# CSV columns identifying a NIC row, every other column is compared as a setting
+KEY_COLUMNS = frozenset(('VPG Name', 'VM Identifier', 'NIC Identifier'))
+
+# CSV columns checked by compare_settings when validating IP settings, per NIC side
+FAILOVER_IP_KEYS = ('Failover IP', 'Failover Subnet', 'Failover Gateway', 'Failover DNS1', 'Failover DNS2')
+FAILOVER_TEST_IP_KEYS = ('Failover Test IP', 'Failover Test Subnet', 'Failover Test Gateway',
+                         'Failover Test DNS1', 'Failover Test DNS2')
+IP_SETTINGS_KEYS = (
+    ('Failover', FAILOVER_IP_KEYS, 'Failover DHCP', 'Failover ShouldReplaceIpConfiguration'),
+    ('Failover Test', FAILOVER_TEST_IP_KEYS, 'Failover Test DHCP', 'Failover Test ShouldReplaceIpConfiguration'),
+)
+
 def setup_client(args):
     """Initialize and return Zerto client"""
     client = ZVMLClient(
@@ -97,17 +117,41 @@ def setup_client(args):
     )
     return client
 
-def read_csv_settings(csv_path: str) -> List[Dict]:
-    """Read settings from CSV file."""
-    settings = []
-    with open(csv_path, 'r', newline='') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            settings.append(row)
-    return settings
-
-def get_current_settings(client: ZVMLClient, vpg_names: List[str] = None) -> Tuple[str, List[Dict]]:
-    """Get current VPG settings and convert to CSV format."""
+def dumps_pretty(obj) -> str:
+    """Serialize obj as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=4)
+
+def log_json_debug(message: str, obj) -> None:
+    """Log obj as indented JSON at DEBUG level, serializing it only when DEBUG is enabled."""
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug("%s %s", message, dumps_pretty(obj))
+
+def build_vm_name_index(client: ZVMLClient) -> Dict[str, str]:
+    """Return a VM identifier to VM name mapping of all protected VMs, fetched with a single API call."""
+    return {vm['VmIdentifier']: vm['VmName'] for vm in client.vms.list_vms() or []}
+
+def iter_csv_settings(csv_path: str) -> Iterator[List[str]]:
+    """Yield the header and then each settings row from CSV file as lists of values.
+
+    Gzip-compressed CSV files are detected by their magic bytes and read transparently.
+    """
+    with open(csv_path, 'rb') as f:
+        is_gzip = f.read(2) == b'\x1f\x8b'
+    if is_gzip:
+        with gzip.open(csv_path, 'rt', newline='', encoding='utf-8') as f:
+            yield from csv.reader(f)
+    else:
+        with open(csv_path, 'r', newline='', encoding='utf-8', buffering=1 << 20) as f:
+            yield from csv.reader(f)
+
+def get_current_settings(client: ZVMLClient, vpg_names: List[str] = None) -> Tuple[str, List[Dict], Dict[str, str]]:
+    """Get current VPG settings and convert to CSV format.
+
+    Also returns a VM identifier to VM name mapping taken from the exported settings,
+    falling back to the identifier for VMs exported without a name.
+    """
     # Export current settings
     export_result = client.vpgs.export_vpg_settings(vpg_names)
     if not export_result or 'TimeStamp' not in export_result:
@@ -115,13 +159,15 @@ def get_current_settings(client: ZVMLClient, vpg_names: List[str] = None) -> Tup
     
     timestamp = export_result['TimeStamp']
     export_settings = client.vpgs.read_exported_vpg_settings(timestamp, vpg_names)
-    # logging.info(f"get_current_settings: export_settings: {json.dumps(export_settings, indent=4)}")
+    log_json_debug("get_current_settings: export_settings:", export_settings)
     # Convert to CSV format
     nic_settings = []
+    vm_name_index = {}
     for vpg in export_settings['ExportedVpgSettingsApi']:
         vpg_name = vpg['Basic']['Name']
         for vm in vpg['Vms']:
             vm_id = vm['VmIdentifier']
+            vm_name_index[vm_id] = vm.get('VmName') or vm_id
             for nic in vm['Nics']:
                 nic_id = nic['NicIdentifier']
                 
@@ -158,41 +204,130 @@ def get_current_settings(client: ZVMLClient, vpg_names: List[str] = None) -> Tup
                 }
                 nic_settings.append(row)
     
-    return timestamp, nic_settings
+    return timestamp, nic_settings, vm_name_index
+
+# String values compared as empty by normalize_value
+EMPTY_STRING_VALUES = frozenset(('', 'None', 'null'))
 
 def normalize_value(value):
     """Normalize values for comparison."""
-    # Treat None, empty string, and 'None' as the same
-    if value in ['', None, 'None', 'null']:
+    # CSV values are strings, so check them first
+    # Treat None, empty string, 'None' and 'null' as the same
+    if isinstance(value, str):
+        return '' if value in EMPTY_STRING_VALUES else value.lower()
+    if value is None:
         return ''
     if isinstance(value, bool):
-        return str(value).lower()
-    if isinstance(value, str):
-        value = value.lower()
-        if value == 'true':
-            return 'true'
-        if value == 'false':
-            return 'false'
+        return 'true' if value else 'false'
     return str(value)
 
-def compare_settings(client, current: List[Dict], updated: List[Dict]) -> List[Dict]:
-    """Compare current and updated settings and return changes."""
-    changes = []
-    
-    # Create lookup dictionaries for faster comparison
+# Static IP values of an IpConfig, cleared when DHCP is enabled
+CLEARED_STATIC_IP_CONFIG = {
+    'StaticIp': None,
+    'SubnetMask': None,
+    'Gateway': None,
+    'PrimaryDns': None,
+    'SecondaryDns': None
+}
+# Template copied into NICs exported without an IpConfig
+EMPTY_IP_CONFIG = {**CLEARED_STATIC_IP_CONFIG, 'IsDhcp': False}
+
+def get_ip_config(hypervisor: Dict) -> Dict:
+    """Return the IpConfig of a NIC hypervisor section, creating an empty one if missing."""
+    ip_config = hypervisor.get('IpConfig')
+    # Exports may carry "IpConfig": null, so setdefault alone is not enough
+    if not ip_config:
+        ip_config = hypervisor['IpConfig'] = dict(EMPTY_IP_CONFIG)
+    return ip_config
+
+def set_should_replace_ip_configuration(hypervisor: Dict, value):
+    hypervisor['ShouldReplaceIpConfiguration'] = normalize_value(value) == 'true'
+
+def set_network(hypervisor: Dict, value):
+    hypervisor['NetworkIdentifier'] = value
+
+def set_dhcp(hypervisor: Dict, value):
+    ip_config = get_ip_config(hypervisor)
+    ip_config['IsDhcp'] = normalize_value(value) == 'true'
+    # If DHCP is enabled, clear other IP settings
+    if ip_config['IsDhcp']:
+        ip_config.update(CLEARED_STATIC_IP_CONFIG)
+
+def ip_config_setter(key: str, default=None):
+    """Return a setter storing a CSV value under IpConfig[key], using default for empty values."""
+    def setter(hypervisor: Dict, value):
+        get_ip_config(hypervisor)[key] = value if value else default
+    return setter
+
+def nic_side_setters(prefix: str, section: str) -> Dict[str, Tuple]:
+    """Map the CSV columns of one NIC side to (NIC section, setter) pairs."""
+    return {
+        f'{prefix} Network': (section, set_network),
+        f'{prefix} ShouldReplaceIpConfiguration': (section, set_should_replace_ip_configuration),
+        f'{prefix} DHCP': (section, set_dhcp),
+        f'{prefix} IP': (section, ip_config_setter('StaticIp')),
+        f'{prefix} Subnet': (section, ip_config_setter('SubnetMask', '255.255.255.0')),
+        f'{prefix} Gateway': (section, ip_config_setter('Gateway')),
+        f'{prefix} DNS1': (section, ip_config_setter('PrimaryDns')),
+        f'{prefix} DNS2': (section, ip_config_setter('SecondaryDns')),
+    }
+
+# CSV column -> (NIC section, setter) used by apply_vpg_changes
+NIC_FIELD_SETTERS = {
+    **nic_side_setters('Failover', 'Failover'),
+    **nic_side_setters('Failover Test', 'FailoverTest'),
+}
+
+def nic_key(vpg_name: str, vm_id: str, nic_id: str) -> str:
+    """Return the lookup key of a NIC row."""
+    return f"{vpg_name}\0{vm_id}\0{nic_id}"
+
+def build_current_lookup(current: List[Dict]) -> Tuple[Dict[str, Dict], Dict[str, Dict]]:
+    """Index current NIC rows by nic_key, returning the raw rows and their normalized values."""
     current_lookup = {
-        (row['VPG Name'], row['VM Identifier'], row['NIC Identifier']): row
+        nic_key(row['VPG Name'], row['VM Identifier'], row['NIC Identifier']): row
         for row in current
     }
+    current_norm = {
+        key: {field: normalize_value(value) for field, value in row.items()}
+        for key, row in current_lookup.items()
+    }
+    return current_lookup, current_norm
+
+def compare_settings(vm_name_index: Dict[str, str], current: List[Dict], updated: Iterator[List[str]]) -> List[Dict]:
+    """Compare current and updated settings and return changes.
+
+    updated yields the CSV header first and then one list of values per row.
+    """
+    changes = []
+    
+    current_lookup, current_norm = build_current_lookup(current)
+    
+    # Resolve CSV column positions once from the header
+    header = next(updated, None)
+    if not header:
+        return changes
+    width = len(header)
+    column = {name: i for i, name in enumerate(header)}
+    vpg_col, vm_col, nic_col = column['VPG Name'], column['VM Identifier'], column['NIC Identifier']
+    compared_columns = [
+        (i, field) for i, field in enumerate(header)
+        if field not in KEY_COLUMNS
+    ]
+    validated_columns = [
+        (prefix, [column[k] for k in ip_keys if k in column], column.get(dhcp_key), column.get(should_replace_key))
+        for prefix, ip_keys, dhcp_key, should_replace_key in IP_SETTINGS_KEYS
+    ]
     
-    def validate_dhcp_settings(client, row: Dict, vpg_name: str, vm_id: str, nic_id: str):
+    def validate_dhcp_settings(row: List[str], vpg_name: str, vm_id: str, nic_id: str):
         """Validate that DHCP and IP settings are not conflicting."""
-        vm_name = client.vms.list_vms(vm_identifier=vm_id).get('VmName')
+        vm_name = vm_name_index.get(vm_id, vm_id)
 
-        def validate_ip_settings(prefix: str):
-            should_replace = normalize_value(row.get(f'{prefix} ShouldReplaceIpConfiguration', '')) == 'true'
-            dhcp = normalize_value(row.get(f'{prefix} DHCP', '')) == 'true'
-            has_static_ip = any(row.get(f'{prefix} {field}') for field in ['IP', 'Subnet', 'Gateway', 'DNS1', 'DNS2'])
+        # Validate both failover and failover test settings
+        for prefix, ip_cols, dhcp_col, should_replace_col in validated_columns:
+            should_replace = should_replace_col is not None and normalize_value(row[should_replace_col]) == 'true'
+            dhcp = dhcp_col is not None and normalize_value(row[dhcp_col]) == 'true'
+            has_static_ip = any(row[i] for i in ip_cols)
 
             if not should_replace and (dhcp or has_static_ip):
                 raise ValueError(
@@ -214,57 +349,49 @@ def compare_settings(client, current: List[Dict], updated: List[Dict]) -> List[D
                     f"Cannot have {prefix} DHCP=True and static IP settings. "
                     f"Please remove static IP settings or set DHCP=False."
                 )
-
-        # Validate both failover and failover test settings
-        validate_ip_settings('Failover')
-        validate_ip_settings('Failover Test')
     
     for updated_row in updated:
-        key = (updated_row['VPG Name'], updated_row['VM Identifier'], updated_row['NIC Identifier'])
+        if not updated_row:
+            continue
+        # Short rows are padded the same way DictReader fills missing values
+        if len(updated_row) < width:
+            updated_row += [''] * (width - len(updated_row))
+        vpg_name, vm_id, nic_id = updated_row[vpg_col], updated_row[vm_col], updated_row[nic_col]
+        key = nic_key(vpg_name, vm_id, nic_id)
         
         # Validate DHCP settings before processing changes
-        validate_dhcp_settings(
-            client,
-            updated_row,
-            updated_row['VPG Name'],
-            updated_row['VM Identifier'],
-            updated_row['NIC Identifier']
-        )
+        validate_dhcp_settings(updated_row, vpg_name, vm_id, nic_id)
         
         if key in current_lookup:
             current_row = current_lookup[key]
+            current_norm_row = current_norm[key]
             row_changes = {}
             
             # Compare each field
-            for field in updated_row:
-                if field in ['VPG Name', 'VM Identifier', 'NIC Identifier']:
-                    continue
-                
-                current_value = normalize_value(current_row.get(field, ''))
-                updated_value = normalize_value(updated_row.get(field, ''))
-                
+            for i, field in compared_columns:
+                updated_value = updated_row[i]
                 # Only include the change if the values are different after normalization
-                if current_value != updated_value:
+                if current_norm_row.get(field, '') != normalize_value(updated_value):
                     row_changes[field] = {
                         'current': current_row.get(field, ''),
-                        'updated': updated_row.get(field, '')
+                        'updated': updated_value
                     }
             
             if row_changes:
-                vm_name = client.vms.list_vms(vm_identifier=updated_row['VM Identifier']).get('VmName')
+                vm_name = vm_name_index.get(vm_id, vm_id)
                 logging.info(f"compare_settings: vm_name {vm_name}")
 
                 changes.append({
-                    'VPG Name': updated_row['VPG Name'],
-                    'VM Identifier': updated_row['VM Identifier'],
-                    'NIC Identifier': updated_row['NIC Identifier'],
+                    'VPG Name': vpg_name,
+                    'VM Identifier': vm_id,
+                    'NIC Identifier': nic_id,
                     'VM Name': vm_name,
                     'changes': row_changes
                 })
     
     return changes
 
-def display_changes(client, changes: List[Dict]):
+def display_changes(vm_name_index: Dict[str, str], changes: List[Dict]):
     """Display changes in a user-friendly format."""
     if not changes:
         print("\nNo changes found in the CSV file.")
@@ -287,57 +414,84 @@ def display_changes(client, changes: List[Dict]):
     print("\nThe following changes will be applied:")
     print("=" * 80)
     
+    # compare_settings only reports fields whose values differ, so every entry is printed
     for vpg_name, vm_changes in vpg_changes.items():
-        # Skip VPGs with no actual changes
-        has_vpg_changes = False
-        for vm_id, nic_changes in vm_changes.items():
-            for nic_id, changes in nic_changes.items():
-                if any(values['current'] != values['updated'] for values in changes.values()):
-                    has_vpg_changes = True
-                    break
-            if has_vpg_changes:
-                break
-        
-        if not has_vpg_changes:
-            continue
-            
         print(f"\nVPG: {vpg_name}")
         print("-" * 40)
         
         for vm_id, nic_changes in vm_changes.items():
-            # Skip VMs with no actual changes
-            has_vm_changes = False
-            for nic_id, changes in nic_changes.items():
-                if any(values['current'] != values['updated'] for values in changes.values()):
-                    has_vm_changes = True
-                    break
-            
-            if not has_vm_changes:
-                continue
-
-            vm_name = client.vms.list_vms(vm_identifier=vm_id).get('VmName')
+            vm_name = vm_name_index.get(vm_id, vm_id)
             print(f"  VM name: {vm_name}, VM ID: {vm_id}")
             
             for nic_id, changes in nic_changes.items():
-                # Skip NICs with no actual changes
-                if not any(values['current'] != values['updated'] for values in changes.values()):
-                    continue
-                    
                 print(f"    NIC: {nic_id}")
                 print("    Changes:")
                 for field, values in changes.items():
-                    # Only show fields that have actual changes
-                    if values['current'] != values['updated']:
-                        print(f"      {field}:")
-                        print(f"        Current: {values['current']}")
-                        print(f"        Updated: {values['updated']}")
+                    print(f"      {field}:")
+                    print(f"        Current: {values['current']}")
+                    print(f"        Updated: {values['updated']}")
                 print()
     
     print("=" * 80)
     print(f"\nTotal changes: {len(changes)} NIC(s) across {len(vpg_changes)} VPG(s)")
 
-def update_vpg_settings(client: ZVMLClient, changes: List[Dict]):
-    """Update VPG settings based on changes."""
+def apply_vpg_changes(client: ZVMLClient, vpg_name: str, vpg_identifier: str, vpg_change_list: List[Dict]):
+    """Apply the NIC changes of a single VPG and commit them."""
+    logging.info(f"apply_vpg_changes: Processing VPG: {vpg_name}")
+    log_json_debug("apply_vpg_changes: VPG change list:", vpg_change_list)
+    
+    # Create new VPG settings
+    vpg_settings_id = client.vpgs.create_vpg_settings(vpg_identifier=vpg_identifier)
+    vpg_settings = client.vpgs.get_vpg_settings_by_id(vpg_settings_id)
+    log_json_debug("apply_vpg_changes: VPG settings:", vpg_settings)
+
+    # Index NICs by (VM identifier, NIC identifier) once instead of scanning per change
+    nic_index = {
+        (v['VmIdentifier'], n['NicIdentifier']): (v, n)
+        for v in vpg_settings['Vms']
+        for n in v['Nics']
+    }
+
+    # Process each NIC change
+    for change in vpg_change_list:
+        vm_id = change['VM Identifier']
+        nic_id = change['NIC Identifier']
+        vm_name = change['VM Name']
+        logging.info(f"apply_vpg_changes: Processing NIC: {nic_id} for VM: {vm_name} VM ID: {vm_id}")
+        # Find the VM and NIC in the settings
+        vm, nic = nic_index.get((vm_id, nic_id), (None, None))
+        if not nic:
+            logging.error(f"apply_vpg_changes: NIC {nic_id} of VM {vm_id} not found in VPG {vpg_name}")
+            continue
+        log_json_debug(f"apply_vpg_changes: Found NIC: {nic_id} in VM {vm_name} VPG {vpg_name} nic=", nic)
+        
+        # Initialize structures if needed
+        if not nic.get('Failover'):
+            nic['Failover'] = {'Hypervisor': {}}
+        if not nic.get('FailoverTest'):
+            nic['FailoverTest'] = {'Hypervisor': {}}
+
+        # Process each change for this NIC
+        for field, values in change['changes'].items():
+            field_setter = NIC_FIELD_SETTERS.get(field)
+            if field_setter:
+                section, setter = field_setter
+                setter(nic[section]['Hypervisor'], values['updated'])
+
+        log_json_debug(f"apply_vpg_changes: Updated NIC structure: VPG {vpg_name} VM {vm_name} NIC {nic_id} nic=", nic)
+    
+    # Update VPG settings with all changes
+    logging.info(f"apply_vpg_changes: Updating VPG settings for {vpg_name}")
+    log_json_debug("apply_vpg_changes: VPG settings:", vpg_settings)
+    client.vpgs.update_vpg_settings(vpg_settings_id, vpg_settings)
+    
+    # Commit changes
+    logging.info(f"apply_vpg_changes: Committing changes for VPG: {vpg_name}")
+    client.vpgs.commit_vpg(vpg_settings_id, vpg_name, sync=False)
+    logging.info(f"apply_vpg_changes: Successfully updated VPG: {vpg_name}")
+
+def update_vpg_settings(client: ZVMLClient, changes: List[Dict], max_workers: int = 8) -> List[str]:
+    """Update VPG settings based on changes. Returns the names of the VPGs that failed to update."""
     # Group changes by VPG
     vpg_changes = {}
     for change in changes:
@@ -346,172 +500,30 @@ def update_vpg_settings(client: ZVMLClient, changes: List[Dict]):
             vpg_changes[vpg_name] = []
         vpg_changes[vpg_name].append(change)
     
-    # Process each VPG
-    for vpg_name, vpg_change_list in vpg_changes.items():
-        logging.info(f"update_vpg_settings: Processing VPG: {vpg_name}")
-        logging.info(f"update_vpg_settings: VPG change list: {json.dumps(vpg_change_list, indent=4)}")
-        
-        # Get VPG identifier
-        vpg_info = client.vpgs.list_vpgs(vpg_name=vpg_name)
-        if not vpg_info:
+    # Resolve all VPG identifiers with a single list call instead of one call per VPG
+    vpg_identifiers = {vpg['VpgName']: vpg['VpgIdentifier'] for vpg in client.vpgs.list_vpgs()}
+    failed_vpgs = []
+    for vpg_name in vpg_changes:
+        if vpg_name not in vpg_identifiers:
             logging.error(f"update_vpg_settings: VPG {vpg_name} not found")
-            continue
-        vpg_identifier = vpg_info['VpgIdentifier']
-        
-        # Create new VPG settings
-        vpg_settings_id = client.vpgs.create_vpg_settings(vpg_identifier=vpg_identifier)
-        vpg_settings = client.vpgs.get_vpg_settings_by_id(vpg_settings_id)
-        logging.info(f"update_vpg_settings: VPG settings: {json.dumps(vpg_settings, indent=4)}")
-
-        # Process each NIC change
-        for change in vpg_change_list:
-            vm_id = change['VM Identifier']
-            nic_id = change['NIC Identifier']
-            vm_name = change['VM Name']
-            logging.info(f"update_vpg_settings: Processing NIC: {nic_id} for VM: {vm_name} VM ID: {vm_id}")
-            # Find the VM and NIC in the settings
-            vm = None
-            for v in vpg_settings['Vms']:
-                if v['VmIdentifier'] == vm_id:
-                    vm = v
-                    # logging.info(f"update_vpg_settings: Found VM: {vm_id} in VPG {vpg_name} vm={json.dumps(vm, indent=4)}")
-                    break
-            
-            if not vm:
-                logging.error(f"update_vpg_settings: VM {vm_id} not found in VPG {vpg_name}")
-                continue
-            
-            # Find the NIC
-            nic = None
-            for n in vm['Nics']:
-                if n['NicIdentifier'] == nic_id:
-                    nic = n
-                    logging.info(f"update_vpg_settings: Found NIC: {nic_id} in VM {vm_name} VPG {vpg_name} nic={json.dumps(nic, indent=4)}") 
-                    break
-            
-            if not nic:
-                logging.error(f"update_vpg_settings: NIC {nic_id} not found in VM {vm_id}")
-                continue
-            
-            # Initialize structures if needed
-            if not nic.get('Failover'):
-                nic['Failover'] = {'Hypervisor': {}}
-            if not nic.get('FailoverTest'):
-                nic['FailoverTest'] = {'Hypervisor': {}}
-
-            # Process each change for this NIC
-            for field, values in change['changes'].items():
-                # Handle Failover settings
-                if field in ['Failover Network', 'Failover ShouldReplaceIpConfiguration', 'Failover IP', 
-                           'Failover Subnet', 'Failover Gateway', 'Failover DNS1', 'Failover DNS2', 
-                           'Failover DHCP']:
-                    if field == 'Failover ShouldReplaceIpConfiguration':
-                        nic['Failover']['Hypervisor']['ShouldReplaceIpConfiguration'] = normalize_value(values['updated']) == 'true'
-                    elif field == 'Failover Network':
-                        nic['Failover']['Hypervisor']['NetworkIdentifier'] = values['updated']
-                    elif field == 'Failover DHCP':
-                        if not nic['Failover']['Hypervisor'].get('IpConfig'):
-                            nic['Failover']['Hypervisor']['IpConfig'] = {
-                                'StaticIp': None,
-                                'SubnetMask': None,
-                                'Gateway': None,
-                                'PrimaryDns': None,
-                                'SecondaryDns': None,
-                                'IsDhcp': False
-                            }
-                        nic['Failover']['Hypervisor']['IpConfig']['IsDhcp'] = normalize_value(values['updated']) == 'true'
-                        # If DHCP is enabled, clear other IP settings
-                        if normalize_value(values['updated']) == 'true':
-                            nic['Failover']['Hypervisor']['IpConfig'].update({
-                                'StaticIp': None,
-                                'SubnetMask': None,
-                                'Gateway': None,
-                                'PrimaryDns': None,
-                                'SecondaryDns': None
-                            })
-                    elif field in ['Failover IP', 'Failover Subnet', 'Failover Gateway', 
-                                 'Failover DNS1', 'Failover DNS2']:
-                        if not nic['Failover']['Hypervisor'].get('IpConfig'):
-                            nic['Failover']['Hypervisor']['IpConfig'] = {
-                                'StaticIp': None,
-                                'SubnetMask': None,
-                                'Gateway': None,
-                                'PrimaryDns': None,
-                                'SecondaryDns': None,
-                                'IsDhcp': False
-                            }
-                        if field == 'Failover IP':
-                            nic['Failover']['Hypervisor']['IpConfig']['StaticIp'] = values['updated'] if values['updated'] else None
-                        elif field == 'Failover Subnet':
-                            nic['Failover']['Hypervisor']['IpConfig']['SubnetMask'] = values['updated'] if values['updated'] else '255.255.255.0'
-                        elif field == 'Failover Gateway':
-                            nic['Failover']['Hypervisor']['IpConfig']['Gateway'] = values['updated'] if values['updated'] else None
-                        elif field == 'Failover DNS1':
-                            nic['Failover']['Hypervisor']['IpConfig']['PrimaryDns'] = values['updated'] if values['updated'] else None
-                        elif field == 'Failover DNS2':
-                            nic['Failover']['Hypervisor']['IpConfig']['SecondaryDns'] = values['updated'] if values['updated'] else None
-
-                # Handle Failover Test settings
-                elif field in ['Failover Test Network', 'Failover Test ShouldReplaceIpConfiguration', 
-                             'Failover Test IP', 'Failover Test Subnet', 'Failover Test Gateway', 
-                             'Failover Test DNS1', 'Failover Test DNS2', 'Failover Test DHCP']:
-                    if field == 'Failover Test ShouldReplaceIpConfiguration':
-                        nic['FailoverTest']['Hypervisor']['ShouldReplaceIpConfiguration'] = normalize_value(values['updated']) == 'true'
-                    elif field == 'Failover Test Network':
-                        nic['FailoverTest']['Hypervisor']['NetworkIdentifier'] = values['updated']
-                    elif field == 'Failover Test DHCP':
-                        if not nic['FailoverTest']['Hypervisor'].get('IpConfig'):
-                            nic['FailoverTest']['Hypervisor']['IpConfig'] = {
-                                'StaticIp': None,
-                                'SubnetMask': None,
-                                'Gateway': None,
-                                'PrimaryDns': None,
-                                'SecondaryDns': None,
-                                'IsDhcp': False
-                            }
-                        nic['FailoverTest']['Hypervisor']['IpConfig']['IsDhcp'] = normalize_value(values['updated']) == 'true'
-                        # If DHCP is enabled, clear other IP settings
-                        if normalize_value(values['updated']) == 'true':
-                            nic['FailoverTest']['Hypervisor']['IpConfig'].update({
-                                'StaticIp': None,
-                                'SubnetMask': None,
-                                'Gateway': None,
-                                'PrimaryDns': None,
-                                'SecondaryDns': None
-                            })
-                    elif field in ['Failover Test IP', 'Failover Test Subnet', 'Failover Test Gateway', 
-                                 'Failover Test DNS1', 'Failover Test DNS2']:
-                        if not nic['FailoverTest']['Hypervisor'].get('IpConfig'):
-                            nic['FailoverTest']['Hypervisor']['IpConfig'] = {
-                                'StaticIp': None,
-                                'SubnetMask': None,
-                                'Gateway': None,
-                                'PrimaryDns': None,
-                                'SecondaryDns': None,
-                                'IsDhcp': False
-                            }
-                        if field == 'Failover Test IP':
-                            nic['FailoverTest']['Hypervisor']['IpConfig']['StaticIp'] = values['updated'] if values['updated'] else None
-                        elif field == 'Failover Test Subnet':
-                            nic['FailoverTest']['Hypervisor']['IpConfig']['SubnetMask'] = values['updated'] if values['updated'] else '255.255.255.0'
-                        elif field == 'Failover Test Gateway':
-                            nic['FailoverTest']['Hypervisor']['IpConfig']['Gateway'] = values['updated'] if values['updated'] else None
-                        elif field == 'Failover Test DNS1':
-                            nic['FailoverTest']['Hypervisor']['IpConfig']['PrimaryDns'] = values['updated'] if values['updated'] else None
-                        elif field == 'Failover Test DNS2':
-                            nic['FailoverTest']['Hypervisor']['IpConfig']['SecondaryDns'] = values['updated'] if values['updated'] else None
-
-            logging.info(f"update_vpg_settings: Updated NIC structure: VPG {vpg_name} VM {vm_name} NIC {nic_id} nic={json.dumps(nic, indent=4)}")
-        
-        # Update VPG settings with all changes
-        logging.info(f"update_vpg_settings: Updating VPG settings for {vpg_name}")
-        logging.info(f"update_vpg_settings: VPG settings: {json.dumps(vpg_settings, indent=4)}")
-        client.vpgs.update_vpg_settings(vpg_settings_id, vpg_settings)
-        
-        # Commit changes
-        logging.info(f"update_vpg_settings: Committing changes for VPG: {vpg_name}")
-        client.vpgs.commit_vpg(vpg_settings_id, vpg_name, sync=False)
-        logging.info(f"update_vpg_settings: Successfully updated VPG: {vpg_name}")
+            failed_vpgs.append(vpg_name)
+    
+    # Process VPGs in parallel, each VPG is updated and committed independently
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(apply_vpg_changes, client, vpg_name, vpg_identifiers[vpg_name], vpg_change_list): vpg_name
+            for vpg_name, vpg_change_list in vpg_changes.items()
+            if vpg_name in vpg_identifiers
+        }
+        for future in as_completed(futures):
+            vpg_name = futures[future]
+            try:
+                future.result()
+            except Exception:
+                logging.exception(f"update_vpg_settings: Failed to update VPG: {vpg_name}")
+                failed_vpgs.append(vpg_name)
+    
+    return failed_vpgs
 
 def main():
     parser = argparse.ArgumentParser(description="Import VPG settings from CSV")
@@ -531,30 +543,33 @@ def main():
         vpg_names = None
         if args.vpg_names:
             vpg_names = [name.strip() for name in args.vpg_names.split(',')]
-            logging.info(f"Updating settings for VPGs: {json.dumps(vpg_names, indent=4)}")
+            logging.info(f"Updating settings for VPGs: {vpg_names}")
         else:
             logging.info("No VPG names provided, will update all VPGs in the CSV file")
 
-        # Read updated settings from CSV
-        print("\nReading updated settings from CSV...")
-        updated_settings = read_csv_settings(args.csv_file)
-        # logging.info(f"Updated settings: {updated_settings}")
+        # Updated settings are streamed from the CSV while comparing, the header is read right
+        # away so a missing or unreadable file is reported before the slow settings export
+        updated_settings = iter_csv_settings(args.csv_file)
+        updated_settings = itertools.chain([next(updated_settings, None)], updated_settings)
         
         # Get current settings
         print("Getting current VPG settings...")
-        timestamp, current_settings = get_current_settings(client, vpg_names)
+        timestamp, current_settings, vm_name_index = get_current_settings(client, vpg_names)
+        # Only query the ZVM for VM names the export did not carry
+        if any(vm_name == vm_id for vm_id, vm_name in vm_name_index.items()):
+            vm_name_index.update(build_vm_name_index(client))
         
         # Compare settings
-        print("Comparing settings...")
+        print("Comparing settings with the CSV file...")
         try:
-            changes = compare_settings(client, current_settings, updated_settings)
+            changes = compare_settings(vm_name_index, current_settings, updated_settings)
         except ValueError as e:
             print(f"\nError: {str(e)}")
             print("\nPlease fix the configuration in the CSV file and try again.")
             return
         
         # Display changes
-        display_changes(client, changes)
+        display_changes(vm_name_index, changes)
         
         if not changes:
             print("\nNo changes to apply.")
@@ -573,7 +588,10 @@ def main():
         
         # Apply changes
         print("\nApplying changes...")
-        update_vpg_settings(client, changes)
+        failed_vpgs = update_vpg_settings(client, changes)
+        if failed_vpgs:
+            print(f"\nFailed to apply changes to VPG(s): {', '.join(failed_vpgs)}")
+            sys.exit(1)
         print("\nAll changes have been applied successfully.")
 
     except Exception as e:
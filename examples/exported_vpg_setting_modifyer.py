@@ -16,63 +16,146 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 import json
+import mmap
+import os
+import re
+import shutil
 import argparse
 import sys
-from typing import Dict, Any, List, Tuple
+from functools import partial
+from typing import Dict, Any, Callable, List, Set, Tuple
 
-def modify_vpg_settings(json_data: Dict[str, Any], modifications: List[Tuple[str, str, str]]) -> None:
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# VPG names starting with OLD_NAME_PREFIX are renamed to start with NEW_NAME_PREFIX
+OLD_NAME_PREFIX = 'dr-'
+NEW_NAME_PREFIX = 'adr-'
+
+# A --modifications argument, field_path:new_value:level
+MODIFICATION_RE = re.compile(r'([^:]*):([^:]*):(vpg|vm)')
+
+# Supported field paths of each scope, as the keys leading to the modified dict and the key set in it
+VPG_FIELDS = {
+    'Basic.RecoverySiteIdentifier': (('Basic',), 'RecoverySiteIdentifier'),
+    'Recovery.DefaultHostIdentifier': (('Recovery',), 'DefaultHostIdentifier'),
+    'Networks.Failover.PublicCloud.SubnetIdentifier': (('Networks', 'Failover', 'PublicCloud'), 'SubnetIdentifier'),
+    'Networks.FailoverTest.PublicCloud.SubnetIdentifier': (('Networks', 'FailoverTest', 'PublicCloud'), 'SubnetIdentifier'),
+    'Recovery.DefaultDatastoreIdentifier': (('Recovery',), 'DefaultDatastoreIdentifier')
+}
+VM_FIELDS = {
+    'Vms[].Recovery.PublicCloud.Failover.VirtualNetworkIdentifier': (('Recovery', 'PublicCloud', 'Failover'), 'VirtualNetworkIdentifier'),
+    'Vms[].Recovery.PublicCloud.FailoverTest.VirtualNetworkIdentifier': (('Recovery', 'PublicCloud', 'FailoverTest'), 'VirtualNetworkIdentifier')
+}
+# VPG level subnet modifications, applied to every NIC as well
+NIC_FIELDS = {
+    'Networks.Failover.PublicCloud.SubnetIdentifier': (('Failover', 'PublicCloud'), 'SubnetIdentifier'),
+    'Networks.FailoverTest.PublicCloud.SubnetIdentifier': (('FailoverTest', 'PublicCloud'), 'SubnetIdentifier')
+}
+
+# Applies one modification to the VPG, VM or NIC dict it is called with
+# Returns whether the dict was changed
+Setter = Callable[[Dict[str, Any]], bool]
+
+# Marks a missing key in dict.pop
+MISSING = object()
+
+def set_by_path(root: Dict[str, Any], path: Tuple[str, ...], leaf: str, value: str) -> bool:
+    """Set root[path[0]]...[path[-1]][leaf] to value, returns whether it had a different value before."""
+    node = root
+    for key in path:
+        node = node[key]
+    changed = node.get(leaf, MISSING) != value
+    node[leaf] = value
+    return changed
+
+def load_json(file_name: str) -> Dict[str, Any]:
+    """Read a JSON file, parsing it with orjson when it is installed."""
+    if orjson is not None:
+        with open(file_name, 'rb') as f:
+            # Empty files cannot be mapped, orjson reports them as invalid JSON
+            if os.fstat(f.fileno()).st_size == 0:
+                return orjson.loads(b'')
+            # Parse straight from the mapped pages instead of first reading the file into a bytes copy
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+                return orjson.loads(view)
+    with open(file_name, 'r') as f:
+        return json.load(f)
+
+def dump_json(json_data: Dict[str, Any], file_name: str) -> None:
+    """Write json_data to a JSON file indented by two spaces, serializing it with orjson when it is installed."""
+    if orjson is not None:
+        with open(file_name, 'wb') as f:
+            f.write(orjson.dumps(json_data, option=orjson.OPT_INDENT_2))
+        return
+    # json.dump streams the encoder chunks to the file, the large buffer batches them into few writes
+    with open(file_name, 'w', buffering=1 << 20) as f:
+        json.dump(json_data, f, indent=2)
+
+def build_setters(modifications: List[Tuple[str, str, str]], level: str,
+                  fields: Dict[str, Tuple[Tuple[str, ...], str]]) -> List[Setter]:
+    """
+    Return a setter for each modification of the given level with a field path in fields.
+    A setter applies the new value to the VPG, VM or NIC it is called with, unknown field paths are ignored.
+    """
+    return [
+        partial(set_by_path, path=fields[field_path][0], leaf=fields[field_path][1], value=new_value)
+        for field_path, new_value, mod_level in modifications
+        if mod_level == level and field_path in fields
+    ]
+
+def modify_vpg(vpg: Dict[str, Any], vpg_setters: List[Setter], vm_setters: List[Setter], nic_setters: List[Setter]) -> bool:
+    """
+    Rename a VPG, apply the setters to it, its VMs and their NICs, and remove the Preseed of its volumes.
+    Returns whether anything in it was changed.
+    """
+    changed = False
+    # Check and modify VPG name
+    basic = vpg.get('Basic') or {}
+    name = basic.get('Name')
+    if name is not None:
+        if not name.startswith(OLD_NAME_PREFIX):
+            print(f"Warning: VPG name '{name}' does not start with '{OLD_NAME_PREFIX}'")
+        else:
+            basic['Name'] = NEW_NAME_PREFIX + name[len(OLD_NAME_PREFIX):]  # Replace 'dr-' with 'adr-'
+            changed = True
+
+    for setter in vpg_setters:
+        changed |= setter(vpg)
+
+    for vm in vpg.get('Vms', ()):
+        for setter in vm_setters:
+            changed |= setter(vm)
+        
+        # The NICs are not visited without subnet modifications
+        if nic_setters:
+            for nic in vm.get('Nics', ()):
+                for setter in nic_setters:
+                    changed |= setter(nic)
+        
+        # Remove Preseed field from volumes if it exists
+        for volume in vm.get('Volumes', ()):
+            if volume.pop('Preseed', MISSING) is not MISSING:
+                changed = True
+
+    return changed
+
+def modify_vpg_settings(json_data: Dict[str, Any], modifications: List[Tuple[str, str, str]]) -> Set[int]:
     """
     Modify VPG settings based on the list of modifications
     Each modification is a tuple of (field_path, new_value, level)
+    Returns the indexes of the VPGs that were changed.
     """
-    for vpg in json_data['ExportedVpgSettingsApi']:
-        # Check and modify VPG name
-        if 'Basic' in vpg and 'Name' in vpg['Basic']:
-            name = vpg['Basic']['Name']
-            if not name.startswith('dr-'):
-                print(f"Warning: VPG name '{name}' does not start with 'dr-'")
-            else:
-                vpg['Basic']['Name'] = 'adr-' + name[3:]  # Replace 'dr-' with 'adr-'
-
-        # Handle VPG level modifications
-        for field_path, new_value, level in modifications:
-            if level == 'vpg':
-                if field_path == 'Basic.RecoverySiteIdentifier':
-                    vpg['Basic']['RecoverySiteIdentifier'] = new_value
-                elif field_path == 'Recovery.DefaultHostIdentifier':
-                    vpg['Recovery']['DefaultHostIdentifier'] = new_value
-                elif field_path == 'Networks.Failover.PublicCloud.SubnetIdentifier':
-                    vpg['Networks']['Failover']['PublicCloud']['SubnetIdentifier'] = new_value
-                elif field_path == 'Networks.FailoverTest.PublicCloud.SubnetIdentifier':
-                    vpg['Networks']['FailoverTest']['PublicCloud']['SubnetIdentifier'] = new_value
-                elif field_path == 'Recovery.DefaultDatastoreIdentifier':
-                    vpg['Recovery']['DefaultDatastoreIdentifier'] = new_value
-
-        # Handle VM level modifications
-        if 'Vms' in vpg:
-            for vm in vpg['Vms']:
-                for field_path, new_value, level in modifications:
-                    if level == 'vm':
-                        if field_path == 'Vms[].Recovery.PublicCloud.Failover.VirtualNetworkIdentifier':
-                            vm['Recovery']['PublicCloud']['Failover']['VirtualNetworkIdentifier'] = new_value
-                        elif field_path == 'Vms[].Recovery.PublicCloud.FailoverTest.VirtualNetworkIdentifier':
-                            vm['Recovery']['PublicCloud']['FailoverTest']['VirtualNetworkIdentifier'] = new_value
-                
-                # Update NIC level SubnetIdentifier
-                if 'Nics' in vm:
-                    for nic in vm['Nics']:
-                        for field_path, new_value, level in modifications:
-                            if level == 'vpg':
-                                if field_path == 'Networks.Failover.PublicCloud.SubnetIdentifier':
-                                    nic['Failover']['PublicCloud']['SubnetIdentifier'] = new_value
-                                elif field_path == 'Networks.FailoverTest.PublicCloud.SubnetIdentifier':
-                                    nic['FailoverTest']['PublicCloud']['SubnetIdentifier'] = new_value
-                
-                # Remove Preseed field from volumes if it exists
-                if 'Volumes' in vm:
-                    for volume in vm['Volumes']:
-                        if 'Preseed' in volume:
-                            del volume['Preseed']
+    # Resolve the modifications into setters once, then visit every VPG, VM and NIC a single time
+    vpg_setters = build_setters(modifications, 'vpg', VPG_FIELDS)
+    vm_setters = build_setters(modifications, 'vm', VM_FIELDS)
+    # The VPG level subnet modifications are applied to every NIC as well
+    nic_setters = build_setters(modifications, 'vpg', NIC_FIELDS)
+
+    return {index for index, vpg in enumerate(json_data['ExportedVpgSettingsApi'])
+            if modify_vpg(vpg, vpg_setters, vm_setters, nic_setters)}
 
 def main():
     parser = argparse.ArgumentParser(description='Modify VPG settings in JSON file')
@@ -86,28 +169,30 @@ def main():
     # Parse modifications
     modifications = []
     for mod in args.modifications:
-        try:
-            field_path, new_value, level = mod.split(':')
-            if level not in ['vpg', 'vm']:
-                raise ValueError(f"Invalid level: {level}")
-            modifications.append((field_path, new_value, level))
-        except ValueError as e:
-            print(f"Error parsing modification '{mod}': {str(e)}")
+        match = MODIFICATION_RE.fullmatch(mod)
+        if not match:
+            print(f"Error parsing modification '{mod}': expected field_path:new_value:level with level vpg or vm")
             sys.exit(1)
+        modifications.append(match.groups())
     
     try:
         # Read input JSON file
-        with open(args.input_file, 'r') as f:
-            json_data = json.load(f)
+        json_data = load_json(args.input_file)
         
         # Modify the JSON data
-        modify_vpg_settings(json_data, modifications)
+        changed_vpgs = modify_vpg_settings(json_data, modifications)
         
-        # Write output JSON file
-        with open(args.output_file, 'w') as f:
-            json.dump(json_data, f, indent=2)
+        # Write output JSON file, when no VPG changed the input file is copied instead of serialized again
+        if changed_vpgs:
+            dump_json(json_data, args.output_file)
+            print(f"Successfully modified {len(changed_vpgs)} VPGs in {args.input_file}")
+        else:
+            print("No VPG settings were changed, copying the input file")
+            try:
+                shutil.copyfile(args.input_file, args.output_file)
+            except shutil.SameFileError:
+                pass
             
-        print(f"Successfully modified {len(modifications)} fields in {args.input_file}")
         print(f"Output written to {args.output_file}")
         
     except FileNotFoundError:
@@ -90,15 +90,19 @@ def main():
         if profiles:
             logging.info(f"\nFound {len(profiles)} service profiles:")
             for profile in profiles:
-                logging.info("\nService Profile Details:")
-                logging.info(f"Name: {profile.get('serviceProfileName')}")
-                logging.info(f"RPO: {profile.get('rpo')}")
-                logging.info(f"History: {profile.get('history')}")
-                logging.info(f"Max Journal Size: {profile.get('maxJournalSizeInPercent')}%")
-                logging.info(f"Test Interval: {profile.get('testInterval')}")
-                if profile.get('description'):
-                    logging.info(f"Description: {profile.get('description')}")
-                logging.info("-" * 50)
+                # One log record per profile instead of one per line
+                get = profile.get
+                details = [
+                    f"Name: {get('serviceProfileName')}",
+                    f"RPO: {get('rpo')}",
+                    f"History: {get('history')}",
+                    f"Max Journal Size: {get('maxJournalSizeInPercent')}%",
+                    f"Test Interval: {get('testInterval')}"
+                ]
+                description = get('description')
+                if description:
+                    details.append(f"Description: {description}")
+                logging.info("\nService Profile Details:\n%s\n%s", "\n".join(details), "-" * 50)
         else:
             logging.warning("No service profiles found")
 
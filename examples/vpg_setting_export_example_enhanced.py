@@ -76,19 +76,38 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 import argparse
+import atexit
 import urllib3
 import json
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from zvml import ZVMLClient
-from typing import List, Dict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import readline
+except ImportError:
+    readline = None
+
+# Answers accepted by prompt_int as a number
+NUMBER_RE = re.compile(r'[0-9]+')
+
+HISTORY_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'zvml', 'vpg-export-history')
 
 # Disable SSL warningss
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 def setup_client(args):
     """Initialize and return Zerto client"""
+    # Imported here so --help and argument errors do not pay for loading the SDK and requests
+    from zvml import ZVMLClient
     client = ZVMLClient(
         zvm_address=args.zvm_address,
         client_id=args.client_id,
@@ -97,54 +116,141 @@ def setup_client(args):
     )
     return client
 
+def dumps_indented(data: Dict) -> str:
+    """Serialize data as JSON indented by two spaces, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(data, indent=2)
+
+def save_exported_vpgs(vpgs: Iterable[Dict], file_name: str) -> List[Dict]:
+    """Write VPG settings to a JSON file under ExportedVpgSettingsApi as they are produced.
+
+    Each VPG is serialized on its own, so a streamed export is written while it is still
+    being received. Both the original and the updated settings are written this way to
+    keep the two files comparable line by line.
+
+    Returns:
+        list: The written VPG settings
+    """
+    written = []
+    with open(file_name, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.write('{\n  "ExportedVpgSettingsApi": [')
+        for vpg in vpgs:
+            f.write(',\n    ' if written else '\n    ')
+            f.write(dumps_indented(vpg).replace('\n', '\n    '))
+            written.append(vpg)
+        f.write('\n  ]\n}' if written else ']\n}')
+    return written
+
+def load_decisions(file_name: str) -> Dict[str, Dict[str, str]]:
+    """Return the replacement resource identifiers chosen in a previous run, by resource kind and missing identifier."""
+    try:
+        with open(file_name, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_decisions(decisions: Dict[str, Dict[str, str]], file_name: str) -> None:
+    """Write the chosen replacement resource identifiers, atomically replacing the previous file."""
+    temp_file_name = f"{file_name}.tmp"
+    with open(temp_file_name, 'w') as f:
+        json.dump(decisions, f, indent=2)
+    os.replace(temp_file_name, file_name)
+
+# Name and identifier keys of the peer site resources offered by select_resource
+RESOURCE_FIELDS = {
+    'datastore': ('DatastoreName', 'DatastoreIdentifier'),
+    'host': ('VirtualizationHostName', 'HostIdentifier'),
+    'folder': ('FolderName', 'FolderIdentifier'),
+    'network': ('VirtualizationNetworkName', 'NetworkIdentifier')
+}
+
+def setup_readline() -> None:
+    """Enable line editing and a persistent prompt history when readline is available."""
+    if readline is None:
+        return
+    readline.parse_and_bind('tab: complete')
+    try:
+        readline.read_history_file(HISTORY_FILE)
+    except OSError:
+        pass
+
+    def save_history():
+        try:
+            os.makedirs(os.path.dirname(HISTORY_FILE), exist_ok=True)
+            readline.write_history_file(HISTORY_FILE)
+        except OSError as e:
+            logging.debug(f"Could not save prompt history: {e}")
+
+    atexit.register(save_history)
+
+def prompt_int(prompt: str, max_n: int, quit_hint: str) -> Optional[int]:
+    """Ask for a number between 1 and max_n, completing the valid numbers on tab.
+
+    Returns:
+        int: The selected number, or None if the user entered 'q'
+    """
+    if readline is not None:
+        choices = [str(i) for i in range(1, max_n + 1)]
+        matches = []
+
+        def complete(text, state):
+            if state == 0:
+                matches[:] = [choice for choice in choices if choice.startswith(text)]
+            return matches[state] if state < len(matches) else None
+
+        readline.set_completer(complete)
+    try:
+        while True:
+            selection = input(prompt).strip()
+            if selection.lower() == 'q':
+                return None
+            if not NUMBER_RE.fullmatch(selection):
+                print(f"Please enter a valid number or 'q' to {quit_hint}.")
+                continue
+            number = int(selection)
+            if 1 <= number <= max_n:
+                return number
+            print("Invalid selection. Please try again.")
+    finally:
+        if readline is not None:
+            readline.set_completer(None)
+
 def select_resource(resource_type: str, resources: List[Dict]) -> str:
     """Let user select a resource from available options
     
     Args:
-        resource_type: Type of resource (datastore, host, folder)
+        resource_type: Type of resource (datastore, host, folder, network)
         resources: List of available resources
         
     Returns:
         str: Selected resource identifier or None if skipped
     """
-    print(f"\nAvailable {resource_type}s:")
-    for i, resource in enumerate(resources, 1):
-        if resource_type == "datastore":
-            name = resource.get('DatastoreName', 'Unknown')
-            id_key = 'DatastoreIdentifier'
-        elif resource_type == "host":
-            name = resource.get('VirtualizationHostName', 'Unknown')
-            id_key = 'HostIdentifier'
-        elif resource_type == "folder":
-            name = resource.get('FolderName', 'Unknown')
-            id_key = 'FolderIdentifier'
-        else:
-            name = 'Unknown'
-            id_key = 'Identifier'
-            
-        print(f"{i}. {name} (ID: {resource.get(id_key, 'Unknown')})")
+    if not resources:
+        logging.warning(f"No {resource_type}s available to select from")
+        return None
+    name_key, id_key = RESOURCE_FIELDS.get(resource_type, ('Name', 'Identifier'))
+    lines = [f"\nAvailable {resource_type}s:"]
+    lines.extend(
+        f"{i}. {resource.get(name_key, 'Unknown')} (ID: {resource.get(id_key, 'Unknown')})"
+        for i, resource in enumerate(resources, 1)
+    )
+    sys.stdout.write("\n".join(lines) + "\n")
     
-    while True:
-        try:
-            selection = input(f"\nSelect a {resource_type} number to replace the missing one(or 'q' to skip): ")
-            if selection.lower() == 'q':
-                return None
-            
-            selection = int(selection)
-            if 1 <= selection <= len(resources):
-                return resources[selection - 1]
-            else:
-                print("Invalid selection. Please try again.")
-        except ValueError:
-            print("Please enter a valid number or 'q' to skip.")
+    selection = prompt_int(f"\nSelect a {resource_type} number to replace the missing one(or 'q' to skip): ",
+                           len(resources), 'skip')
+    if selection is None:
+        return None
+    return resources[selection - 1].get(id_key)
 
-def check_vpg_datastore(datastore_id: str, available_datastores: List[Dict]) -> str:
+def check_vpg_datastore(datastore_id: str, available_datastores: List[Dict], available_ids: Set[str]) -> str:
     """Check if a datastore ID exists in the available datastores list.
     If not found, ask user to select a replacement.
     
     Args:
         datastore_id: The datastore identifier to check
         available_datastores: List of available datastores from the peer site
+        available_ids: Identifiers of the available datastores
         
     Returns:
         str: Original datastore ID if found, or selected replacement datastore ID
@@ -152,20 +258,21 @@ def check_vpg_datastore(datastore_id: str, available_datastores: List[Dict]) ->
     if not datastore_id:
         return None
         
-    if any(ds['DatastoreIdentifier'] == datastore_id for ds in available_datastores):
+    if datastore_id in available_ids:
         return datastore_id
         
     # If not found, ask user to select a replacement
     logging.warning(f"Datastore {datastore_id} not found in peer site")
     return select_resource("datastore", available_datastores)
 
-def check_vpg_host(host_id: str, available_hosts: List[Dict]) -> str:
+def check_vpg_host(host_id: str, available_hosts: List[Dict], available_ids: Set[str]) -> str:
     """Check if a host ID exists in the available hosts list.
     If not found, ask user to select a replacement.
     
     Args:
         host_id: The host identifier to check
         available_hosts: List of available hosts from the peer site
+        available_ids: Identifiers of the available hosts
         
     Returns:
         str: Original host ID if found, or selected replacement host ID
@@ -173,20 +280,21 @@ def check_vpg_host(host_id: str, available_hosts: List[Dict]) -> str:
     if not host_id:
         return None
         
-    if any(host['HostIdentifier'] == host_id for host in available_hosts):
+    if host_id in available_ids:
         return host_id
         
     # If not found, ask user to select a replacement
     logging.warning(f"Host {host_id} not found in peer site")
     return select_resource("host", available_hosts)
 
-def check_vpg_folder(folder_id: str, available_folders: List[Dict]) -> str:
+def check_vpg_folder(folder_id: str, available_folders: List[Dict], available_ids: Set[str]) -> str:
     """Check if a folder ID exists in the available folders list.
     If not found, ask user to select a replacement.
     
     Args:
         folder_id: The folder identifier to check
         available_folders: List of available folders from the peer site
+        available_ids: Identifiers of the available folders
         
     Returns:
         str: Original folder ID if found, or selected replacement folder ID
@@ -194,20 +302,21 @@ def check_vpg_folder(folder_id: str, available_folders: List[Dict]) -> str:
     if not folder_id:
         return None
         
-    if any(folder['FolderIdentifier'] == folder_id for folder in available_folders):
+    if folder_id in available_ids:
         return folder_id
         
     # If not found, ask user to select a replacement
     logging.warning(f"Folder {folder_id} not found in peer site")
-    return select_resource("folder", available_folders).get('FolderIdentifier')
+    return select_resource("folder", available_folders)
 
-def check_vpg_network(network_id: str, available_networks: List[Dict]) -> str:
+def check_vpg_network(network_id: str, available_networks: List[Dict], available_ids: Set[str]) -> str:
     """Check if a network ID exists in the available networks list.
     If not found, ask user to select a replacement.
     
     Args:
         network_id: The network identifier to check
         available_networks: List of available networks from the peer site
+        available_ids: Identifiers of the available networks
         
     Returns:
         str: Original network ID if found, or selected replacement network ID
@@ -215,12 +324,69 @@ def check_vpg_network(network_id: str, available_networks: List[Dict]) -> str:
     if not network_id:
         return None
         
-    if any(net['NetworkIdentifier'] == network_id for net in available_networks):
+    if network_id in available_ids:
         return network_id
         
     # If not found, ask user to select a replacement
     logging.warning(f"Network {network_id} not found in peer site")
-    return select_resource("network", available_networks).get('NetworkIdentifier')
+    return select_resource("network", available_networks)
+
+# Peer resources referenced by the settings of a VPG, a VM and a NIC, as (keys leading to
+# the settings dict, its (identifier key, resource kind) pairs), so each dict is looked up once
+VPG_RESOURCE_SETTINGS = (
+    (('Journal',), (('DatastoreIdentifier', 'datastore'),)),
+    (('Scratch',), (('DatastoreIdentifier', 'datastore'),)),
+    (('Recovery',), (('DefaultHostIdentifier', 'host'),
+                     ('DefaultDatastoreIdentifier', 'datastore'),
+                     ('DefaultFolderIdentifier', 'folder'))),
+    (('Networks', 'Failover', 'Hypervisor'), (('DefaultNetworkIdentifier', 'network'),)),
+    (('Networks', 'FailoverTest', 'Hypervisor'), (('DefaultNetworkIdentifier', 'network'),))
+)
+VM_RESOURCE_SETTINGS = (
+    (('Recovery',), (('HostIdentifier', 'host'),
+                     ('DatastoreIdentifier', 'datastore'),
+                     ('FolderIdentifier', 'folder'))),
+    (('Journal',), (('DatastoreIdentifier', 'datastore'),)),
+    (('Scratch',), (('DatastoreIdentifier', 'datastore'),))
+)
+NIC_RESOURCE_SETTINGS = (
+    (('Failover', 'Hypervisor'), (('NetworkIdentifier', 'network'),)),
+    (('FailoverTest', 'Hypervisor'), (('NetworkIdentifier', 'network'),))
+)
+
+def add_missing_references(obj: Dict, resource_settings: Tuple, available_ids: Dict[str, Set[str]],
+                           missing: Dict[str, Dict[str, List[Tuple[Dict, str]]]]) -> None:
+    """Add the references of obj to peer resources missing from available_ids to missing."""
+    for path, keys in resource_settings:
+        settings = obj
+        for name in path:
+            settings = settings[name]
+        get = settings.get
+        for key, kind in keys:
+            resource_id = get(key)
+            if resource_id and resource_id not in available_ids[kind]:
+                missing[kind].setdefault(resource_id, []).append((settings, key))
+
+def collect_missing_resources(vpgs: List[Dict], available_ids: Dict[str, Set[str]]) -> Dict[str, Dict[str, List[Tuple[Dict, str]]]]:
+    """Find the peer resources referenced by the VPG settings that do not exist on the peer site.
+    
+    Args:
+        vpgs: Exported settings of the VPGs
+        available_ids: Identifiers of the peer site resources by kind (datastore, host, folder, network)
+        
+    Returns:
+        dict: By resource kind, the (settings dict, key) references of each missing resource identifier
+    """
+    missing = {kind: {} for kind in available_ids}
+    for vpg in vpgs:
+        logging.info(f"\nProcessing VPG: {vpg['Basic']['Name']}")
+        add_missing_references(vpg, VPG_RESOURCE_SETTINGS, available_ids, missing)
+        for vm in vpg.get('Vms', []):
+            add_missing_references(vm, VM_RESOURCE_SETTINGS, available_ids, missing)
+            for nic in vm.get('Nics', []):
+                add_missing_references(nic, NIC_RESOURCE_SETTINGS, available_ids, missing)
+    
+    return missing
 
 def main():
     parser = argparse.ArgumentParser(description="Export and Import VPG settings example")
@@ -229,16 +395,21 @@ def main():
     parser.add_argument('--client_secret', required=True, help='Site 1 Keycloak client secret')
     parser.add_argument("--ignore_ssl", action="store_true", help="Ignore SSL certificate verification")
     parser.add_argument("--vpg_names", required=True, help="Comma-separated list of VPG names to process")
+    parser.add_argument("--peer_site", help="Identifier of the peer site to validate against (prompted for when there are several)")
     args = parser.parse_args()
 
     try:
         # Setup client
+        setup_readline()
         client = setup_client(args)
 
         # Split the comma-separated string and strip whitespace
         vpg_names = [name.strip() for name in args.vpg_names.split(',')]
         logging.info(f"Processing VPGs: {vpg_names}")
 
+        # VPGs of each export already looked at, re-selecting an export does not fetch them again
+        export_vpgs_cache = {}
+
         # Export selection loop
         while True:
             # List all available exports
@@ -249,37 +420,33 @@ def main():
                 sys.exit(1)
 
             # Display available exports
-            for i, export in enumerate(exports, 1):
-                print(f"{i}. Timestamp: {export.get('TimeStamp')}")
-                print(f"   Status: {export.get('Status')}")
-                print()
+            sys.stdout.write("".join(
+                f"{i}. Timestamp: {export.get('TimeStamp')}\n   Status: {export.get('Status')}\n\n"
+                for i, export in enumerate(exports, 1)
+            ))
 
             # Let user select an export
-            while True:
-                try:
-                    selection = input("\nSelect an export number to use (or 'q' to quit): ")
-                    if selection.lower() == 'q':
-                        logging.info("User chose to quit")
-                        sys.exit(0)
-                    
-                    selection = int(selection)
-                    if 1 <= selection <= len(exports):
-                        selected_export = exports[selection - 1]
-                        break
-                    else:
-                        print("Invalid selection. Please try again.")
-                except ValueError:
-                    print("Please enter a valid number or 'q' to quit.")
+            selection = prompt_int("\nSelect an export number to use (or 'q' to quit): ", len(exports), 'quit')
+            if selection is None:
+                logging.info("User chose to quit")
+                sys.exit(0)
+            selected_export = exports[selection - 1]
 
             # Get VPGs from selected export
             print("\nVPGs in selected export:")
-            export_vpgs = client.vpgs.list_vpgs_from_exported_settings(selected_export['TimeStamp'])
-            for vpg in export_vpgs:
-                print(f"- {vpg['VpgName']} (Source: {vpg['SourceSiteName']}, Target: {vpg['TargetSiteName']})")
+            timestamp = selected_export['TimeStamp']
+            if timestamp not in export_vpgs_cache:
+                export_vpgs_cache[timestamp] = client.vpgs.list_vpgs_from_exported_settings(timestamp)
+            export_vpgs = export_vpgs_cache[timestamp]
+            sys.stdout.write("".join(
+                f"- {vpg['VpgName']} (Source: {vpg['SourceSiteName']}, Target: {vpg['TargetSiteName']})\n"
+                for vpg in export_vpgs
+            ))
 
             # Compare with requested VPGs if specified
             if vpg_names:
-                missing_vpgs = [name for name in vpg_names if name not in [vpg['VpgName'] for vpg in export_vpgs]]
+                export_vpg_names = frozenset(vpg['VpgName'] for vpg in export_vpgs)
+                missing_vpgs = [name for name in vpg_names if name not in export_vpg_names]
                 if missing_vpgs:
                     print(f"\nWarning: The following requested VPGs are not in the selected export:")
                     for vpg in missing_vpgs:
@@ -304,137 +471,113 @@ def main():
                 sys.exit(0)
             break  # Exit the export selection loop if confirmed
 
-        # Get the selected export settings
-        export_settings = client.vpgs.read_exported_vpg_settings(selected_export['TimeStamp'], vpg_names)
-        
-        # Save the selected export to a file
+        # Stream the selected export settings into a file, one VPG at a time
         file_name = f"{selected_export['TimeStamp']}-original-exported-vpg-settings.json"
-        with open(file_name, 'w') as f:
-            json.dump(export_settings, f, indent=2)
+        export_settings = {'ExportedVpgSettingsApi': save_exported_vpgs(
+            client.vpgs.iter_exported_vpg_settings(selected_export['TimeStamp'], vpg_names), file_name)}
         print(f"\nSelected export saved to: {file_name}")
 
         # Get peer site resources
         virtualization_sites = client.virtualization_sites.get_virtualization_sites()
-        logging.debug(f"Virtualization Sites: {json.dumps(virtualization_sites, indent=4)}")
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug(f"Virtualization Sites: {json.dumps(virtualization_sites, indent=4)}")
 
         # Get local site ids
         local_site_identifier = client.localsite.get_local_site().get('SiteIdentifier')
         logging.info(f"Local Site ID: {local_site_identifier}")
 
-        peer_site_identifier = next((site['SiteIdentifier'] for site in virtualization_sites if site['SiteIdentifier'] != local_site_identifier), None)
+        sites_by_id = {site['SiteIdentifier']: site for site in virtualization_sites}
+        if args.peer_site:
+            if args.peer_site not in sites_by_id or args.peer_site == local_site_identifier:
+                logging.error(f"Peer site {args.peer_site} not found")
+                sys.exit(1)
+            peer_site_identifier = args.peer_site
+        else:
+            peers = [site for site_id, site in sites_by_id.items() if site_id != local_site_identifier]
+            if not peers:
+                logging.error("No peer sites found")
+                sys.exit(1)
+            if len(peers) == 1:
+                peer_site_identifier = peers[0]['SiteIdentifier']
+            else:
+                sys.stdout.write("\nAvailable peer sites:\n" + "".join(
+                    f"{i}. {site.get('VirtualizationSiteName', 'Unknown')} (ID: {site['SiteIdentifier']})\n"
+                    for i, site in enumerate(peers, 1)
+                ))
+                selection = prompt_int("\nSelect a peer site number (or 'q' to quit): ", len(peers), 'quit')
+                if selection is None:
+                    logging.info("User chose to quit")
+                    sys.exit(0)
+                peer_site_identifier = peers[selection - 1]['SiteIdentifier']
         logging.info(f"Peer Site ID: {peer_site_identifier}")
 
-        # Get peer site resources
-        peer_datastores = client.virtualization_sites.get_virtualization_site_datastores(
-            site_identifier=peer_site_identifier
-        )
-        logging.info(f"Peer Datastores: {json.dumps(peer_datastores, indent=4)}")
-
-        peer_hosts = client.virtualization_sites.get_virtualization_site_hosts(
-            site_identifier=peer_site_identifier
-        )
-        logging.info(f"Peer Hosts: {json.dumps(peer_hosts, indent=4)}")
-
-        peer_folders = client.virtualization_sites.get_virtualization_site_folders(
-            site_identifier=peer_site_identifier
-        )
-        logging.info(f"Peer Folders: {json.dumps(peer_folders, indent=4)}")
-
-        peer_networks = client.virtualization_sites.get_virtualization_site_networks(
-            site_identifier=peer_site_identifier
-        )
-        logging.info(f"Peer Networks: {json.dumps(peer_networks, indent=4)}")
-
-        # Process each VPG
-        for vpg in export_settings['ExportedVpgSettingsApi']:
-            vpg_name = vpg['Basic']['Name']
-            logging.info(f"\nProcessing VPG: {vpg_name}")
-            
-            # Check journal datastore
-            journal_ds = vpg['Journal'].get('DatastoreIdentifier')
-            new_ds = check_vpg_datastore(journal_ds, peer_datastores)
-            if new_ds:
-                vpg['Journal']['DatastoreIdentifier'] = new_ds
-            
-            # Check scratch datastore
-            scratch_ds = vpg['Scratch'].get('DatastoreIdentifier')
-            new_ds = check_vpg_datastore(scratch_ds, peer_datastores)
-            if new_ds:
-                vpg['Scratch']['DatastoreIdentifier'] = new_ds
-            
-            # Check recovery settings
-            recovery = vpg['Recovery']
-            new_host = check_vpg_host(recovery['DefaultHostIdentifier'], peer_hosts)
-            if new_host:
-                recovery['DefaultHostIdentifier'] = new_host
-            
-            new_ds = check_vpg_datastore(recovery['DefaultDatastoreIdentifier'], peer_datastores)
-            if new_ds:
-                recovery['DefaultDatastoreIdentifier'] = new_ds
-            
-            new_folder = check_vpg_folder(recovery['DefaultFolderIdentifier'], peer_folders)
-            if new_folder:
-                recovery['DefaultFolderIdentifier'] = new_folder
-            
-            # Check VPG-level network settings
-            networks = vpg['Networks']
-            # Check failover network
-            failover_net = networks['Failover']['Hypervisor'].get('DefaultNetworkIdentifier')
-            new_net = check_vpg_network(failover_net, peer_networks)
-            if new_net:
-                networks['Failover']['Hypervisor']['DefaultNetworkIdentifier'] = new_net
-            
-            # Check failover test network
-            failover_test_net = networks['FailoverTest']['Hypervisor'].get('DefaultNetworkIdentifier')
-            new_net = check_vpg_network(failover_test_net, peer_networks)
-            if new_net:
-                networks['FailoverTest']['Hypervisor']['DefaultNetworkIdentifier'] = new_net
-            
-            # Check VM-specific settings
-            for vm in vpg.get('Vms', []):
-                vm_recovery = vm['Recovery']
-                new_host = check_vpg_host(vm_recovery['HostIdentifier'], peer_hosts)
-                if new_host:
-                    vm_recovery['HostIdentifier'] = new_host
-                
-                new_ds = check_vpg_datastore(vm_recovery['DatastoreIdentifier'], peer_datastores)
-                if new_ds:
-                    vm_recovery['DatastoreIdentifier'] = new_ds
-                
-                new_folder = check_vpg_folder(vm_recovery['FolderIdentifier'], peer_folders)
-                if new_folder:
-                    vm_recovery['FolderIdentifier'] = new_folder
-                
-                # Check VM journal datastore
-                vm_journal_ds = vm['Journal'].get('DatastoreIdentifier')
-                new_ds = check_vpg_datastore(vm_journal_ds, peer_datastores)
-                if new_ds:
-                    vm['Journal']['DatastoreIdentifier'] = new_ds
-                
-                # Check VM scratch datastore
-                vm_scratch_ds = vm['Scratch'].get('DatastoreIdentifier')
-                new_ds = check_vpg_datastore(vm_scratch_ds, peer_datastores)
-                if new_ds:
-                    vm['Scratch']['DatastoreIdentifier'] = new_ds
-
-                # Check VM network settings
-                for nic in vm.get('Nics', []):
-                    # Check failover network
-                    failover_net = nic['Failover']['Hypervisor'].get('NetworkIdentifier')
-                    new_net = check_vpg_network(failover_net, peer_networks)
-                    if new_net:
-                        nic['Failover']['Hypervisor']['NetworkIdentifier'] = new_net
-                    
-                    # Check failover test network
-                    failover_test_net = nic['FailoverTest']['Hypervisor'].get('NetworkIdentifier')
-                    new_net = check_vpg_network(failover_test_net, peer_networks)
-                    if new_net:
-                        nic['FailoverTest']['Hypervisor']['NetworkIdentifier'] = new_net
+        # Get peer site resources, the four calls are independent and run concurrently
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            datastores_future = executor.submit(client.virtualization_sites.get_virtualization_site_datastores, site_identifier=peer_site_identifier)
+            hosts_future = executor.submit(client.virtualization_sites.get_virtualization_site_hosts, site_identifier=peer_site_identifier)
+            folders_future = executor.submit(client.virtualization_sites.get_virtualization_site_folders, site_identifier=peer_site_identifier)
+            networks_future = executor.submit(client.virtualization_sites.get_virtualization_site_networks, site_identifier=peer_site_identifier)
+            peer_datastores = datastores_future.result()
+            peer_hosts = hosts_future.result()
+            peer_folders = folders_future.result()
+            peer_networks = networks_future.result()
+        logging.info(f"Peer site resources: {len(peer_datastores)} datastores, {len(peer_hosts)} hosts, "
+                     f"{len(peer_folders)} folders, {len(peer_networks)} networks")
+        # The full listings are only serialized when debug logging is enabled
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug(f"Peer Datastores: {json.dumps(peer_datastores, indent=4)}")
+            logging.debug(f"Peer Hosts: {json.dumps(peer_hosts, indent=4)}")
+            logging.debug(f"Peer Folders: {json.dumps(peer_folders, indent=4)}")
+            logging.debug(f"Peer Networks: {json.dumps(peer_networks, indent=4)}")
+
+        # Identifier sets of the peer site resources, for constant time checks of every VPG and VM setting
+        peer_datastore_ids = {ds['DatastoreIdentifier'] for ds in peer_datastores}
+        peer_host_ids = {host['HostIdentifier'] for host in peer_hosts}
+        peer_folder_ids = {folder['FolderIdentifier'] for folder in peer_folders}
+        peer_network_ids = {net['NetworkIdentifier'] for net in peer_networks}
+
+        # Find the missing peer resources first, then resolve each one once for all settings referencing it
+        missing = collect_missing_resources(export_settings['ExportedVpgSettingsApi'], {
+            'datastore': peer_datastore_ids,
+            'host': peer_host_ids,
+            'folder': peer_folder_ids,
+            'network': peer_network_ids
+        })
+        for kind, references in missing.items():
+            if references:
+                reference_count = sum(len(settings_keys) for settings_keys in references.values())
+                logging.warning(f"{reference_count} reference(s) to {len(references)} {kind}(s) missing from the peer site")
+        checks = {
+            'datastore': (check_vpg_datastore, peer_datastores, peer_datastore_ids),
+            'host': (check_vpg_host, peer_hosts, peer_host_ids),
+            'folder': (check_vpg_folder, peer_folders, peer_folder_ids),
+            'network': (check_vpg_network, peer_networks, peer_network_ids)
+        }
+        # Replacements chosen for this export by a previous run are reused without asking again
+        decisions_file_name = f"{selected_export['TimeStamp']}-decisions.json"
+        decisions = load_decisions(decisions_file_name)
+        for kind, references in missing.items():
+            check, resources, resource_ids = checks[kind]
+            if not resources:
+                logging.warning(f"No {kind}s found in peer site, leaving {len(references)} {kind} reference(s) unchanged")
+                continue
+            kind_decisions = decisions.setdefault(kind, {})
+            for resource_id, settings_keys in references.items():
+                new_id = kind_decisions.get(resource_id)
+                if new_id in resource_ids:
+                    logging.info(f"Replacing {kind} {resource_id} with {new_id} chosen in a previous run")
+                else:
+                    new_id = check(resource_id, resources, resource_ids)
+                    if new_id:
+                        kind_decisions[resource_id] = new_id
+                        save_decisions(decisions, decisions_file_name)
+                if new_id:
+                    for settings, key in settings_keys:
+                        settings[key] = new_id
         
         # Save updated settings
         updated_file_name = f"{selected_export['TimeStamp']}-updated-exported-vpg-settings.json"
-        with open(updated_file_name, 'w') as f:
-            json.dump(export_settings, f, indent=2)
+        save_exported_vpgs(export_settings['ExportedVpgSettingsApi'], updated_file_name)
         logging.info(f"\nUpdated settings saved to: {updated_file_name}")
 
         # ask users if they want to import the settings back
@@ -458,26 +601,28 @@ def main():
         print("\nImport Result:")
         
         # Display validation failures
-        if import_result.get('ValidationFailedResults'):
-            print("\nValidation Failed:")
-            for failure in import_result['ValidationFailedResults']:
-                print(f"- VPG: {failure['VpgName']}")
-                for error in failure['ErrorMessages']:
-                    print(f"  Error: {error}")
+        failures = import_result.get('ValidationFailedResults')
+        if failures:
+            sys.stdout.write("\nValidation Failed:\n" + "".join(
+                f"- VPG: {failure['VpgName']}\n" + "".join(f"  Error: {error}\n" for error in failure['ErrorMessages'])
+                for failure in failures
+            ))
         
         # Display import failures
-        if import_result.get('ImportFailedResults'):
-            print("\nImport Failed:")
-            for failure in import_result['ImportFailedResults']:
-                print(f"- VPG: {failure['VpgName']}")
-                print(f"  Error: {failure['ErrorMessage']}")
+        failures = import_result.get('ImportFailedResults')
+        if failures:
+            sys.stdout.write("\nImport Failed:\n" + "".join(
+                f"- VPG: {failure['VpgName']}\n  Error: {failure['ErrorMessage']}\n"
+                for failure in failures
+            ))
         
         # Display successful imports
-        if import_result.get('ImportTaskIdentifiers'):
-            print("\nSuccessfully Initiated Imports:")
-            for task in import_result['ImportTaskIdentifiers']:
-                print(f"- VPG: {task['VpgName']}")
-                print(f"  Task ID: {task['TaskIdentifier']}")
+        tasks = import_result.get('ImportTaskIdentifiers')
+        if tasks:
+            sys.stdout.write("\nSuccessfully Initiated Imports:\n" + "".join(
+                f"- VPG: {task['VpgName']}\n  Task ID: {task['TaskIdentifier']}\n"
+                for task in tasks
+            ))
         
         #pause
         input("\nLook at the VPGs and verify whether the manual changes are reverted back to the original settings. Press Enter to exit")
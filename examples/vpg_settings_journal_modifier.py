@@ -9,6 +9,27 @@
 # scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
 # The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
 
+"""
+VPG Journal Settings Modifier Example Script
+
+Sets the journal history of all VPGs to a number of days, or reviews and changes it per VPG.
+
+Mode (one of them is required):
+    --journal_days: Set the journal history of all VPGs to this many days
+    --interactive: Review and change the journal history of each VPG
+
+Running without a mode used to start the interactive review, it now exits with a usage
+error and --interactive has to be given explicitly.
+
+Example Usage:
+    python examples/vpg_settings_journal_modifier.py \
+        --zvm_address "192.168.111.20" \
+        --client_id "zerto-api" \
+        --client_secret "your-secret-here" \
+        --journal_days 3 \
+        --ignore_ssl
+"""
+
 # Configure logging BEFORE any imports
 import logging
 logging.basicConfig(
@@ -20,9 +41,17 @@ import urllib3
 import json
 import sys
 import os
-
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from zvml import ZVMLClient
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import NamedTuple, Optional
+
+try:
+    from zvml import ZVMLClient
+    from zvml.http_cache import create_cached_session
+except ImportError:
+    # Not installed, run from a checkout of the repository
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from zvml import ZVMLClient
+    from zvml.http_cache import create_cached_session
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
@@ -31,54 +60,122 @@ def setup_client(args):
         zvm_address=args.zvm_address,
         client_id=args.client_id,
         client_secret=args.client_secret,
-        verify_certificate=not args.ignore_ssl
+        verify_certificate=not args.ignore_ssl,
+        # Every worker keeps its own connection to the ZVM
+        pool_maxsize=max(args.pool_size, args.max_workers),
+        session=create_cached_session(args.zvm_address, ['/v1/vpgs']) if args.cache else None
     )
 
 def print_journal_settings(vpg_name, vpg_basic):
     print(f"\nVPG: {vpg_name}")
     print("  JournalHistoryInHours:", vpg_basic.get('JournalHistoryInHours'))
 
+class VpgHeader(NamedTuple):
+    """The fields of a listed VPG used by this script, kept instead of the full VPG dict."""
+    name: str
+    identifier: str
+    # Configured journal history in hours reported by list_vpgs, None if absent
+    journal_hours: Optional[float]
+
+def vpg_header(vpg):
+    """Return the VpgHeader of a VPG returned by list_vpgs."""
+    minutes = (vpg.get('HistoryStatus') or {}).get('ConfiguredHistoryInMinutes')
+    return VpgHeader(vpg['VpgName'], vpg['VpgIdentifier'], None if minutes is None else minutes / 60)
+
+def discard_vpg_settings(client, vpg_settings_id):
+    """Delete an uncommitted settings object, a failure is only logged as the VPG itself is unchanged."""
+    try:
+        client.vpgs.delete_vpg_settings(vpg_settings_id)
+    except Exception as e:
+        logging.warning(f"Failed to discard VPGSettings {vpg_settings_id}: {e}")
+
+def apply_journal_history(client, vpg, total_hours):
+    """Set the journal history of a VPG to total_hours and commit it, returns the previous value.
+
+    Nothing is committed when the VPG is already at total_hours, its settings object is discarded instead.
+    """
+    vpg_settings_id = client.vpgs.create_vpg_settings(vpg_identifier=vpg.identifier)
+    # Only the Basic section is read and written back, not the full settings object
+    vpg_basic = client.vpgs.get_vpg_settings_basic(vpg_settings_id)
+    previous_hours = vpg_basic.get('JournalHistoryInHours')
+    if previous_hours == total_hours:
+        discard_vpg_settings(client, vpg_settings_id)
+        return previous_hours
+    vpg_basic['JournalHistoryInHours'] = total_hours
+    client.vpgs.update_vpg_settings_basic(vpg_settings_id, vpg_basic)
+    client.vpgs.commit_vpg(vpg_settings_id, vpg.name, sync=False)
+    return previous_hours
+
 def main():
     parser = argparse.ArgumentParser(description="Adjust VPG journal settings interactively or via CLI options")
     parser.add_argument("--zvm_address", required=True, help="ZVM address")
     parser.add_argument('--client_id', required=True, help='Keycloak client ID')
     parser.add_argument('--client_secret', required=True, help='Keycloak client secret')
     parser.add_argument("--ignore_ssl", action="store_true", help="Ignore SSL certificate verification")
-    parser.add_argument("--journal_days", type=int, help="Set journal history (days) for all VPGs (non-interactive)")
+    # No mode is assumed, the interactive review that used to run without arguments needs --interactive
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument("--journal_days", type=int, help="Set journal history (days) for all VPGs (non-interactive)")
+    mode.add_argument("--interactive", action="store_true", help="Review and change the journal history of each VPG interactively")
     parser.add_argument("--journal_hours", type=int, default=0, help="Set additional journal history (hours) for all VPGs (non-interactive)")
+    parser.add_argument("--cache", action="store_true",
+                        help="Cache VPG list responses on disk and reuse them while the ZVM reports them unchanged (requires requests-cache)")
+    parser.add_argument("--pool_size", type=int, default=32, help="Maximum number of pooled connections to the ZVM")
+    parser.add_argument("--max_workers", type=int, default=16, help="Number of VPGs updated concurrently in non-interactive mode")
     args = parser.parse_args()
 
     client = setup_client(args)
-    vpgs = client.vpgs.list_vpgs()
-    if not vpgs:
-        print("No VPGs found.")
-        sys.exit(0)
-    if isinstance(vpgs, dict):  # If only one VPG, wrap in list
-        vpgs = [vpgs]
-
-    use_cli_journal = args.journal_days is not None
-
-    for vpg in vpgs:
-        vpg_name = vpg['VpgName']
-        vpg_identifier = vpg['VpgIdentifier']
-        print(f"\nProcessing VPG: {vpg_name}")
-
-        # Create VPG settings (get current settings object)
-        vpg_settings_id = client.vpgs.create_vpg_settings(vpg_identifier=vpg_identifier)
-        vpg_settings = client.vpgs.get_vpg_settings_by_id(vpg_settings_id)
-
-        vpg_basic = vpg_settings.get('Basic', {})
-
-        # Present current settings
-        print_journal_settings(vpg_name, vpg_basic)
-
-        if use_cli_journal:
+    try:
+        vpgs = client.vpgs.list_vpgs()
+        if not vpgs:
+            print("No VPGs found.")
+            sys.exit(0)
+        if isinstance(vpgs, dict):  # If only one VPG, wrap in list
+            vpgs = [vpgs]
+        vpgs = [vpg_header(vpg) for vpg in vpgs]
+
+        if args.journal_days is not None:
+            # No user interaction, so the VPGs are updated concurrently
             total_hours = args.journal_days * 24 + args.journal_hours
-            print(f"  Applying journal history: {args.journal_days} days + {args.journal_hours} hours = {total_hours} hours")
-        else:
+            print(f"Applying journal history: {args.journal_days} days + {args.journal_hours} hours = {total_hours} hours")
+            # The VPG listing already reports the configured history, VPGs already at the
+            # target do not need a settings object to be created, read and committed
+            unchanged = [vpg.name for vpg in vpgs if vpg.journal_hours == total_hours]
+            if unchanged:
+                print(f"Already at {total_hours} hours, skipping: {', '.join(unchanged)}")
+                vpgs = [vpg for vpg in vpgs if vpg.journal_hours != total_hours]
+            failed = False
+            with ThreadPoolExecutor(max_workers=max(1, args.max_workers)) as executor:
+                futures = {executor.submit(apply_journal_history, client, vpg, total_hours): vpg.name for vpg in vpgs}
+                for future in as_completed(futures):
+                    vpg_name = futures[future]
+                    print(f"\nVPG: {vpg_name}")
+                    try:
+                        previous_hours = future.result()
+                    except Exception as e:
+                        print(f"  Failed to apply journal history: {e}")
+                        failed = True
+                        continue
+                    if previous_hours == total_hours:
+                        print(f"  JournalHistoryInHours already {total_hours}, nothing to commit.")
+                        continue
+                    print(f"  JournalHistoryInHours: {previous_hours} -> {total_hours}")
+                    print("  Changes committed.")
+            sys.exit(1 if failed else 0)
+
+        for vpg_name, vpg_identifier, _ in vpgs:
+            print(f"\nProcessing VPG: {vpg_name}", flush=True)
+
+            # Create VPG settings (get current settings object)
+            vpg_settings_id = client.vpgs.create_vpg_settings(vpg_identifier=vpg_identifier)
+            vpg_basic = client.vpgs.get_vpg_settings_basic(vpg_settings_id)
+
+            # Present current settings
+            print_journal_settings(vpg_name, vpg_basic)
+
             # Ask user if they want to change
             change = input("Do you want to change the journal history for this VPG? (y/n): ")
             if change.lower() != 'y':
+                discard_vpg_settings(client, vpg_settings_id)
                 continue
 
             # Prompt for new values (always store in hours)
@@ -91,26 +188,28 @@ def main():
                 except ValueError:
                     print("  Please enter valid integers.")
 
-        # Adjust VPG-level journal history
-        vpg_basic['JournalHistoryInHours'] = total_hours
+            if vpg_basic.get('JournalHistoryInHours') == total_hours:
+                print("  Journal history unchanged, nothing to commit.")
+                discard_vpg_settings(client, vpg_settings_id)
+                continue
+
+            # Adjust VPG-level journal history
+            vpg_basic['JournalHistoryInHours'] = total_hours
 
-        # Present new settings
-        print("\nNew settings to be applied:")
-        print_journal_settings(vpg_name, vpg_basic)
+            # Present new settings
+            print("\nNew settings to be applied:")
+            print_journal_settings(vpg_name, vpg_basic)
 
-        if use_cli_journal:
-            # No confirmation, just apply
-            client.vpgs.update_vpg_settings(vpg_settings_id, vpg_settings)
-            client.vpgs.commit_vpg(vpg_settings_id, vpg_name, sync=False)
-            print("  Changes committed.")
-        else:
             confirm = input("Commit these changes? (y/n): ")
             if confirm.lower() == 'y':
-                client.vpgs.update_vpg_settings(vpg_settings_id, vpg_settings)
+                client.vpgs.update_vpg_settings_basic(vpg_settings_id, vpg_basic)
                 client.vpgs.commit_vpg(vpg_settings_id, vpg_name, sync=False)
                 print("  Changes committed.")
             else:
+                discard_vpg_settings(client, vpg_settings_id)
                 print("  Changes not committed.")
+    finally:
+        client.close()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -39,6 +39,9 @@ Required Arguments:
     --client_secret: Keycloak client secret
     --ignore_ssl: Ignore SSL certificate verification (optional)
     --zorg_id: Optional specific ZORG ID to query
+    --pool_size: Maximum number of pooled connections to the ZVM (optional, default 32)
+    --verbose: Log debug messages, including the full ZORG list (optional)
+    --cache: Cache ZORG responses and reuse them while the ZVM answers 304 Not Modified (optional, requires requests-cache)
 
 Example Usage:
     python examples/zorgs_example.py \
@@ -54,7 +57,7 @@ Script Flow:
 3. If specific ZORG ID provided:
    - Retrieves detailed information for that ZORG
 4. Otherwise:
-   - Gets details of first available ZORG
+   - Gets details of every ZORG, fetching them concurrently
 5. Outputs detailed ZORG information
 
 Note: This script demonstrates basic ZORG management capabilities and can be used
@@ -68,16 +71,37 @@ logging.basicConfig(
 )
 import sys
 import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 import argparse
 import urllib3
 import json
-from zvml import ZVMLClient
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from zvml import ZVMLClient
+    from zvml.http_cache import create_cached_session
+except ImportError:
+    # Not installed, run from a checkout of the repository
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from zvml import ZVMLClient
+    from zvml.http_cache import create_cached_session
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Maximum number of ZORG detail requests made concurrently
+MAX_WORKERS = 16
 
 # Disable SSL warnings
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+def dumps_indented(data):
+    """Serialize data as JSON indented by two spaces, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(data, indent=2)
+
 def main():
     parser = argparse.ArgumentParser(description="Zerto Organizations (ZORG) Example")
     parser.add_argument("--zvm_address", required=True, help="ZVM address")
@@ -85,7 +109,13 @@ def main():
     parser.add_argument('--client_secret', required=True, help='Keycloak client secret')
     parser.add_argument("--ignore_ssl", action="store_true", help="Ignore SSL certificate verification")
     parser.add_argument("--zorg_id", help="Optional: Specific ZORG ID to query")
+    parser.add_argument("--verbose", action="store_true", help="Log debug messages, including the full ZORG list")
+    parser.add_argument("--cache", action="store_true",
+                        help="Cache ZORG responses on disk and reuse them while the ZVM reports them unchanged (requires requests-cache)")
+    parser.add_argument("--pool_size", type=int, default=32, help="Maximum number of pooled connections to the ZVM")
     args = parser.parse_args()
+    if args.verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
 
     try:
         # Connect to ZVM
@@ -94,40 +124,50 @@ def main():
             zvm_address=args.zvm_address,
             client_id=args.client_id,
             client_secret=args.client_secret,
-            verify_certificate=not args.ignore_ssl
+            verify_certificate=not args.ignore_ssl,
+            pool_maxsize=max(args.pool_size, MAX_WORKERS),
+            session=create_cached_session(args.zvm_address, ['/v1/zorgs']) if args.cache else None
         )
 
-        # Test 1: Get all ZORGs
-        logging.info("\n=== Testing get_zorgs (all) ===")
-        try:
-            zorgs = client.zorgs.get_zorgs()
-            logging.info("All ZORGs:")
-            logging.info(json.dumps(zorgs, indent=2))
-        except Exception as e:
-            logging.error(f"Error getting all ZORGs: {e}")
-
-        # Test 2: Get specific ZORG if ID provided
-        if args.zorg_id:
-            logging.info(f"\n=== Testing get_zorgs with ID: {args.zorg_id} ===")
+        # The list and the specific ZORG are independent requests, so they are made concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            zorgs_future = executor.submit(client.zorgs.get_zorgs)
+            zorg_future = executor.submit(client.zorgs.get_zorgs, args.zorg_id) if args.zorg_id else None
+
+            # Test 1: Get all ZORGs
+            logging.info("\n=== Testing get_zorgs (all) ===")
+            zorgs = None
             try:
-                zorg_details = client.zorgs.get_zorgs(args.zorg_id)
-                logging.info("ZORG details:")
-                logging.info(json.dumps(zorg_details, indent=2))
+                zorgs = zorgs_future.result()
+                logging.info(f"Fetched {len(zorgs)} ZORGs")
+                # The full list is only serialized when it is going to be logged
+                if logging.getLogger().isEnabledFor(logging.DEBUG):
+                    logging.debug(f"All ZORGs:\n{dumps_indented(zorgs)}")
             except Exception as e:
-                logging.error(f"Error getting ZORG {args.zorg_id}: {e}")
-        
-        # Test 3: Get first ZORG details if any exist
-        elif zorgs and len(zorgs) > 0:
-            first_zorg = zorgs[0]
-            zorg_identifier = first_zorg.get('ZorgIdentifier')
-            if zorg_identifier:
-                logging.info(f"\n=== Testing get_zorgs with first found ID: {zorg_identifier} ===")
+                logging.error(f"Error getting all ZORGs: {e}")
+
+            # Test 2: Get specific ZORG if ID provided
+            if zorg_future is not None:
+                logging.info(f"\n=== Testing get_zorgs with ID: {args.zorg_id} ===")
                 try:
-                    zorg_details = client.zorgs.get_zorgs(zorg_identifier)
-                    logging.info("First ZORG details:")
-                    logging.info(json.dumps(zorg_details, indent=2))
+                    zorg_details = zorg_future.result()
+                    logging.info(f"ZORG details:\n{dumps_indented(zorg_details)}")
                 except Exception as e:
-                    logging.error(f"Error getting ZORG {zorg_identifier}: {e}")
+                    logging.error(f"Error getting ZORG {args.zorg_id}: {e}")
+        
+        # Test 3: Get the details of every ZORG, fetched concurrently
+        if not args.zorg_id and zorgs:
+            zorg_identifiers = [zorg['ZorgIdentifier'] for zorg in zorgs if zorg.get('ZorgIdentifier')]
+            with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, max(1, len(zorg_identifiers)))) as executor:
+                futures = [(zorg_identifier, executor.submit(client.zorgs.get_zorgs, zorg_identifier))
+                           for zorg_identifier in zorg_identifiers]
+                for zorg_identifier, future in futures:
+                    logging.info(f"\n=== Testing get_zorgs with ID: {zorg_identifier} ===")
+                    try:
+                        zorg_details = future.result()
+                        logging.info(f"ZORG details:\n{dumps_indented(zorg_details)}")
+                    except Exception as e:
+                        logging.error(f"Error getting ZORG {zorg_identifier}: {e}")
 
     except Exception as e:
         logging.error(f"Error occurred: {e}")
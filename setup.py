@@ -8,5 +8,9 @@ setup(
         "requests>=2.31.0",
         "urllib3>=2.1.0"
     ],
+    extras_require={
+        # Faster JSON parsing and serialization, and streamed reading of exported VPG settings
+        "speedups": ["orjson", "ijson", "requests-cache>=1.0,<2"]
+    },
     python_requires=">=3.6",
 ) 
\ No newline at end of file
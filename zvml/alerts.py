@@ -80,7 +80,7 @@ class Alerts:
 
         try:
             logging.info("Fetching alerts...")
-            response = requests.get(alerts_uri, headers=headers, params=params, verify=self.client.verify_certificate)
+            response = self.client.session.get(alerts_uri, headers=headers, params=params, verify=self.client.verify_certificate)
             response.raise_for_status()
             alerts = response.json()
 
@@ -124,7 +124,7 @@ class Alerts:
 
         try:
             logging.info(f"Attempting to dismiss alert with ID: {alert_identifier}")
-            response = requests.post(dismiss_uri, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.post(dismiss_uri, headers=headers, verify=self.client.verify_certificate)
             response.raise_for_status()
 
             if response.status_code == 200:
@@ -168,7 +168,7 @@ class Alerts:
 
         try:
             logging.info(f"Attempting to undismiss alert with ID: {alert_identifier}")
-            response = requests.post(undismiss_uri, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.post(undismiss_uri, headers=headers, verify=self.client.verify_certificate)
             response.raise_for_status()
 
             if response.status_code == 200:
@@ -211,7 +211,7 @@ class Alerts:
 
         try:
             logging.info("Fetching available alert levels...")
-            response = requests.get(alert_levels_uri, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.get(alert_levels_uri, headers=headers, verify=self.client.verify_certificate)
             response.raise_for_status()
             alert_levels = response.json()
 
@@ -254,7 +254,7 @@ class Alerts:
 
         try:
             logging.info("Fetching available alert entities...")
-            response = requests.get(alert_entities_uri, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.get(alert_entities_uri, headers=headers, verify=self.client.verify_certificate)
             response.raise_for_status()
             alert_entities = response.json()
 
@@ -297,7 +297,7 @@ class Alerts:
 
         try:
             logging.info("Fetching available alert help identifiers...")
-            response = requests.get(help_identifiers_uri, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.get(help_identifiers_uri, headers=headers, verify=self.client.verify_certificate)
             response.raise_for_status()
             help_identifiers = response.json()
 
@@ -12,6 +12,10 @@
 import requests
 import logging
 import ssl
+import threading
+import time
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Import all necessary classes
 from .tasks import Tasks
@@ -40,14 +44,47 @@ from .tweaks import Tweaks
 # Disable SSL warnings for self-signed certificates
 context = ssl._create_unverified_context()
 
+# Default connection pool sizes of the shared HTTP session, large enough for concurrent callers
+POOL_CONNECTIONS = 16
+POOL_MAXSIZE = 32
+# Seconds to wait for a new connection to the ZVM, responses themselves are not time limited
+CONNECT_TIMEOUT = 30
+# Seconds before its expiry at which the Keycloak token is renewed on next use, at most half its lifetime
+TOKEN_REFRESH_MARGIN = 30
+
+class _PooledAdapter(HTTPAdapter):
+    """HTTPAdapter applying CONNECT_TIMEOUT to requests made without an explicit timeout."""
+    def send(self, request, timeout=None, **kwargs):
+        if timeout is None:
+            timeout = (CONNECT_TIMEOUT, None)
+        return super().send(request, timeout=timeout, **kwargs)
+
+class _UnverifiedTLSAdapter(_PooledAdapter):
+    """HTTPAdapter sharing one unverified SSL context across all pooled connections.
+
+    Without it urllib3 builds a new SSL context and loads the system CA store for every
+    new connection made with verify=False.
+    """
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['ssl_context'] = context
+        return super().init_poolmanager(*args, **kwargs)
+
 class ZVMLClient:
-    def __init__(self, zvm_address, client_id, client_secret, verify_certificate=True):
+    def __init__(self, zvm_address, client_id, client_secret, verify_certificate=True,
+                 pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, session=None):
         self.zvm_address = zvm_address
         self.client_id = client_id
         self.client_secret = client_secret
         self.verify_certificate = verify_certificate
-        self.token = None
+        # Keep pool_maxsize at least as large as the number of threads calling the client
+        # concurrently, extra connections are otherwise discarded instead of being reused
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self._token = None
+        self._token_refresh_at = None
+        self._token_lock = threading.Lock()
         self.token_expiry = None
+        self.session = self.__create_session(session)
         self.__get_keycloak_token()
         self.tasks = Tasks(self)
         self.vpgs = VPGs(self)
@@ -61,7 +98,7 @@ class ZVMLClient:
         self.recoveryscripts = RecoveryScripts(self)
         self.zorgs = Zorgs(self)
         self.encryptiondetection = EncryptionDetection(self)
-        self.localsite = LocalSite(self.zvm_address, self.token)
+        self.localsite = LocalSite(self.zvm_address, self.token, self.session)
         self.datastores = Datastores(self)
         self.vras = VRA(self)
         self.recovery_reports = RecoveryReports(self)
@@ -72,6 +109,66 @@ class ZVMLClient:
         self.volumes = Volumes(self)
         self.tweaks = Tweaks(self)
 
+    @property
+    def token(self):
+        """The Keycloak access token, renewed when it is about to expire."""
+        token, refresh_at = self._token, self._token_refresh_at
+        if refresh_at is not None and time.monotonic() >= refresh_at:
+            logging.info("Keycloak token is about to expire, renewing it")
+            self.__renew_token(token)
+        return self._token
+
+    @token.setter
+    def token(self, value):
+        self._token = value
+
+    def __renew_token(self, stale_token):
+        """Fetch a new token unless another thread already replaced stale_token."""
+        with self._token_lock:
+            if self._token == stale_token:
+                self.__get_keycloak_token()
+                # LocalSite keeps its own copy of the authorization header, it does not exist yet
+                # while __init__ reads the token to create it
+                localsite = getattr(self, 'localsite', None)
+                if localsite is not None:
+                    localsite.token = self._token
+                    localsite.headers['Authorization'] = f"Bearer {self._token}"
+
+    def __retry_unauthorized(self, response, **kwargs):
+        """Response hook renewing the token and resending a request rejected with 401 once."""
+        request = response.request
+        if response.status_code != 401 or getattr(request, 'token_retried', False) or '/auth/realms/' in request.url:
+            return response
+        rejected_token = request.headers.get('Authorization', '')[len('Bearer '):]
+        logging.info("Request was rejected as unauthorized, renewing the Keycloak token and retrying it")
+        self.__renew_token(rejected_token)
+        retry = request.copy()
+        retry.headers['Authorization'] = f"Bearer {self._token}"
+        retry.token_retried = True
+        response.close()
+        return self.session.send(retry, **kwargs)
+
+    def close(self):
+        """Close the pooled connections of the shared HTTP session."""
+        self.session.close()
+
+    def __create_session(self, session=None):
+        """Set up the HTTP session shared by all API calls, so connections and TLS sessions are reused.
+
+        A requests.Session subclass, such as a requests-cache CachedSession, may be given to be used
+        instead of a new requests.Session.
+        """
+        if session is None:
+            session = requests.Session()
+        # Idempotent requests are retried on transient gateway errors, the final response is
+        # still returned so callers keep reporting errors through raise_for_status()
+        retries = Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504], raise_on_status=False)
+        adapter_class = _PooledAdapter if self.verify_certificate else _UnverifiedTLSAdapter
+        adapter = adapter_class(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize, max_retries=retries)
+        session.mount('https://', adapter)
+        session.hooks['response'].append(self.__retry_unauthorized)
+        return session
+
     def __get_keycloak_token(self):
         logging.debug(f'__get_keycloak_token(zvm_address={self.zvm_address})')
         keycloak_uri = f"https://{self.zvm_address}/auth/realms/zerto/protocol/openid-connect/token"
@@ -85,18 +182,23 @@ class ZVMLClient:
 
         try:
             logging.info("Connecting to Keycloak to get token...")
-            response = requests.post(keycloak_uri, headers=headers, data=body, verify=self.verify_certificate)
+            response = self.session.post(keycloak_uri, headers=headers, data=body, verify=self.verify_certificate)
             response.raise_for_status()
             token_data = response.json()
-            self.token = token_data.get('access_token')
+            self._token = token_data.get('access_token')
             self.token_expiry = token_data.get('expires_in')  # Store expiration time
+            # Short-lived tokens would otherwise be renewed on every use
+            self._token_refresh_at = (
+                time.monotonic() + self.token_expiry - min(TOKEN_REFRESH_MARGIN, self.token_expiry / 2)
+                if self.token_expiry else None
+            )
             logging.info(f"Successfully retrieved token.")
             logging.info(f"Token expiration details:")
             logging.info(f"- Expires in: {self.token_expiry} seconds")
             logging.info(f"- Requested expiration: {body['expires_in']} seconds")
             if self.token_expiry != body['expires_in']:
                 logging.warning(f"Server provided different expiration time than requested!")
-            return self.token
+            return self._token
         except requests.exceptions.RequestException as e:
             logging.error(f"Error retrieving token: {e}")
             raise 
\ No newline at end of file
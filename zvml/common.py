@@ -9,8 +9,29 @@
 # scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
 # The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
 
+import json
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def response_json(response):
+    """Parse the JSON body of a response, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+def json_body(payload):
+    """Serialize a request payload to UTF-8 JSON bytes, with orjson when it is installed.
+
+    Passed as data= with a Content-Type of application/json in place of json=payload.
+    """
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False, allow_nan=False).encode('utf-8')
+
 class ZertoTaskTypes(Enum):
     CreateProtectionGroup = 0
     RemoveProtectionGroup = 1
@@ -30,7 +30,7 @@ class Datastores:
         }
         
         try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.get(url, headers=headers, verify=self.client.verify_certificate)
             response.raise_for_status()
             if datastore_identifier:
                 logging.info(f"Datastores.list_datastores: Successfully retrieved datastore information for identifier: {datastore_identifier}.")
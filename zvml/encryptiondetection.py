@@ -26,7 +26,7 @@ class EncryptionDetection:
         }
         logging.info(f"EncryptionDetection.get_encryption_detections(zvm_address={self.client.zvm_address})")
         try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.get(url, headers=headers, verify=self.client.verify_certificate)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -49,7 +49,7 @@ class EncryptionDetection:
         }
         logging.info(f"EncryptionDetection.get_encryption_detection(zvm_address={self.client.zvm_address}, detection_identifier={detection_identifier})")
         try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.get(url, headers=headers, verify=self.client.verify_certificate)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -72,7 +72,7 @@ class EncryptionDetection:
         }
         logging.info(f"EncryptionDetection.get_encryption_detection_types(zvm_address={self.client.zvm_address})")
         try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.get(url, headers=headers, verify=self.client.verify_certificate)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -104,7 +104,7 @@ class EncryptionDetection:
         }
         
         try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.get(url, headers=headers, verify=self.client.verify_certificate)
             response.raise_for_status()
             result = response.json()
             logging.info(f"Successfully retrieved {len(result)} suspected encrypted volumes")
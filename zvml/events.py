@@ -79,7 +79,7 @@ class Events:
 
         try:
             logging.info("Fetching events with specified filters...")
-            response = requests.get(events_uri, headers=headers, params=params, verify=self.client.verify_certificate)
+            response = self.client.session.get(events_uri, headers=headers, params=params, verify=self.client.verify_certificate)
             response.raise_for_status()
             events = response.json()
 
@@ -120,7 +120,7 @@ class Events:
 
         try:
             logging.info("Fetching event types...")
-            response = requests.get(event_types_uri, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.get(event_types_uri, headers=headers, verify=self.client.verify_certificate)
             response.raise_for_status()
             event_types = response.json()
 
@@ -161,7 +161,7 @@ class Events:
 
         try:
             logging.info("Fetching event entities...")
-            response = requests.get(event_entities_uri, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.get(event_entities_uri, headers=headers, verify=self.client.verify_certificate)
             response.raise_for_status()
             event_entities = response.json()
 
@@ -201,7 +201,7 @@ class Events:
         }
 
         try:
-            response = requests.get(event_categories_uri, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.get(event_categories_uri, headers=headers, verify=self.client.verify_certificate)
             response.raise_for_status()
             event_categories = response.json()
 
@@ -221,7 +221,7 @@ class Events:
             'Authorization': f'Bearer {self.client.token}'
         }
         try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.get(url, headers=headers, verify=self.client.verify_certificate)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
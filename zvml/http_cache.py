@@ -0,0 +1,55 @@
+# Legal Disclaimer
+# This script is an example script and is not supported under any Zerto support program or service. 
+# The author and Zerto further disclaim all implied warranties including, without limitation, 
+# any implied warranties of merchantability or of fitness for a particular purpose.
+# In no event shall Zerto, its authors or anyone else involved in the creation, 
+# production or delivery of the scripts be liable for any damages whatsoever (including, 
+# without limitation, damages for loss of business profits, business interruption, loss of business 
+# information, or other pecuniary loss) arising out of the use of or the inability to use the sample 
+# scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
+# The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
+
+import logging
+import os
+import re
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+# Location of the SQLite database of cached responses
+CACHE_NAME = os.path.join(os.path.expanduser('~'), '.cache', 'zvml', 'http-cache')
+
+def create_cached_session(zvm_address, paths):
+    """
+    Create a session caching the GET responses of the given API paths, to pass to ZVMLClient(session=...).
+
+    Only the listed paths are stored, optionally followed by one more path segment, such as
+    /v1/zorgs and /v1/zorgs/{id}. A stored response is revalidated with its ETag or Last-Modified
+    on every use and its body is only reused when the ZVM answers 304 Not Modified.
+
+    Args:
+        zvm_address: The ZVM address the client connects to
+        paths: API paths whose responses are cached, e.g. ['/v1/vpgs']
+
+    Returns:
+        requests_cache.CachedSession: The session, or None if requests-cache is not installed
+    """
+    if requests_cache is None:
+        logging.warning("requests-cache is not installed, responses are not cached")
+        return None
+    os.makedirs(os.path.dirname(CACHE_NAME), exist_ok=True)
+    urls_expire_after = {
+        re.compile(f"^https?://{re.escape(zvm_address)}{re.escape(path)}(/[^/?]+)?(\\?|$)"): requests_cache.NEVER_EXPIRE
+        for path in paths
+    }
+    # Everything else, such as the per-run settings objects, is never stored
+    urls_expire_after['*'] = requests_cache.DO_NOT_CACHE
+    return requests_cache.CachedSession(
+        CACHE_NAME,
+        backend='sqlite',
+        allowable_methods=('GET',),
+        always_revalidate=True,
+        urls_expire_after=urls_expire_after
+    )
@@ -33,7 +33,7 @@ class License:
 
         try:
             logging.info("Fetching license information...")
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.get(url, headers=headers, verify=self.client.verify_certificate)
 
             # Handle 204 No Content
             if response.status_code == 204:
@@ -87,7 +87,7 @@ class License:
 
         try:
             logging.info("Adding or updating license...")
-            response = requests.put(url, json=payload, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.put(url, json=payload, headers=headers, verify=self.client.verify_certificate)
 
             # Handle empty response with 200 status code
             if response.status_code == 200 and not response.content:
@@ -135,7 +135,7 @@ class License:
 
         try:
             logging.info("Deleting license...")
-            response = requests.delete(url, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.delete(url, headers=headers, verify=self.client.verify_certificate)
 
             # Raise an error for non-successful HTTP status codes
             response.raise_for_status()
@@ -13,9 +13,11 @@ import requests
 import logging
 
 class LocalSite:
-    def __init__(self, zvm_address, token):
+    def __init__(self, zvm_address, token, session=None):
         self.zvm_address = zvm_address
         self.token = token
+        # Reuse the client's HTTP session when one is provided
+        self.session = session if session is not None else requests
         self.headers = {
             "Authorization": f"Bearer {self.token}",
             "Accept": "application/json",
@@ -26,7 +28,7 @@ class LocalSite:
         logging.info("LocalSite.get_local_site: Fetching local site information...")
         url = f"https://{self.zvm_address}/v1/localsite"
         try:
-            response = requests.get(url, headers=self.headers, verify=False)
+            response = self.session.get(url, headers=self.headers, verify=False)
             response.raise_for_status()
             logging.info("LocalSite.get_local_site: Successfully retrieved local site information.")
             return response.json()
@@ -50,7 +52,7 @@ class LocalSite:
         logging.info("LocalSite.get_pairing_statuses: Fetching pairing statuses...")
         url = f"https://{self.zvm_address}/v1/localsite/pairingstatuses"
         try:
-            response = requests.get(url, headers=self.headers, verify=False)
+            response = self.session.get(url, headers=self.headers, verify=False)
             response.raise_for_status()
             logging.info("LocalSite.get_pairing_statuses: Successfully retrieved pairing statuses.")
             return response.json()
@@ -74,7 +76,7 @@ class LocalSite:
         logging.info("LocalSite.send_usage: Sending local site billing usage...")
         url = f"https://{self.zvm_address}/v1/localsite/billing/sendUsage"
         try:
-            response = requests.post(url, headers=self.headers, verify=False)
+            response = self.session.post(url, headers=self.headers, verify=False)
             response.raise_for_status()
             if response.content.strip():
                 logging.info("LocalSite.send_usage: Successfully sent billing usage data.")
@@ -102,7 +104,7 @@ class LocalSite:
         logging.info("LocalSite.get_login_banner: Fetching login banner settings...")
         url = f"https://{self.zvm_address}/v1/localsite/settings/loginBanner"
         try:
-            response = requests.get(url, headers=self.headers, verify=False)
+            response = self.session.get(url, headers=self.headers, verify=False)
             response.raise_for_status()
             logging.info("LocalSite.get_login_banner: Successfully retrieved login banner settings.")
             return response.json()
@@ -130,7 +132,7 @@ class LocalSite:
             "loginBanner": banner_text
         }
         try:
-            response = requests.put(url, headers=self.headers, json=payload, verify=False)
+            response = self.session.put(url, headers=self.headers, json=payload, verify=False)
             response.raise_for_status()
             logging.info("LocalSite.set_login_banner: Successfully set login banner settings.")
             return response
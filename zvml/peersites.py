@@ -44,7 +44,7 @@ class PeerSites:
         }
         
         try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.get(url, headers=headers, verify=self.client.verify_certificate)
             response.raise_for_status()
             if site_identifier:
                 logging.info(f"PeerSites.get_peer_sites: Successfully retrieved peer site information for site identifier: {site_identifier}.")
@@ -94,7 +94,7 @@ class PeerSites:
         
         logging.info(f"PeerSites.pair_site: Pairing with site {hostname} at port {port}...")
         try:
-            response = requests.post(url, headers=headers, json=pairing_data, verify=self.client.verify_certificate)
+            response = self.client.session.post(url, headers=headers, json=pairing_data, verify=self.client.verify_certificate)
             response.raise_for_status()
             
             if not sync:
@@ -132,7 +132,7 @@ class PeerSites:
         
         logging.info(f"PeerSites.delete_peer_site: Deleting peer site {site_identifier}...")
         try:
-            response = requests.delete(url, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.delete(url, headers=headers, verify=self.client.verify_certificate)
             response.raise_for_status()
 
             if not sync:
@@ -179,7 +179,7 @@ class PeerSites:
         
         logging.info("PeerSites.get_pairing_statuses: Fetching pairing statuses...")
         try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.get(url, headers=headers, verify=self.client.verify_certificate)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -213,7 +213,7 @@ class PeerSites:
         
         logging.info("PeerSites.generate_token: Generating pairing token...")
         try:
-            response = requests.post(url, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.post(url, headers=headers, verify=self.client.verify_certificate)
             response.raise_for_status()
             return response.json() if response.content else None
         except requests.exceptions.RequestException as e:
@@ -240,7 +240,7 @@ class PeerSites:
             'Authorization': f'Bearer {self.client.token}'
         }
         try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.get(url, headers=headers, verify=self.client.verify_certificate)
             response.raise_for_status()
             logging.info("PeerSites.get_peer_site_types: Successfully retrieved peer site types information.")
             return response.json()
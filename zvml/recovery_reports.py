@@ -69,7 +69,7 @@ class RecoveryReports:
         }
 
         try:
-            response = requests.get(base_url, headers=headers, params=params, verify=self.client.verify_certificate)
+            response = self.client.session.get(base_url, headers=headers, params=params, verify=self.client.verify_certificate)
 
             if response.status_code == 200:
                 # logging.info(f"Successfully retrieved recovery reports = {json.dumps(response.json(), indent=4)}")
@@ -176,7 +176,7 @@ class RecoveryReports:
             params['recoveryVcdOrg'] = recovery_vcd_org
 
         try:
-            response = requests.get(uri, headers=headers, params=params, verify=self.client.verify_certificate)
+            response = self.client.session.get(uri, headers=headers, params=params, verify=self.client.verify_certificate)
             response.raise_for_status()
             reports = response.json()
 
@@ -23,7 +23,7 @@ class RecoveryScripts:
             'Authorization': f'Bearer {self.client.token}'
         }
         try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.get(url, headers=headers, verify=self.client.verify_certificate)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -48,7 +48,7 @@ class RecoveryScripts:
             'Authorization': f'Bearer {self.client.token}'
         }
         try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.get(url, headers=headers, verify=self.client.verify_certificate)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -73,7 +73,7 @@ class RecoveryScripts:
             'Authorization': f'Bearer {self.client.token}'
         }
         try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.get(url, headers=headers, verify=self.client.verify_certificate)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -23,7 +23,7 @@ class Repositories:
             'Authorization': f'Bearer {self.client.token}'
         }
         try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.get(url, headers=headers, verify=self.client.verify_certificate)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -49,7 +49,7 @@ class Repositories:
             'Authorization': f'Bearer {self.client.token}'
         }
         try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.get(url, headers=headers, verify=self.client.verify_certificate)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -75,7 +75,7 @@ class Repositories:
             'Authorization': f'Bearer {self.client.token}'
         }
         try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.get(url, headers=headers, verify=self.client.verify_certificate)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
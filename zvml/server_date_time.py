@@ -59,7 +59,7 @@ class ServerDateTime:
         }
 
         try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.get(url, headers=headers, verify=self.client.verify_certificate)
             response.raise_for_status()
             server_time = response.json()
             logging.info(f"Successfully retrieved server date and time in {format.name} format")
@@ -48,7 +48,7 @@ class ServiceProfiles:
             logging.info(f"Filtering service profiles for site: {site_identifier}")
 
         try:
-            response = requests.get(url, headers=headers, params=params, verify=self.client.verify_certificate)
+            response = self.client.session.get(url, headers=headers, params=params, verify=self.client.verify_certificate)
             response.raise_for_status()
             profiles = response.json()
             logging.info(f"Successfully retrieved {len(profiles)} service profiles")
@@ -34,7 +34,7 @@ class Tasks:
 
             url = f"https://{self.client.zvm_address}/v1/tasks/{task_identifier}"
             try:
-                response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
+                response = self.client.session.get(url, headers=headers, verify=self.client.verify_certificate)
                 response.raise_for_status()
                 task_info = response.json()
 
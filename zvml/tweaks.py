@@ -43,7 +43,7 @@ class Tweaks:
         }
         
         try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.get(url, headers=headers, verify=self.client.verify_certificate)
             response.raise_for_status()
             result = response.json()
             
@@ -101,7 +101,7 @@ class Tweaks:
         logging.info(f"Tweaks.set_tweak url: {url}")
         
         try:
-            response = requests.post(url, headers=headers, json=payload, verify=self.client.verify_certificate)
+            response = self.client.session.post(url, headers=headers, json=payload, verify=self.client.verify_certificate)
             
             # Log the raw response for debugging
             logging.debug(f"Raw response status: {response.status_code}")
@@ -154,7 +154,7 @@ class Tweaks:
         logging.info(f"Tweaks.delete_tweak url: {url}")
         
         try:
-            response = requests.delete(url, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.delete(url, headers=headers, verify=self.client.verify_certificate)
             
             # Log the raw response for debugging
             logging.debug(f"Raw response status: {response.status_code}")
@@ -89,7 +89,7 @@ class VMs:
         
         logging.info(f"{log_msg} with params: {params}")
         try:
-            response = requests.get(url, headers=headers, params=params, verify=self.client.verify_certificate)
+            response = self.client.session.get(url, headers=headers, params=params, verify=self.client.verify_certificate)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -174,7 +174,7 @@ class VMs:
         logging.info(f"VMs.restore_vm: Restoring VM {vm_identifier} from checkpoint {checkpoint_identifier}")
         logging.info(f"VMs.restore_vm: Data: {json.dumps(data, indent=2)}")
         try:
-            response = requests.post(url, headers=headers, json=data, verify=self.client.verify_certificate)
+            response = self.client.session.post(url, headers=headers, json=data, verify=self.client.verify_certificate)
             response.raise_for_status()
             return response.json() if response.content else None
         except requests.exceptions.RequestException as e:
@@ -210,7 +210,7 @@ class VMs:
         
         logging.info(f"VMs.restore_vm_commit: Committing restored VM {vm_identifier}")
         try:
-            response = requests.post(url, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.post(url, headers=headers, verify=self.client.verify_certificate)
             response.raise_for_status()
             return response.json() if response.content else None
         except requests.exceptions.RequestException as e:
@@ -246,7 +246,7 @@ class VMs:
         
         logging.info(f"VMs.restore_vm_rollback: Rolling back restored VM {vm_identifier}")
         try:
-            response = requests.post(url, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.post(url, headers=headers, verify=self.client.verify_certificate)
             response.raise_for_status()
             return response.json() if response.content else None
         except requests.exceptions.RequestException as e:
@@ -293,7 +293,7 @@ class VMs:
         
         logging.info(f"VMs.list_vm_points_in_time: Fetching points in time for VM {vm_identifier}")
         try:
-            response = requests.get(url, headers=headers, params=params, verify=self.client.verify_certificate)
+            response = self.client.session.get(url, headers=headers, params=params, verify=self.client.verify_certificate)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -333,7 +333,7 @@ class VMs:
         
         logging.info(f"VMs.list_vm_points_in_time_stats: Fetching points in time stats for VM {vm_identifier}")
         try:
-            response = requests.get(url, headers=headers, params=params, verify=self.client.verify_certificate)
+            response = self.client.session.get(url, headers=headers, params=params, verify=self.client.verify_certificate)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -43,7 +43,7 @@ class Volumes:
         
         logging.info("Volumes.list_volumes: Fetching volumes information")
         try:
-            response = requests.get(url, headers=headers, params=params, verify=self.client.verify_certificate)
+            response = self.client.session.get(url, headers=headers, params=params, verify=self.client.verify_certificate)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
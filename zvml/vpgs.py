@@ -14,9 +14,14 @@ import logging
 import time
 import json
 from .tasks import Tasks
-from .common import ZertoVPGStatus, ZertoVPGSubstatus, ZertoProtectedSiteType, ZertoRecoverySiteType, ZertoVPGPriority
+from .common import json_body, response_json, ZertoVPGStatus, ZertoVPGSubstatus, ZertoProtectedSiteType, ZertoRecoverySiteType, ZertoVPGPriority
 from .localsite import LocalSite
-from typing import Optional, Union, Dict, List
+from typing import Optional, Union, Dict, List, Iterable, Iterator
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 class VPGs:
     def __init__(self, client):
@@ -98,7 +103,7 @@ class VPGs:
             logging.info(f"  {key}: {value}")
 
         try:
-            response = requests.get(
+            response = self.client.session.get(
                 url, 
                 headers=headers, 
                 params=params, 
@@ -106,7 +111,7 @@ class VPGs:
                 timeout=30
             )
             response.raise_for_status()
-            result = response.json()
+            result = response_json(response)
             
             # If we're querying by name, return the first matching VPG
             if vpg_name and isinstance(result, list):
@@ -145,7 +150,7 @@ class VPGs:
         }
 
         try:
-            response = requests.post(commit_uri, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.post(commit_uri, headers=headers, verify=self.client.verify_certificate)
             response.raise_for_status()
             task_id = response.json()
             logging.info(f"VPGSettings {vpg_settings_id} successfully committed, {vpg_name} is created, task_id={task_id}")
@@ -207,7 +212,7 @@ class VPGs:
     def add_vm_to_vpg_by_name(self, vpg_name, vm_name):
         logging.info(f'VPGs.add_vm_to_vpg_by_name(zvm_address={self.client.zvm_address}, vpg_name={vpg_name}, vm_name={vm_name})')
 
-        local_site = LocalSite(self.client.zvm_address, self.client.token)
+        local_site = LocalSite(self.client.zvm_address, self.client.token, self.client.session)
         local_site_identifier = local_site.get_local_site()['SiteIdentifier']
         vms = self.client.virtualization_sites.get_virtualization_site_vms(site_identifier=local_site_identifier)
         vm_dict = {vm.get('VmName'): vm for vm in vms}
@@ -244,7 +249,7 @@ class VPGs:
         }
 
         try:
-            response = requests.post(vms_uri, headers=headers, json=vm_list_payload, verify=self.client.verify_certificate)
+            response = self.client.session.post(vms_uri, headers=headers, json=vm_list_payload, verify=self.client.verify_certificate)
             response.raise_for_status()
             logging.info(f"Successfully added VMs to VPG {new_vpg_settings_id}.")
             self.commit_vpg(new_vpg_settings_id, vpg_name, sync=True, expected_status=ZertoVPGStatus.Initializing)
@@ -278,6 +283,63 @@ class VPGs:
             logging.error(f"Failed to add VM to VPG: {str(e)}")
             raise
 
+    def add_vms_to_vpg(self, vpg_name, vm_list_payload: Iterable[Dict]) -> Dict[str, str]:
+        """
+        Adds several VMs to a VPG with a single VPG settings edit and commit.
+
+        :param vpg_name: The name of the VPG to add the VMs to.
+        :param vm_list_payload: One VM payload per VM, each with at least a VmIdentifier. Each payload
+                                is sent before the next one is read, so an iterator may reuse one dict.
+        :return: Error messages by VM identifier for the VMs that could not be added.
+                 The VPG settings are only committed when all VMs were added.
+        """
+        logging.info(f'VPGs.add_vms_to_vpg(zvm_address={self.client.zvm_address}, vpg_name={vpg_name})')
+        vpg = self.list_vpgs(vpg_name=vpg_name)
+
+        if not vpg:
+            raise ValueError(f"VPG with name '{vpg_name}' not found.")
+
+        vpg_identifier = vpg['VpgIdentifier']
+        logging.info(f"Found VPG '{vpg_name}' with Identifier: {vpg_identifier}")
+
+        new_vpg_settings_id = self.create_vpg_settings(basic=None, journal=None, recovery=None, networks=None, vpg_identifier=vpg_identifier)
+        vms_uri = f"https://{self.client.zvm_address}/v1/vpgSettings/{new_vpg_settings_id}/vms"
+        headers = {
+            'Content-Type': 'application/json',
+            'Authorization': f'Bearer {self.client.token}'
+        }
+
+        failed_vms = {}
+        for vm_payload in vm_list_payload:
+            vm_identifier = vm_payload['VmIdentifier']
+            try:
+                response = self.client.session.post(vms_uri, headers=headers, json=vm_payload, verify=self.client.verify_certificate)
+                response.raise_for_status()
+                logging.info(f"Added VM {vm_identifier} to VPGSettings {new_vpg_settings_id}.")
+            except requests.exceptions.RequestException as e:
+                error_message = str(e)
+                if e.response is not None:
+                    try:
+                        error_message = e.response.json().get('Message', '') or error_message
+                    except ValueError:
+                        error_message = e.response.text or error_message
+                    # Keep only the actual error message after "Exception occurred in API:"
+                    if 'Exception occurred in API:' in error_message:
+                        error_message = error_message.split('Exception occurred in API:', 1)[1].strip().rstrip(';')
+                logging.error(f"Failed to add VM {vm_identifier} to VPG {vpg_name}: {error_message}")
+                failed_vms[vm_identifier] = error_message
+
+        if failed_vms:
+            # Discard the partial edit instead of committing a VPG with missing VMs
+            try:
+                self.delete_vpg_settings(new_vpg_settings_id)
+            except Exception as e:
+                logging.warning(f"Failed to discard VPGSettings {new_vpg_settings_id}: {e}")
+            return failed_vms
+
+        self.commit_vpg(new_vpg_settings_id, vpg_name, sync=True, expected_status=ZertoVPGStatus.Initializing)
+        return failed_vms
+
     def remove_vm_from_vpg(self, vpg_name, vm_identifier):
         logging.info(f'VPGs.remove_vm_from_vpg(zvm_address={self.client.zvm_address}, vpg_name={vpg_name}, vm_identifier={vm_identifier})')
         vpg = self.list_vpgs(vpg_name=vpg_name)
@@ -297,7 +359,7 @@ class VPGs:
         }
 
         try:
-            response = requests.delete(remove_vm_uri, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.delete(remove_vm_uri, headers=headers, verify=self.client.verify_certificate)
             response.raise_for_status()
             logging.info(f"VM {vm_identifier} successfully removed from VPG '{vpg_name}' (ID: {new_vpg_settings_id}).")
             self.commit_vpg(new_vpg_settings_id, vpg_name, sync=True, expected_status=ZertoVPGStatus.Initializing)
@@ -358,7 +420,7 @@ class VPGs:
 
         try:
             logging.info(f"Initiating failover test for VPG '{vpg_name}', payload={payload}")
-            response = requests.post(url, headers=headers, json=payload, verify=self.client.verify_certificate)
+            response = self.client.session.post(url, headers=headers, json=payload, verify=self.client.verify_certificate)
             response.raise_for_status()
             task_id = response.json()
 
@@ -413,7 +475,7 @@ class VPGs:
 
         try:
             logging.info(f"Stopping failover test for VPG '{vpg_name}'...")
-            response = requests.post(url, headers=headers, json=body, verify=self.client.verify_certificate)
+            response = self.client.session.post(url, headers=headers, json=body, verify=self.client.verify_certificate)
             response.raise_for_status()
             task_id = response.json()
 
@@ -463,7 +525,7 @@ class VPGs:
 
         try:
             logging.info(f"Rollback failover for VPG '{vpg_name}'...")
-            response = requests.post(url, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.post(url, headers=headers, verify=self.client.verify_certificate)
             response.raise_for_status()
             task_id = response.json()
 
@@ -527,7 +589,7 @@ class VPGs:
 
         try:
             # Step 3: Send DELETE request
-            response = requests.delete(delete_vpg_uri, headers=headers, json=payload, verify=self.client.verify_certificate)
+            response = self.client.session.delete(delete_vpg_uri, headers=headers, json=payload, verify=self.client.verify_certificate)
 
             response.raise_for_status()  # Ensure the request was successful
             logging.info(f"Successfully deleted VPG '{vpg_name}' (ID: {vpg_identifier}).")
@@ -557,7 +619,7 @@ class VPGs:
             'Authorization': f'Bearer {self.client.token}'
         }
         try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.get(url, headers=headers, verify=self.client.verify_certificate)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -571,7 +633,7 @@ class VPGs:
             'Authorization': f'Bearer {self.client.token}'
         }
         try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.get(url, headers=headers, verify=self.client.verify_certificate)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -585,9 +647,10 @@ class VPGs:
             'Authorization': f'Bearer {self.client.token}'
         }
         logging.info(f"VPGs.update_vpg_settings: Updating VPG settings for ID: {vpg_settings_id}")
-        logging.debug(f"VPGs.update_vpg_settings: Payload: {json.dumps(payload, indent=4)}")
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug(f"VPGs.update_vpg_settings: Payload: {json.dumps(payload, indent=4)}")
         try:
-            response = requests.put(url, json=payload, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.put(url, data=json_body(payload), headers=headers, verify=self.client.verify_certificate)
             response.raise_for_status()
             return response
         except requests.exceptions.RequestException as e:
@@ -602,16 +665,70 @@ class VPGs:
                 logging.error("HTTPError occurred with no response attached.")
             raise
 
-    def delete_vpg_settings(self, vpg_settings_id):
-        url = f"https://{self.client.zvm_address}/v1/vpgs/settings/{vpg_settings_id}"
+    def get_vpg_settings_basic(self, vpg_settings_id):
+        """
+        Get only the Basic section of a VPG settings object.
+
+        Args:
+            vpg_settings_id: The identifier of the VPG settings object
+
+        Returns:
+            dict: The Basic settings, such as Name and JournalHistoryInHours
+        """
+        url = f"https://{self.client.zvm_address}/v1/vpgSettings/{vpg_settings_id}/basic"
         headers = {
             'Content-Type': 'application/json',
             'Authorization': f'Bearer {self.client.token}'
         }
         try:
-            response = requests.delete(url, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.get(url, headers=headers, verify=self.client.verify_certificate)
             response.raise_for_status()
             return response.json()
+        except requests.exceptions.RequestException as e:
+            logging.error(f"Failed to get basic VPG settings by ID: {e}")
+            raise
+
+    def update_vpg_settings_basic(self, vpg_settings_id, basic):
+        """
+        Replace only the Basic section of a VPG settings object, leaving the other sections untouched.
+
+        Args:
+            vpg_settings_id: The identifier of the VPG settings object
+            basic: The complete Basic settings to store
+        """
+        url = f"https://{self.client.zvm_address}/v1/vpgSettings/{vpg_settings_id}/basic"
+        headers = {
+            'Content-Type': 'application/json',
+            'Authorization': f'Bearer {self.client.token}'
+        }
+        logging.info(f"VPGs.update_vpg_settings_basic: Updating basic VPG settings for ID: {vpg_settings_id}")
+        try:
+            response = self.client.session.put(url, data=json_body(basic), headers=headers, verify=self.client.verify_certificate)
+            response.raise_for_status()
+            return response
+        except requests.exceptions.RequestException as e:
+            if e.response is not None:
+                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
+                try:
+                    error_details = e.response.json()
+                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
+                except ValueError:
+                    logging.error(f"Response content: {e.response.text}")
+            else:
+                logging.error("HTTPError occurred with no response attached.")
+            raise
+
+    def delete_vpg_settings(self, vpg_settings_id):
+        url = f"https://{self.client.zvm_address}/v1/vpgSettings/{vpg_settings_id}"
+        headers = {
+            'Content-Type': 'application/json',
+            'Authorization': f'Bearer {self.client.token}'
+        }
+        try:
+            response = self.client.session.delete(url, headers=headers, verify=self.client.verify_certificate)
+            response.raise_for_status()
+            # The ZVM may answer a successful delete without a body
+            return response.json() if response.content else None
         except requests.exceptions.RequestException as e:
             if e.response is not None:
                 logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
@@ -648,7 +765,7 @@ class VPGs:
 
         logging.debug(f"VPGs.create_vpg_settings: Payload: {json.dumps(payload, indent=4)}")
         try:
-            response = requests.post(vpg_settings_uri, headers=headers, json=payload, verify=self.client.verify_certificate)
+            response = self.client.session.post(vpg_settings_uri, headers=headers, json=payload, verify=self.client.verify_certificate)
             response.raise_for_status()
             vpg_settings_id = response.json()
             logging.info(f"VPG Settings ID: {vpg_settings_id} created")
@@ -701,7 +818,7 @@ class VPGs:
             "endDate": endd_date
         }
         try:
-            response = requests.get(vpgs_uri, headers=headers, params=params, verify=self.client.verify_certificate)
+            response = self.client.session.get(vpgs_uri, headers=headers, params=params, verify=self.client.verify_certificate)
             response.raise_for_status()
             checkpoints = response.json()
 
@@ -778,7 +895,7 @@ class VPGs:
         logging.info(f"VPGs.create_checkpoint: Creating checkpoint '{checkpoint_name}' for VPG {vpg_identifier}")
 
         try:
-            response = requests.post(
+            response = self.client.session.post(
                 url,
                 headers=headers,
                 json=data,
@@ -838,7 +955,7 @@ class VPGs:
         logging.info(f"VPGs.export_vpg_settings: Exporting settings for VPGs: {vpg_names if vpg_names else 'ALL'}")
         
         try:
-            response = requests.post(url, headers=headers, json=payload, verify=self.client.verify_certificate)
+            response = self.client.session.post(url, headers=headers, json=payload, verify=self.client.verify_certificate)
             response.raise_for_status()
             result = response.json()
             logging.info(f"Successfully exported settings for {len(vpg_names) if vpg_names else 'ALL'} VPGs at {result.get('timeStamp')}")
@@ -881,7 +998,7 @@ class VPGs:
         logging.debug("Fetching list of exported VPG settings")
         
         try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.get(url, headers=headers, verify=self.client.verify_certificate)
             response.raise_for_status()
             result = response.json()
             logging.info(f"Found {len(result)} exported settings files")
@@ -931,7 +1048,7 @@ class VPGs:
             logging.debug(f"Filtering for VPGs: {vpg_names}")
         
         try:
-            response = requests.post(url, headers=headers, json=payload, verify=self.client.verify_certificate)
+            response = self.client.session.post(url, headers=headers, json=payload, verify=self.client.verify_certificate)
             response.raise_for_status()
             result = response.json()
             logging.debug(f"VPGs.read_exported_vpg_settings: result: {json.dumps(result, indent=4)}")
@@ -950,6 +1067,57 @@ class VPGs:
                 logging.error("HTTPError occurred with no response attached.")
             raise
 
+    def iter_exported_vpg_settings(self, timestamp: str, vpg_names: List[str] = None) -> Iterator[dict]:
+        """
+        Yield the exported settings of a given timestamp one VPG at a time.
+
+        When ijson is installed the response is parsed while it is being received, so only one
+        VPG is held in memory at a time. Otherwise the whole response is read with
+        read_exported_vpg_settings.
+
+        Args:
+            timestamp: The timestamp of the exported settings file (format: YYYY-MM-DDThh:mm:ss.SSSZ)
+            vpg_names: Optional list of VPG names to filter the exported settings
+
+        Yields:
+            dict: The settings of one VPG, as in ExportedVpgSettingsApi
+
+        Raises:
+            requests.exceptions.RequestException: If the API request fails
+        """
+        if ijson is None:
+            yield from self.read_exported_vpg_settings(timestamp, vpg_names).get('ExportedVpgSettingsApi') or []
+            return
+
+        url = f"https://{self.client.zvm_address}/v1/vpgSettings/exportedSettings/{timestamp}"
+        headers = {
+            'Content-Type': 'application/json',
+            'Authorization': f'Bearer {self.client.token}'
+        }
+
+        payload = {}
+        if vpg_names:
+            payload['vpgNames'] = vpg_names
+
+        logging.info(f"VPGs.iter_exported_vpg_settings: Streaming exported VPG settings for timestamp: {timestamp}")
+        try:
+            with self.client.session.post(url, headers=headers, json=payload, verify=self.client.verify_certificate, stream=True) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                yield from ijson.items(response.raw, 'ExportedVpgSettingsApi.item', use_float=True)
+
+        except requests.exceptions.RequestException as e:
+            if e.response is not None:
+                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
+                try:
+                    error_details = e.response.json()
+                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
+                except ValueError:
+                    logging.error(f"Response content: {e.response.text}")
+            else:
+                logging.error("HTTPError occurred with no response attached.")
+            raise
+
     def import_vpg_settings(self, settings: Dict) -> dict:
 
     
@@ -996,7 +1164,7 @@ class VPGs:
         logging.info(f"VPGs.import_vpg_settings: Importing settings for {len(settings['ExportedVpgSettingsApi'])} VPGs")
         
         try:
-            response = requests.post(url, headers=headers, json=payload, verify=self.client.verify_certificate)
+            response = self.client.session.post(url, headers=headers, data=json_body(payload), verify=self.client.verify_certificate)
             response.raise_for_status()
             result = response.json()
             logging.debug(f"VPGs.import_vpg_settings: result: {json.dumps(result, indent=4)}")
@@ -1057,7 +1225,7 @@ class VPGs:
         logging.info(f"VPGs.list_vpgs_from_exported_settings: Fetching VPGs from export {time_stamp}")
         
         try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.get(url, headers=headers, verify=self.client.verify_certificate)
             response.raise_for_status()
             result = response.json()
             logging.info(f"Successfully retrieved {len(result)} VPGs from export {time_stamp}")
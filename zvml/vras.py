@@ -27,7 +27,7 @@ class VRA:
             'Authorization': f'Bearer {self.client.token}'
         }
         try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.get(url, headers=headers, verify=self.client.verify_certificate)
             response.raise_for_status()
             result = response.json()
             logging.info(f"Successfully retrieved {len(result)} VRAs")
@@ -66,7 +66,7 @@ class VRA:
             'Authorization': f'Bearer {self.client.token}'
         }
         try:
-            response = requests.post(url, headers=headers, json=payload, verify=self.client.verify_certificate)
+            response = self.client.session.post(url, headers=headers, json=payload, verify=self.client.verify_certificate)
             response.raise_for_status()
             task_id = response.json()
             logging.info("Successfully initiated VRA creation")
@@ -108,7 +108,7 @@ class VRA:
             'Authorization': f'Bearer {self.client.token}'
         }
         try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.get(url, headers=headers, verify=self.client.verify_certificate)
             response.raise_for_status()
             result = response.json()
             logging.info(f"Successfully retrieved VRA information for identifier: {vra_identifier}")
@@ -147,7 +147,7 @@ class VRA:
             'Authorization': f'Bearer {self.client.token}'
         }
         try:
-            response = requests.delete(url, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.delete(url, headers=headers, verify=self.client.verify_certificate)
             response.raise_for_status()
             task_id = response.json()
             logging.info(f"Successfully initiated deletion of VRA with identifier: {vra_identifier}")
@@ -192,7 +192,7 @@ class VRA:
             'Authorization': f'Bearer {self.client.token}'
         }
         try:
-            response = requests.put(url, headers=headers, json=payload, verify=self.client.verify_certificate)
+            response = self.client.session.put(url, headers=headers, json=payload, verify=self.client.verify_certificate)
             response.raise_for_status()
             task_id = response.json()
             logging.info(f"Successfully initiated update for VRA with identifier: {vra_identifier}")
@@ -236,7 +236,7 @@ class VRA:
             'Authorization': f'Bearer {self.client.token}'
         }
         try:
-            response = requests.post(url, headers=headers, json=payload, verify=self.client.verify_certificate)
+            response = self.client.session.post(url, headers=headers, json=payload, verify=self.client.verify_certificate)
             response.raise_for_status()
             task_id = response.json()
             logging.info("Successfully initiated VRA cluster creation")
@@ -278,7 +278,7 @@ class VRA:
             'Authorization': f'Bearer {self.client.token}'
         }
         try:
-            response = requests.delete(url, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.delete(url, headers=headers, verify=self.client.verify_certificate)
             response.raise_for_status()
             result = response.json()
             logging.info(f"Successfully deleted VRA cluster with identifier: {cluster_identifier}")
@@ -318,7 +318,7 @@ class VRA:
             'Authorization': f'Bearer {self.client.token}'
         }
         try:
-            response = requests.put(url, headers=headers, json=payload, verify=self.client.verify_certificate)
+            response = self.client.session.put(url, headers=headers, json=payload, verify=self.client.verify_certificate)
             response.raise_for_status()
             result = response.json()
             logging.info(f"Successfully updated VRA cluster with identifier: {cluster_identifier}")
@@ -353,7 +353,7 @@ class VRA:
             'Authorization': f'Bearer {self.client.token}'
         }
         try:
-            response = requests.delete(url, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.delete(url, headers=headers, verify=self.client.verify_certificate)
             response.raise_for_status()
             result = response.json()
             logging.info("Successfully cleaned up VRAs")
@@ -391,7 +391,7 @@ class VRA:
             'Authorization': f'Bearer {self.client.token}'
         }
         try:
-            response = requests.post(url, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.post(url, headers=headers, verify=self.client.verify_certificate)
             response.raise_for_status()
             result = response.json()
             logging.info(f"Successfully initiated upgrade for VRA with identifier: {vra_identifier}")
@@ -429,7 +429,7 @@ class VRA:
             'Authorization': f'Bearer {self.client.token}'
         }
         try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.get(url, headers=headers, verify=self.client.verify_certificate)
             response.raise_for_status()
             result = response.json()
             logging.info(f"Successfully retrieved VRA cluster settings for identifier: {cluster_identifier}")
@@ -469,7 +469,7 @@ class VRA:
             'Authorization': f'Bearer {self.client.token}'
         }
         try:
-            response = requests.post(url, headers=headers, json=payload, verify=self.client.verify_certificate)
+            response = self.client.session.post(url, headers=headers, json=payload, verify=self.client.verify_certificate)
             response.raise_for_status()
             result = response.json()
             logging.info(f"Successfully created VRA cluster settings for identifier: {cluster_identifier}")
@@ -504,7 +504,7 @@ class VRA:
             'Authorization': f'Bearer {self.client.token}'
         }
         try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.get(url, headers=headers, verify=self.client.verify_certificate)
             response.raise_for_status()
             result = response.json()
             logging.info(f"Successfully retrieved VRA statuses")
@@ -539,7 +539,7 @@ class VRA:
             'Authorization': f'Bearer {self.client.token}'
         }
         try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.get(url, headers=headers, verify=self.client.verify_certificate)
             response.raise_for_status()
             result = response.json()
             logging.info("Successfully retrieved IP configuration types")
@@ -577,7 +577,7 @@ class VRA:
             'Authorization': f'Bearer {self.client.token}'
         }
         try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.get(url, headers=headers, verify=self.client.verify_certificate)
             response.raise_for_status()
             result = response.json()
             logging.info(f"Successfully retrieved potential recovery VRAs for identifier: {vra_identifier}")
@@ -617,7 +617,7 @@ class VRA:
             'Authorization': f'Bearer {self.client.token}'
         }
         try:
-            response = requests.post(url, headers=headers, json=payload, verify=self.client.verify_certificate)
+            response = self.client.session.post(url, headers=headers, json=payload, verify=self.client.verify_certificate)
             response.raise_for_status()
             result = response.json()
             logging.info(f"Successfully executed recovery VRA change for identifier: {vra_identifier}")
@@ -643,7 +643,7 @@ class VRA:
             'Authorization': f'Bearer {self.client.token}'
         }
         try:
-            response = requests.post(url, headers=headers, json=payload, verify=self.client.verify_certificate)
+            response = self.client.session.post(url, headers=headers, json=payload, verify=self.client.verify_certificate)
             response.raise_for_status()
             logging.info(f"VRA.validate_recovery_vra_change: Successfully validated recovery VRA change for identifier: {vra_identifier}.")
             return response.json()
@@ -659,7 +659,7 @@ class VRA:
             'Authorization': f'Bearer {self.client.token}'
         }
         try:
-            response = requests.post(url, headers=headers, json=payload, verify=self.client.verify_certificate)
+            response = self.client.session.post(url, headers=headers, json=payload, verify=self.client.verify_certificate)
             response.raise_for_status()
             logging.info(f"VRA.recommend_recovery_vra_change: Successfully recommended recovery VRA change for identifier: {vra_identifier}.")
             return response.json()
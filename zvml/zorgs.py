@@ -11,6 +11,7 @@
 
 import requests
 import logging
+from .common import response_json
 
 class Zorgs:
     def __init__(self, client):
@@ -40,9 +41,9 @@ class Zorgs:
         }
         
         try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
+            response = self.client.session.get(url, headers=headers, verify=self.client.verify_certificate)
             response.raise_for_status()
-            return response.json()
+            return response_json(response)
         except requests.exceptions.RequestException as e:
             if e.response is not None:
                 logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")